@@ -0,0 +1,190 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Compare per-item and page-at-a-time mapping of OCI summaries to models.
+
+``getattr`` is the original mapping (one property read per field and one
+validation per item), kept here as the reference.
+
+Example (from ``src/oci-vault-mcp-server``)::
+
+    python -m benchmarks.mapping --items 50000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+import oci
+from oracle.oci_vault_mcp_server.models import (
+    SecretMetadata,
+    SecretVersion,
+    _oci_to_dict,
+    map_secret_metadata,
+    map_secret_metadata_page,
+    map_secret_version,
+    map_secret_version_page,
+)
+
+_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def getattr_secret_metadata(sm) -> SecretMetadata:
+    return SecretMetadata(
+        id=getattr(sm, "id", None),
+        lifecycle_state=getattr(sm, "lifecycle_state", None),
+        vault_id=getattr(sm, "vault_id", None),
+        compartment_id=getattr(sm, "compartment_id", None),
+        name=getattr(sm, "secret_name", None) or getattr(sm, "name", None),
+        description=getattr(sm, "description", None),
+        secret_version_count=getattr(sm, "secret_version_count", None),
+        time_created=getattr(sm, "time_created", None),
+        time_of_current_version=getattr(sm, "time_of_current_version", None),
+        time_of_deletion=getattr(sm, "time_of_deletion", None),
+        rotation_config=_oci_to_dict(getattr(sm, "rotation_config", None)),
+        freeform_tags=getattr(sm, "freeform_tags", None),
+        defined_tags=getattr(sm, "defined_tags", None),
+    )
+
+
+def getattr_secret_version(sv) -> SecretVersion:
+    return SecretVersion(
+        version_number=getattr(sv, "version_number", None),
+        time_created=getattr(sv, "time_created", None),
+        time_of_deletion=getattr(sv, "time_of_deletion", None),
+        lifecycle_state=getattr(sv, "lifecycle_state", None),
+        version_stage=getattr(sv, "stages", None),
+    )
+
+
+def make_secret_summaries(count: int) -> list:
+    models = oci.vault.models
+    return [
+        models.SecretSummary(
+            id=f"ocid1.vaultsecret.oc1..{i:012d}",
+            secret_name=f"secret-{i:05d}",
+            vault_id="ocid1.vault.oc1..benchmark",
+            compartment_id="ocid1.compartment.oc1..benchmark",
+            key_id="ocid1.key.oc1..benchmark",
+            description=f"Benchmark secret {i}",
+            lifecycle_state="ACTIVE",
+            time_created=_EPOCH + timedelta(seconds=i),
+            freeform_tags={"team": f"team-{i % 10}"},
+            defined_tags={"ops": {"owner": "benchmark"}},
+            rotation_config=(
+                models.RotationConfig(
+                    rotation_interval="P30D", is_scheduled_rotation_enabled=True
+                )
+                if i % 4 == 0
+                else None
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def make_version_summaries(count: int) -> list:
+    return [
+        oci.vault.models.SecretVersionSummary(
+            secret_id="ocid1.vaultsecret.oc1..benchmark",
+            version_number=i + 1,
+            stages=["CURRENT", "LATEST"] if i == count - 1 else ["PREVIOUS"],
+            time_created=_EPOCH + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def measure(paths: dict[str, Callable[[list], list]], items: list, repeat: int) -> dict:
+    """
+    Best-of-``repeat`` time and the allocation peak of one run of each path.
+
+    Paths are run in turn within each round so drift in machine load affects
+    all of them alike.
+    """
+    best = dict.fromkeys(paths, float("inf"))
+    for _ in range(repeat):
+        for path, map_all in paths.items():
+            gc.collect()
+            start = time.perf_counter()
+            map_all(items)
+            best[path] = min(best[path], time.perf_counter() - start)
+    results = {}
+    for path, map_all in paths.items():
+        gc.collect()
+        tracemalloc.start()
+        map_all(items)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[path] = {
+            "seconds": best[path],
+            "items_per_second": len(items) / best[path],
+            "peak_mb": peak / (1024 * 1024),
+        }
+    return results
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    def paged(map_page):
+        def map_all(items):
+            size = args.page_size
+            for start in range(0, len(items), size):
+                end = start + size
+                map_page(items[start:end])
+
+        return map_all
+
+    cases = (
+        (
+            "secrets",
+            make_secret_summaries,
+            getattr_secret_metadata,
+            map_secret_metadata,
+            map_secret_metadata_page,
+        ),
+        (
+            "versions",
+            make_version_summaries,
+            getattr_secret_version,
+            map_secret_version,
+            map_secret_version_page,
+        ),
+    )
+    print(f"{'model':>8} {'path':>8} {'ms':>9} {'items/s':>11} {'peak MB':>8}")
+    for model, make, reference, map_item, map_page in cases:
+        items = make(args.items)
+        results = measure(
+            {
+                "getattr": paged(each(reference)),
+                "per-item": paged(each(map_item)),
+                "page": paged(map_page),
+            },
+            items,
+            args.repeat,
+        )
+        for path, result in results.items():
+            print(
+                f"{model:>8} {path:>8} {result['seconds'] * 1000:>9.1f} "
+                f"{result['items_per_second']:>11.0f} {result['peak_mb']:>8.1f}"
+            )
+        speedup = results["getattr"]["seconds"] / results["page"]["seconds"]
+        print(f"{model:>8} {'speedup':>8} {speedup:>8.2f}x")
+
+
+def each(map_item):
+    return lambda page: [map_item(item) for item in page]
+
+
+if __name__ == "__main__":
+    main()
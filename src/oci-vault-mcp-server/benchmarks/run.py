@@ -0,0 +1,317 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Benchmark the MCP tools against a local OCI Vault stand-in.
+
+Example (from ``src/oci-vault-mcp-server``)::
+
+    python -m benchmarks.run --scales 10,1000,50000 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from typing import Callable, Optional
+
+from benchmarks.stand_in import VaultStandIn
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+OPERATIONS = ("list", "search", "get", "create", "update")
+DEFAULT_SCALES = "10,1000,10000,50000"
+COMPARTMENT_ID = "ocid1.compartment.oc1..benchmark"
+
+
+def write_profile(directory: str) -> str:
+    """Write a throwaway OCI config, API key and session token; return the config."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    key_file = os.path.join(directory, "key.pem")
+    with open(key_file, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    token_file = os.path.join(directory, "token")
+    with open(token_file, "w") as f:
+        f.write("benchmark-session-token")
+    config_file = os.path.join(directory, "config")
+    with open(config_file, "w") as f:
+        f.write(
+            "[DEFAULT]\n"
+            "user=ocid1.user.oc1..benchmark\n"
+            "fingerprint=00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00\n"
+            "tenancy=ocid1.tenancy.oc1..benchmark\n"
+            "region=us-phoenix-1\n"
+            f"key_file={key_file}\n"
+            f"security_token_file={token_file}\n"
+        )
+    return config_file
+
+
+def percentile(samples: list[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of ``samples``."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = math.ceil(q / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+async def measure(
+    call: Callable[[int], tuple[str, dict]],
+    client,
+    iterations: int,
+    concurrency: int,
+    trace_memory: bool,
+) -> dict:
+    """Run ``iterations`` tool calls with at most ``concurrency`` in flight."""
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        nonlocal errors
+        name, arguments = call(i)
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await client.call_tool(name, arguments)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(iterations)))
+    elapsed = time.perf_counter() - start
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory_mb = peak / (1024 * 1024)
+    else:
+        memory_mb = peak_rss_mb()
+
+    return {
+        "calls": iterations,
+        "errors": errors,
+        "ops_per_second": iterations / elapsed if elapsed else None,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "memory_mb": memory_mb,
+    }
+
+
+def operation_calls(
+    scale: int, vault_id: str, secret_ids: list[str], rng: random.Random
+) -> dict[str, Callable[[int], tuple[str, dict]]]:
+    """Build the tool call for each benchmarked operation."""
+    location = {"vault_id": vault_id, "compartment_id": COMPARTMENT_ID}
+    return {
+        # A limit above the scale still returns every secret, but makes each
+        # call a distinct query, so concurrent listings are measured one by
+        # one rather than joined by single-flight
+        "list": lambda i: (
+            "list_secrets",
+            dict(location, bypass_cache=True, limit=scale + i + 1),
+        ),
+        "search": lambda i: (
+            "search_secrets",
+            dict(location, name=f"secret-{i % scale:05d}", match="substring"),
+        ),
+        "get": lambda i: (
+            "get_secret_metadata",
+            {"secret_id": rng.choice(secret_ids), "bypass_cache": True},
+        ),
+        "create": lambda i: (
+            "create_secret",
+            dict(
+                location,
+                name=f"bench-{uuid.uuid4().hex[:12]}",
+                secret_value=f"value-{i}",
+            ),
+        ),
+        "update": lambda i: (
+            "update_secret",
+            {"secret_id": rng.choice(secret_ids), "secret_value": f"rotated-{i}"},
+        ),
+    }
+
+
+async def run(args, stand_in: VaultStandIn) -> list[dict]:
+    # Imported here so the environment set up by main() is read at import
+    from fastmcp import Client
+    from oracle.oci_vault_mcp_server.server import mcp
+
+    rng = random.Random(args.seed)
+    results = []
+    async with Client(mcp) as client:
+        for scale in args.scales:
+            vault_id = f"ocid1.vault.oc1..benchmark{scale}"
+            secret_ids = stand_in.populate(
+                vault_id, COMPARTMENT_ID, scale, versions=args.versions
+            )
+            calls = operation_calls(scale, vault_id, secret_ids, rng)
+            for operation in args.operations:
+                iterations = (
+                    args.list_iterations if operation == "list" else args.iterations
+                )
+                for i in range(args.warmup):
+                    name, arguments = calls[operation](i)
+                    try:
+                        await client.call_tool(name, arguments)
+                    except Exception as e:
+                        print(f"warm-up {operation} failed: {e}", file=sys.stderr)
+                requests_before = stand_in.requests
+                result = await measure(
+                    calls[operation],
+                    client,
+                    iterations,
+                    args.concurrency,
+                    args.trace_memory,
+                )
+                requests = stand_in.requests - requests_before
+                result.update(
+                    scale=scale,
+                    operation=operation,
+                    requests_per_call=requests / iterations,
+                )
+                results.append(result)
+                print_row(result)
+    return results
+
+
+# (result key, header, width, format)
+COLUMNS = (
+    ("scale", "secrets", 7, "d"),
+    ("operation", "operation", 9, ""),
+    ("calls", "calls", 6, "d"),
+    ("errors", "errors", 6, "d"),
+    ("ops_per_second", "ops/s", 9, ".1f"),
+    ("p50_ms", "p50 ms", 9, ".2f"),
+    ("p99_ms", "p99 ms", 9, ".2f"),
+    ("requests_per_call", "req/call", 8, ".1f"),
+    ("memory_mb", "memory MB", 9, ".1f"),
+)
+
+
+def print_header():
+    print(" ".join(header.rjust(width) for _, header, width, _ in COLUMNS))
+
+
+def print_row(result: dict):
+    cells = []
+    for key, _, width, spec in COLUMNS:
+        value = result.get(key)
+        cells.append("-" if value is None else format(value, spec))
+    print(" ".join(c.rjust(w) for c, (_, _, w, _) in zip(cells, COLUMNS)), flush=True)
+
+
+def parse_args(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--scales",
+        default=DEFAULT_SCALES,
+        type=lambda v: [int(s) for s in v.split(",")],
+        help="Comma-separated numbers of secrets per vault",
+    )
+    parser.add_argument(
+        "--operations",
+        default=",".join(OPERATIONS),
+        type=lambda v: [s for s in v.split(",") if s],
+        help=f"Comma-separated subset of {','.join(OPERATIONS)}",
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--list-iterations",
+        type=int,
+        default=5,
+        help="Iterations of full listings, which are much slower than other calls",
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--versions", type=int, default=1, help="Versions per secret")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Stand-in latency per request"
+    )
+    parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with 429 TooManyRequests",
+    )
+    parser.add_argument(
+        "--max-page-size", type=int, default=1000, help="Largest page served"
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=None, help="Sets OCI_VAULT_PAGE_SIZE"
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Report the tracemalloc peak per operation instead of the peak RSS",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="Also write results as JSON")
+    args = parser.parse_args(argv)
+    unknown = set(args.operations) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"unknown operations: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv: Optional[list[str]] = None):
+    args = parse_args(argv)
+    stand_in = VaultStandIn(
+        latency=args.latency_ms / 1000,
+        throttle_rate=args.throttle_rate,
+        max_page_size=args.max_page_size,
+        seed=args.seed,
+    )
+    endpoint = stand_in.start()
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ.update(
+            OCI_CONFIG_FILE=write_profile(directory),
+            OCI_CONFIG_PROFILE="DEFAULT",
+            OCI_VAULT_SERVICE_ENDPOINT=endpoint,
+            OCI_SECRETS_SERVICE_ENDPOINT=endpoint,
+        )
+        if args.page_size:
+            os.environ["OCI_VAULT_PAGE_SIZE"] = str(args.page_size)
+        print_header()
+        try:
+            results = asyncio.run(run(args, stand_in))
+        finally:
+            stand_in.stop()
+
+    print(f"stand-in requests: {stand_in.requests}, throttled: {stand_in.throttled}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"arguments": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import base64
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+VAULTS_BASE_PATH = "/20180608"
+SECRETS_BASE_PATH = "/20190301"
+IDENTITY_BASE_PATH = "/20160918"
+
+_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+class _NotFound(Exception):
+    pass
+
+
+class VaultStandIn:
+    """
+    In-memory emulation of the OCI Vaults and Secrets APIs.
+
+    Serves the subset of the ``20180608`` (Vaults), ``20190301`` (Secrets) and
+    ``20160918`` (Identity compartments) REST APIs used by the server, in the
+    wire format the OCI SDK expects, so
+    the real tools and SDK clients can be exercised without a tenancy. Every
+    request is delayed by ``latency`` seconds and answered with a 429 with
+    probability ``throttle_rate``. List operations return at most
+    ``max_page_size`` items per page, and ``default_page_size`` items when no
+    ``limit`` is sent.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        throttle_rate: float = 0.0,
+        max_page_size: int = 1000,
+        default_page_size: int = 10,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.max_page_size = max_page_size
+        self.default_page_size = default_page_size
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._secrets: dict[str, dict] = {}
+        self._versions: dict[str, list[dict]] = {}
+        # (vault OCID, compartment OCID) -> secret OCIDs in creation order
+        self._listings: dict[tuple[str, str], list[str]] = {}
+        # compartment OCID -> parent compartment OCID
+        self._compartments: dict[str, str] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.requests = 0
+        self.throttled = 0
+
+    # region Data
+
+    def populate(
+        self,
+        vault_id: str,
+        compartment_id: str,
+        count: int,
+        versions: int = 1,
+        name_prefix: str = "secret",
+    ) -> list[str]:
+        """Add ``count`` secrets to a vault and return their OCIDs."""
+        ids = []
+        for i in range(count):
+            secret = self._add_secret(
+                vault_id,
+                compartment_id,
+                f"{name_prefix}-{i:05d}",
+                base64.b64encode(f"value-{i}".encode()).decode(),
+                description=f"Benchmark secret {i}",
+                freeform_tags={"team": f"team-{i % 10}"},
+            )
+            for _ in range(versions - 1):
+                self._add_version(secret, secret["_content"])
+            ids.append(secret["id"])
+        return ids
+
+    def add_compartment(self, parent_id: str, name: str) -> str:
+        """Add a compartment below ``parent_id`` and return its OCID."""
+        compartment_id = f"ocid1.compartment.oc1..{uuid.uuid4().hex}"
+        with self._lock:
+            self._compartments[compartment_id] = parent_id
+        return compartment_id
+
+    def _add_secret(
+        self,
+        vault_id: str,
+        compartment_id: str,
+        name: str,
+        content: str,
+        description: Optional[str] = None,
+        freeform_tags: Optional[dict] = None,
+        defined_tags: Optional[dict] = None,
+    ) -> dict:
+        with self._lock:
+            listing = self._listings.setdefault((vault_id, compartment_id), [])
+            secret_id = f"ocid1.vaultsecret.oc1..{uuid.uuid4().hex}"
+            created = _EPOCH + timedelta(seconds=len(self._secrets))
+            secret = {
+                "id": secret_id,
+                "secretName": name,
+                "vaultId": vault_id,
+                "compartmentId": compartment_id,
+                "keyId": f"{vault_id}.key",
+                "description": description,
+                "freeformTags": freeform_tags or {},
+                "definedTags": defined_tags or {},
+                "lifecycleState": "ACTIVE",
+                "timeCreated": _timestamp(created),
+                "currentVersionNumber": 0,
+                "_content": content,
+            }
+            self._secrets[secret_id] = secret
+            self._versions[secret_id] = []
+            listing.append(secret_id)
+        self._add_version(secret, content)
+        return secret
+
+    def _add_version(self, secret: dict, content: str):
+        with self._lock:
+            versions = self._versions[secret["id"]]
+            for version in versions:
+                if "CURRENT" in version["stages"]:
+                    version["stages"] = ["PREVIOUS"]
+            number = len(versions) + 1
+            versions.append(
+                {
+                    "secretId": secret["id"],
+                    "versionNumber": number,
+                    "stages": ["CURRENT", "LATEST"],
+                    "contentType": "BASE64",
+                    "timeCreated": _timestamp(datetime.now(timezone.utc)),
+                    "_content": content,
+                }
+            )
+            secret["currentVersionNumber"] = number
+            secret["_content"] = content
+
+    def _secret(self, secret_id: str) -> dict:
+        secret = self._secrets.get(secret_id)
+        if secret is None:
+            raise _NotFound(secret_id)
+        return secret
+
+    @staticmethod
+    def _public(item: dict) -> dict:
+        return {k: v for k, v in item.items() if not k.startswith("_")}
+
+    # endregion
+
+    # region Operations
+
+    def _page(self, items: list, query: dict) -> tuple[list, Optional[str]]:
+        limit = int(query.get("limit", self.default_page_size))
+        limit = max(1, min(limit, self.max_page_size))
+        start = int(query.get("page", 0))
+        end = start + limit
+        return items[start:end], str(end) if end < len(items) else None
+
+    def list_secrets(self, query: dict):
+        vault_id, compartment_id = query.get("vaultId"), query["compartmentId"]
+        with self._lock:
+            secrets = [
+                self._secrets[i]
+                for (vault, compartment), ids in self._listings.items()
+                if compartment == compartment_id and vault_id in (None, vault)
+                for i in ids
+            ]
+        if "name" in query:
+            secrets = [s for s in secrets if s["secretName"] == query["name"]]
+        if "lifecycleState" in query:
+            state = query["lifecycleState"]
+            secrets = [s for s in secrets if s["lifecycleState"] == state]
+        if query.get("sortBy") == "NAME":
+            secrets = sorted(secrets, key=lambda s: s["secretName"])
+        if query.get("sortOrder") == "DESC":
+            secrets = list(reversed(secrets))
+        page, next_page = self._page(secrets, query)
+        return [self._public(s) for s in page], next_page
+
+    def list_compartments(self, query: dict):
+        parents = {query["compartmentId"]}
+        subtree = query.get("compartmentIdInSubtree") == "true"
+        with self._lock:
+            tree = dict(self._compartments)
+        children = []
+        while parents:
+            level = [c for c, parent in tree.items() if parent in parents]
+            children.extend(level)
+            parents = set(level) if subtree else set()
+        page, next_page = self._page(children, query)
+        return [
+            {
+                "id": c,
+                "compartmentId": tree[c],
+                "name": c[-8:],
+                "description": "Benchmark compartment",
+                "lifecycleState": "ACTIVE",
+                "timeCreated": _timestamp(_EPOCH),
+            }
+            for c in page
+        ], next_page
+
+    def get_secret(self, secret_id: str):
+        return self._public(self._secret(secret_id)), None
+
+    def list_secret_versions(self, secret_id: str, query: dict):
+        self._secret(secret_id)
+        with self._lock:
+            versions = list(reversed(self._versions[secret_id]))
+        page, next_page = self._page(versions, query)
+        return [self._public(v) for v in page], next_page
+
+    def get_secret_version(self, secret_id: str, version_number: str):
+        self._secret(secret_id)
+        with self._lock:
+            for version in self._versions[secret_id]:
+                if str(version["versionNumber"]) == version_number:
+                    return self._public(version), None
+        raise _NotFound(f"{secret_id}/version/{version_number}")
+
+    def create_secret(self, body: dict):
+        secret = self._add_secret(
+            body["vaultId"],
+            body["compartmentId"],
+            body["secretName"],
+            body["secretContent"]["content"],
+            description=body.get("description"),
+            freeform_tags=body.get("freeformTags"),
+            defined_tags=body.get("definedTags"),
+        )
+        return self._public(secret), None
+
+    def update_secret(self, secret_id: str, body: dict):
+        secret = self._secret(secret_id)
+        for field in ("description", "freeformTags", "definedTags"):
+            if field in body:
+                secret[field] = body[field]
+        if "secretContent" in body:
+            self._add_version(secret, body["secretContent"]["content"])
+        return self._public(secret), None
+
+    def schedule_secret_deletion(self, secret_id: str, body: dict):
+        secret = self._secret(secret_id)
+        secret["lifecycleState"] = "PENDING_DELETION"
+        secret["timeOfDeletion"] = body.get("timeOfDeletion")
+        return None, None
+
+    def get_secret_bundle(self, secret_id: str, query: dict):
+        self._secret(secret_id)
+        with self._lock:
+            versions = list(self._versions[secret_id])
+        if "versionNumber" in query:
+            number = int(query["versionNumber"])
+            matches = [v for v in versions if v["versionNumber"] == number]
+        else:
+            stage = query.get("stage", "CURRENT")
+            matches = [v for v in versions if stage in v["stages"]]
+        if not matches:
+            raise _NotFound(secret_id)
+        version = matches[-1]
+        return {
+            "secretId": secret_id,
+            "versionNumber": version["versionNumber"],
+            "stages": version["stages"],
+            "timeCreated": version["timeCreated"],
+            "secretBundleContent": {
+                "contentType": "BASE64",
+                "content": version["_content"],
+            },
+        }, None
+
+    def get_secret_bundle_by_name(self, query: dict):
+        key_vault = query.get("vaultId")
+        with self._lock:
+            matches = [
+                s["id"]
+                for s in self._secrets.values()
+                if s["vaultId"] == key_vault and s["secretName"] == query["secretName"]
+            ]
+        if not matches:
+            raise _NotFound(query["secretName"])
+        return self.get_secret_bundle(matches[0], query)
+
+    # endregion
+
+    # region HTTP
+
+    def dispatch(self, method: str, path: str, query: dict, body: Optional[dict]):
+        """Route a request to an operation; return (data, next page)."""
+        parts = path.strip("/").split("/")
+        if path.startswith(VAULTS_BASE_PATH + "/secrets"):
+            rest = parts[2:]
+            if method == "GET" and not rest:
+                return self.list_secrets(query)
+            if method == "POST" and not rest:
+                return self.create_secret(body)
+            if method == "GET" and len(rest) == 1:
+                return self.get_secret(rest[0])
+            if method == "PUT" and len(rest) == 1:
+                return self.update_secret(rest[0], body)
+            if method == "GET" and rest[1:] == ["versions"]:
+                return self.list_secret_versions(rest[0], query)
+            if method == "GET" and len(rest) == 3 and rest[1] == "version":
+                return self.get_secret_version(rest[0], rest[2])
+            if method == "POST" and rest[1:] == ["actions", "scheduleDeletion"]:
+                return self.schedule_secret_deletion(rest[0], body or {})
+        elif path == IDENTITY_BASE_PATH + "/compartments" and method == "GET":
+            return self.list_compartments(query)
+        elif path.startswith(SECRETS_BASE_PATH + "/secretbundles"):
+            rest = parts[2:]
+            if method == "POST" and rest == ["actions", "getByName"]:
+                return self.get_secret_bundle_by_name(query)
+            if method == "GET" and len(rest) == 1:
+                return self.get_secret_bundle(rest[0], query)
+        raise _NotFound(path)
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve on a background thread and return the base URL."""
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Keep-alive replies would otherwise wait on the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self):
+                url = urlparse(self.path)
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+
+                with stand_in._lock:
+                    stand_in.requests += 1
+                    throttle = stand_in._random.random() < stand_in.throttle_rate
+                    if throttle:
+                        stand_in.throttled += 1
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                if throttle:
+                    self._reply(
+                        429, {"code": "TooManyRequests", "message": "Slow down"}
+                    )
+                    return
+                try:
+                    data, next_page = stand_in.dispatch(
+                        self.command, url.path, query, body
+                    )
+                except _NotFound:
+                    self._reply(
+                        404,
+                        {
+                            "code": "NotAuthorizedOrNotFound",
+                            "message": "Resource not found",
+                        },
+                    )
+                    return
+                except (KeyError, TypeError, ValueError) as e:
+                    self._reply(400, {"code": "InvalidParameter", "message": str(e)})
+                    return
+                self._reply(200, data, next_page)
+
+            def _reply(self, status: int, data, next_page: Optional[str] = None):
+                payload = b"" if data is None else json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.send_header("opc-request-id", uuid.uuid4().hex)
+                if next_page is not None:
+                    self.send_header("opc-next-page", next_page)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = _handle
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="oci-vault-stand-in", daemon=True
+        )
+        self._thread.start()
+        return f"http://{host}:{self._server.server_address[1]}"
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # endregion
@@ -0,0 +1,191 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Measure the cold start of the stdio server and check it against a budget.
+
+Two numbers are reported, each the median of ``--runs`` fresh interpreters:
+the cumulative ``-X importtime`` of the server module, and the wall time from
+launching the stdio server until its first ``tools/list`` response. The run
+fails (exit status 1) when a budget is exceeded or when a module listed with
+``--forbid`` (by default the OCI SDK) is imported at startup.
+
+Example (from ``src/oci-vault-mcp-server``)::
+
+    python -m benchmarks.startup --import-budget-ms 2000 --first-list-budget-ms 5000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Optional
+
+SERVER_MODULE = "oracle.oci_vault_mcp_server.server"
+
+_HANDSHAKE = [
+    {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2025-06-18",
+            "capabilities": {},
+            "clientInfo": {"name": "startup-benchmark", "version": "1.0"},
+        },
+    },
+    {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+]
+
+
+def _environment() -> dict:
+    env = dict(os.environ, PYTHONWARNINGS="ignore")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (root, env.get("PYTHONPATH")) if p)
+    return env
+
+
+def parse_importtime(output: str) -> dict[str, tuple[int, int]]:
+    """Map each imported module to its (depth, cumulative microseconds)."""
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.setdefault(name.strip(), (depth, int(cumulative)))
+    return modules
+
+
+def measure_import(module: str = SERVER_MODULE) -> dict[str, tuple[int, int]]:
+    """Import ``module`` in a fresh interpreter and return its import profile."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=_environment(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure_first_list(timeout: float = 60.0) -> tuple[float, int]:
+    """Launch the stdio server; return seconds until tools/list and the tool count."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", SERVER_MODULE],
+        env=_environment(),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        for message in _HANDSHAKE:
+            process.stdin.write(json.dumps(message) + "\n")
+        process.stdin.flush()
+        deadline = start + timeout
+        while time.perf_counter() < deadline:
+            line = process.stdout.readline()
+            if not line:
+                raise RuntimeError("server exited before answering tools/list")
+            response = json.loads(line)
+            if response.get("id") == 2:
+                return time.perf_counter() - start, len(response["result"]["tools"])
+        raise TimeoutError("no tools/list response")
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--import-budget-ms", type=float, default=None)
+    parser.add_argument("--first-list-budget-ms", type=float, default=None)
+    parser.add_argument(
+        "--forbid",
+        action="append",
+        default=None,
+        help="Module that must not be imported at startup (repeatable, default: oci).",
+    )
+    parser.add_argument("--skip-first-list", action="store_true")
+    parser.add_argument("--json", default=None, help="Write the results to this file.")
+    args = parser.parse_args(argv)
+    forbidden = args.forbid if args.forbid is not None else ["oci"]
+
+    profiles = [measure_import() for _ in range(args.runs)]
+    import_ms = statistics.median(p[SERVER_MODULE][1] for p in profiles) / 1000
+    heaviest = sorted(
+        (
+            (cumulative, name)
+            for name, (depth, cumulative) in profiles[-1].items()
+            if depth == 1
+        ),
+        reverse=True,
+    )[: args.top]
+    loaded = [
+        name
+        for name in profiles[-1]
+        if any(name == m or name.startswith(m + ".") for m in forbidden)
+    ]
+
+    print(f"server import: {import_ms:.0f} ms (median of {args.runs})")
+    for cumulative, name in heaviest:
+        print(f"  {cumulative / 1000:>8.0f} ms  {name}")
+
+    first_list_ms = tools = None
+    if not args.skip_first_list:
+        samples = [measure_first_list() for _ in range(args.runs)]
+        first_list_ms = statistics.median(s for s, _ in samples) * 1000
+        tools = samples[-1][1]
+        print(f"first tools/list: {first_list_ms:.0f} ms ({tools} tools)")
+
+    failures = []
+    if loaded:
+        failures.append(f"imported at startup: {', '.join(sorted(loaded)[:5])}")
+    if args.import_budget_ms is not None and import_ms > args.import_budget_ms:
+        failures.append(
+            f"server import {import_ms:.0f} ms exceeds {args.import_budget_ms:.0f} ms"
+        )
+    if (
+        args.first_list_budget_ms is not None
+        and first_list_ms is not None
+        and first_list_ms > args.first_list_budget_ms
+    ):
+        failures.append(
+            f"first tools/list {first_list_ms:.0f} ms exceeds "
+            f"{args.first_list_budget_ms:.0f} ms"
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "arguments": vars(args),
+                    "import_ms": import_ms,
+                    "first_list_ms": first_list_ms,
+                    "tools": tools,
+                    "heaviest": [
+                        {"module": name, "ms": cumulative / 1000}
+                        for cumulative, name in heaviest
+                    ],
+                    "failures": failures,
+                },
+                f,
+                indent=2,
+            )
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,6 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
-from . import __project__, __version__
+from .. import __project__, __version__
 
 __all__ = ["__project__", "__version__"]
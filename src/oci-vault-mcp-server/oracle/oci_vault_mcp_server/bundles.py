@@ -0,0 +1,247 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import binascii
+import fnmatch
+import os
+import threading
+import time
+from collections import OrderedDict
+from logging import Logger
+from typing import Callable, Iterable, Literal, Optional
+
+from oracle.oci_vault_mcp_server.sessions import VaultContext
+
+logger = Logger(__name__, level="INFO")
+
+# (secret OCID, version number, stage, profile and region it was read with);
+# None for both version number and stage means the current version
+BundleKey = tuple[str, Optional[int], Optional[str], VaultContext]
+BundleLoader = Callable[..., tuple[dict, Optional[bytearray]]]
+
+
+def zeroize(buffer: Optional[bytearray]):
+    """Overwrite a content buffer in place."""
+    if buffer:
+        buffer[:] = bytes(len(buffer))
+
+
+def decode_content(buffer: bytearray, encoding: Literal["base64", "text"]) -> str:
+    """
+    Return base64 bundle content as base64 or as UTF-8 text.
+
+    Text is decoded straight from the content buffer, without first copying
+    the base64 into a ``str`` as ``base64.b64decode`` of the SDK value would.
+    """
+    if encoding == "base64":
+        return buffer.decode("ascii")
+    try:
+        return binascii.a2b_base64(buffer).decode("utf-8")
+    except UnicodeDecodeError:
+        raise ValueError(
+            "Secret content is not UTF-8 text; request it with content='base64'"
+        )
+
+
+class ContentAllowlist:
+    """
+    Secrets whose content ``get_secret_value`` may return.
+
+    Entries starting with ``ocid1.`` match a secret OCID exactly; any other
+    entry is a shell-style pattern matched against the secret name. An empty
+    allowlist allows no secret, so content is never returned by default.
+    """
+
+    def __init__(self, entries: Iterable[str] = ()):
+        entries = [e.strip() for e in entries if e.strip()]
+        self.secret_ids = frozenset(e for e in entries if e.startswith("ocid1."))
+        self.name_patterns = tuple(e for e in entries if not e.startswith("ocid1."))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.secret_ids or self.name_patterns)
+
+    def allows(self, secret_id: Optional[str], name: Optional[str] = None) -> bool:
+        if secret_id in self.secret_ids:
+            return True
+        return name is not None and any(
+            fnmatch.fnmatchcase(name, pattern) for pattern in self.name_patterns
+        )
+
+
+class _BundleEntry:
+    __slots__ = ("result", "content", "fetched_at", "hits")
+
+    def __init__(self, result: dict, content: Optional[bytearray], fetched_at: float):
+        self.result = result
+        self.content = content
+        self.fetched_at = fetched_at
+        self.hits = 0
+
+
+class BundleCache:
+    """
+    Refresh-ahead cache of secret bundles.
+
+    Bundles are never served once they are older than ``max_age``. Bundles
+    read at least ``hot_threshold`` times are reloaded by a background thread
+    once they reach ``refresh_ahead * max_age``, so hot secrets stay warm
+    without ever serving a value older than ``max_age``. Secret content is
+    held in a ``bytearray`` that is overwritten when the entry is replaced,
+    invalidated or evicted.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_age: float = 60.0,
+        refresh_ahead: float = 0.75,
+        hot_threshold: int = 3,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.enabled = enabled and max_age > 0
+        self.max_age = max_age
+        self.refresh_ahead = refresh_ahead
+        self.hot_threshold = hot_threshold
+        self.max_entries = max_entries
+        self.loader: Optional[BundleLoader] = None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[BundleKey, _BundleEntry] = OrderedDict()
+        self._refresher: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def get(self, key: BundleKey) -> Optional[tuple[dict, Optional[bytearray]]]:
+        """
+        Return a copy of the cached result and content, if fresh.
+
+        The caller owns the returned content buffer and should zeroize it
+        once it is no longer needed.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._clock() - entry.fetched_at >= self.max_age:
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            entry.hits += 1
+            self._entries.move_to_end(key)
+            self.hits += 1
+            content = bytearray(entry.content) if entry.content is not None else None
+            return dict(entry.result), content
+
+    def put(self, key: BundleKey, result: dict, content: Optional[bytearray]):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._store(key, result, content)
+        self._ensure_refresher()
+
+    def invalidate(self, secret_id: str):
+        """Drop every cached version of a secret."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == secret_id]:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+
+    def stop(self):
+        self._stopped.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_age_seconds": self.max_age,
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors,
+            }
+
+    def refresh_due(self):
+        """Reload every hot bundle that has entered its refresh-ahead window."""
+        if self.loader is None:
+            return
+        with self._lock:
+            now = self._clock()
+            due = [
+                key
+                for key, entry in self._entries.items()
+                if entry.hits >= self.hot_threshold
+                and now - entry.fetched_at >= self.refresh_ahead * self.max_age
+            ]
+        for key in due:
+            try:
+                result, content = self.loader(*key)
+            except Exception as e:
+                self.refresh_errors += 1
+                logger.error(f"Error refreshing secret bundle {key[0]}: {str(e)}")
+                continue
+            with self._lock:
+                # Skip bundles invalidated while they were being reloaded
+                if key not in self._entries:
+                    zeroize(content)
+                    continue
+                self._store(key, result, content)
+                self.refreshes += 1
+
+    def _store(self, key: BundleKey, result: dict, content: Optional[bytearray]):
+        previous = self._entries.get(key)
+        entry = _BundleEntry(dict(result), content, self._clock())
+        if previous is not None:
+            # Keep the access count so a refreshed hot entry stays hot
+            entry.hits = previous.hits
+            self._drop(key)
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: BundleKey):
+        entry = self._entries.pop(key)
+        zeroize(entry.content)
+
+    def _ensure_refresher(self):
+        if self._refresher is not None or self.loader is None:
+            return
+        with self._lock:
+            if self._refresher is not None:
+                return
+            self._refresher = threading.Thread(
+                target=self._run_refresher, name="oci-vault-bundle-refresh", daemon=True
+            )
+            self._refresher.start()
+
+    def _run_refresher(self):
+        interval = max(self.max_age * (1 - self.refresh_ahead) / 2, 0.1)
+        while not self._stopped.wait(interval):
+            self.refresh_due()
+
+
+bundle_cache = BundleCache(
+    enabled=os.getenv("OCI_VAULT_BUNDLE_CACHE_ENABLED", "false").lower()
+    in ("1", "true", "yes"),
+    max_age=float(os.getenv("OCI_VAULT_BUNDLE_MAX_AGE_SECONDS", "60")),
+    refresh_ahead=float(os.getenv("OCI_VAULT_BUNDLE_REFRESH_AHEAD", "0.75")),
+    hot_threshold=int(os.getenv("OCI_VAULT_BUNDLE_HOT_THRESHOLD", "3")),
+    max_entries=int(os.getenv("OCI_VAULT_BUNDLE_MAX_ENTRIES", "256")),
+)
+
+content_allowlist = ContentAllowlist(
+    os.getenv("OCI_VAULT_CONTENT_ALLOWLIST", "").split(",")
+)
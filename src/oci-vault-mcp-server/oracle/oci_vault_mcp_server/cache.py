@@ -0,0 +1,314 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from logging import Logger
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from oracle.oci_vault_mcp_server.shared import (
+    ModelCodec,
+    SharedBackend,
+    metadata_codec,
+    shared_backend,
+    shared_key,
+)
+
+logger = Logger(__name__, level="INFO")
+
+_MISSING = object()
+
+# Implicit tag of every shared entry, bumped by clear()
+_ALL = ("all",)
+
+
+class TTLCache:
+    """
+    A bounded LRU cache with a per-entry time to live.
+
+    Entries can be associated with tags so that a mutation can drop every
+    entry derived from, for example, a given vault in one call.
+    A ``ttl`` of 0 disables caching entirely.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._tags: dict[Hashable, set] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires_at, _ = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._remove(key)
+            self.misses += 1
+            return default
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live value without touching LRU order or statistics."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING or entry[1] <= self._clock():
+                return default
+            return entry[0]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[Hashable] = (),
+        ttl: Optional[float] = None,
+    ):
+        """Store ``value`` under ``key``, tagged for later invalidation."""
+        if not self.enabled:
+            return
+        tags = frozenset(t for t in tags if t is not None)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+            self._entries[key] = (value, expires_at, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                self.invalidations += 1
+
+    def invalidate_tag(self, tag: Hashable):
+        """Drop every entry stored with ``tag``."""
+        with self._lock:
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: Hashable):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class SharedTTLCache:
+    """
+    A :class:`TTLCache` kept in a shared backend, so replicas share entries.
+
+    Tags are generation counters in the backend: invalidating a tag bumps
+    its counter, and an entry stored under an older generation of any of
+    its tags is treated as a miss. Values that ``codec`` cannot encode are
+    not cached.
+
+    Backend errors never fail the caller. An invalidation that cannot be
+    written is retried before the next backend call, and until then this
+    replica treats entries with that tag as misses.
+    """
+
+    def __init__(self, backend: SharedBackend, codec: ModelCodec, ttl: float = 30.0):
+        self.backend = backend
+        self.codec = codec
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+        # Backend keys of tags whose invalidation is still to be written
+        self._pending: set[str] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._read(key)
+        with self._lock:
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        value = self._read(key)
+        return default if value is _MISSING else value
+
+    def _read(self, key: Hashable) -> Any:
+        if not self.enabled:
+            return _MISSING
+        try:
+            pending = self._flush_pending()
+            data = self.backend.get(shared_key("cache", key))
+            if data is None:
+                return _MISSING
+            header, _, payload = data.partition(b"\n")
+            generations = json.loads(header)
+            if pending.intersection(generations):
+                return _MISSING
+            current = self.backend.get_many(list(generations))
+            if any(
+                int(now or 0) != stored
+                for now, stored in zip(current, generations.values())
+            ):
+                return _MISSING
+            return self.codec.decode(payload)
+        except Exception as e:
+            self._failed("read", e)
+            return _MISSING
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[Hashable] = (),
+        ttl: Optional[float] = None,
+    ):
+        if not self.enabled:
+            return
+        try:
+            if self._flush_pending():
+                # Entries written now could outlive the missed invalidation
+                return
+            tag_keys = [shared_key("tag", _ALL)] + [
+                shared_key("tag", t) for t in tags if t is not None
+            ]
+            current = self.backend.get_many(tag_keys)
+            generations = {k: int(g or 0) for k, g in zip(tag_keys, current)}
+            data = json.dumps(generations).encode() + b"\n" + self.codec.encode(value)
+            self.backend.set(
+                shared_key("cache", key), data, self.ttl if ttl is None else ttl
+            )
+        except Exception as e:
+            self._failed("write", e)
+
+    def delete(self, key: Hashable):
+        try:
+            self.backend.delete(shared_key("cache", key))
+        except Exception as e:
+            self._failed("delete", e)
+        with self._lock:
+            self.invalidations += 1
+
+    def invalidate_tag(self, tag: Hashable):
+        """Make every entry stored with ``tag`` a miss, on every replica."""
+        if tag is None:
+            return
+        with self._lock:
+            self.invalidations += 1
+            self._pending.add(shared_key("tag", tag))
+        # Called after the change was made in OCI, so never fail the caller
+        try:
+            self._flush_pending()
+        except Exception as e:
+            self._failed("invalidation", e)
+
+    def _flush_pending(self) -> frozenset[str]:
+        """Write queued invalidations; return the ones still queued."""
+        with self._lock:
+            pending = set(self._pending)
+        for tag_key in pending:
+            self.backend.incr(tag_key)
+            with self._lock:
+                self._pending.discard(tag_key)
+        with self._lock:
+            return frozenset(self._pending)
+
+    def clear(self):
+        self.invalidate_tag(_ALL)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "shared": True,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "errors": self.errors,
+                "pending_invalidations": len(self._pending),
+                **self.backend.stats(),
+            }
+
+    def _failed(self, operation: str, error: Exception):
+        # An unreachable backend degrades to uncached reads
+        with self._lock:
+            self.errors += 1
+        logger.error(f"Error in shared cache {operation}: {str(error)}")
+
+
+def vault_tag(vault_id: Optional[str]) -> Optional[tuple]:
+    """Tag for entries that list or search the contents of a vault."""
+    return ("vault", vault_id) if vault_id else None
+
+
+def secret_tag(secret_id: Optional[str]) -> Optional[tuple]:
+    """Tag for entries that contain the state of a single secret."""
+    return ("secret", secret_id) if secret_id else None
+
+
+if shared_backend is not None:
+    metadata_cache = SharedTTLCache(
+        shared_backend,
+        metadata_codec,
+        ttl=float(os.getenv("OCI_VAULT_CACHE_TTL_SECONDS", "30")),
+    )
+else:
+    metadata_cache = TTLCache(
+        max_entries=int(os.getenv("OCI_VAULT_CACHE_MAX_ENTRIES", "1024")),
+        ttl=float(os.getenv("OCI_VAULT_CACHE_TTL_SECONDS", "30")),
+    )
@@ -0,0 +1,113 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import base64
+import hashlib
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+from oracle.oci_vault_mcp_server.models import SecretMetadata
+
+# secret OCID -> (listing fingerprint, highest known version number)
+ChangeState = dict[str, tuple[str, Optional[int]]]
+
+# Only known for secrets read with get_secret, so it would make listings differ
+_UNLISTED_FIELDS = {"current_version_number"}
+
+
+def secret_fingerprint(secret: SecretMetadata) -> str:
+    """Digest of the listed fields of a secret, which changes whenever they do."""
+    record = secret.model_dump_json(exclude=_UNLISTED_FIELDS)
+    return hashlib.blake2b(record.encode(), digest_size=8).hexdigest()
+
+
+def moved_since(secret: SecretMetadata, since: datetime) -> bool:
+    """Whether a listed timestamp of the secret shows a change after ``since``."""
+    return any(
+        t is not None and t > since
+        for t in (
+            secret.time_of_current_version,
+            secret.last_rotation_time,
+            secret.time_of_deletion,
+        )
+    )
+
+
+def _query_digest(query: tuple) -> str:
+    return hashlib.sha256(repr(query).encode()).hexdigest()[:16]
+
+
+class ChangeTracker:
+    """
+    Keeps the per-secret state behind each watermark handed out.
+
+    A watermark only carries the time of its listing and a reference to the
+    state kept here, so it stays small however large the vault is. Once the
+    state is gone (after a restart, or evicted after ``max_states`` newer
+    watermarks) the watermark still works as a timestamp.
+    """
+
+    def __init__(self, max_states: int = 64):
+        self.max_states = max_states
+        self._lock = threading.Lock()
+        self._states: OrderedDict[str, ChangeState] = OrderedDict()
+        self.issued = 0
+        self.recalled = 0
+        self.expired = 0
+
+    def remember(self, query: tuple, listed_at: datetime, state: ChangeState) -> str:
+        """Store ``state`` and return a watermark for it."""
+        state_id = uuid.uuid4().hex
+        with self._lock:
+            self._states[state_id] = state
+            while len(self._states) > self.max_states:
+                self._states.popitem(last=False)
+            self.issued += 1
+        payload = json.dumps(
+            {"t": listed_at.isoformat(), "q": _query_digest(query), "s": state_id}
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def recall(
+        self, watermark: str, query: tuple
+    ) -> tuple[datetime, Optional[ChangeState]]:
+        """Return the listing time of ``watermark`` and its state, if still kept."""
+        try:
+            padded = watermark + "=" * (-len(watermark) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            listed_at = datetime.fromisoformat(payload["t"])
+            digest, state_id = payload["q"], payload["s"]
+        except Exception:
+            raise ValueError("watermark is not a valid changes_since watermark")
+        if digest != _query_digest(query):
+            raise ValueError(
+                "watermark was issued for a different vault or compartment"
+            )
+        if listed_at.tzinfo is None:
+            listed_at = listed_at.replace(tzinfo=timezone.utc)
+        with self._lock:
+            state = self._states.get(state_id)
+            if state is None:
+                self.expired += 1
+            else:
+                self.recalled += 1
+        return listed_at, state
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "states": len(self._states),
+                "issued": self.issued,
+                "recalled": self.recalled,
+                "expired": self.expired,
+            }
+
+
+change_tracker = ChangeTracker()
@@ -0,0 +1,224 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import importlib
+import os
+import threading
+from dataclasses import dataclass, field
+from logging import Logger
+from typing import Any, Optional
+
+from oracle.oci_vault_mcp_server.metrics import (
+    CLIENT_BUILD_DURATION,
+    SIGNER_LOAD_DURATION,
+    metrics,
+)
+from oracle.oci_vault_mcp_server.throttling import GuardedClient, GuardRegistry, guards
+
+from . import __project__, __version__
+
+logger = Logger(__name__, level="INFO")
+
+VAULTS_CLIENT = "vaults"
+SECRETS_CLIENT = "secrets"
+IDENTITY_CLIENT = "identity"
+
+# The OCI SDK is imported on first use, so a stdio launch can list tools
+# without paying for it
+_CLIENT_CLASSES = {
+    VAULTS_CLIENT: "oci.vault.VaultsClient",
+    SECRETS_CLIENT: "oci.secrets.SecretsClient",
+    IDENTITY_CLIENT: "oci.identity.IdentityClient",
+}
+
+
+# Optional per-service endpoint overrides (private endpoints, local stand-ins)
+_ENDPOINT_VARIABLES = {
+    VAULTS_CLIENT: "OCI_VAULT_SERVICE_ENDPOINT",
+    SECRETS_CLIENT: "OCI_SECRETS_SERVICE_ENDPOINT",
+    IDENTITY_CLIENT: "OCI_IDENTITY_SERVICE_ENDPOINT",
+}
+
+
+def _client_class(client_type: str):
+    client_class = _CLIENT_CLASSES[client_type]
+    if isinstance(client_class, str):
+        module, _, name = client_class.rpartition(".")
+        client_class = getattr(importlib.import_module(module), name)
+        _CLIENT_CLASSES[client_type] = client_class
+    return client_class
+
+
+def _default_profile() -> str:
+    import oci
+
+    return os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
+
+
+def _token_mtime(token_file: str) -> Optional[float]:
+    try:
+        return os.stat(token_file).st_mtime
+    except OSError:
+        return None
+
+
+@dataclass
+class _SignerEntry:
+    """A loaded OCI config and signer shared by every client of a profile."""
+
+    config: dict
+    signer: Any
+    token_file: str
+    token_mtime: Optional[float]
+    clients: dict = field(default_factory=dict)
+
+
+class ClientPool:
+    """
+    Thread-safe pool of OCI clients keyed by (profile, region, client type).
+
+    The config file, private key and security token are loaded once per
+    profile and the resulting signer is shared by all clients of that profile.
+    Clients are kept for the life of the process so their HTTP sessions (and
+    keep-alive connections) are reused across tool calls. When the security
+    token file changes on disk (e.g. after ``oci session refresh``) the signer
+    and all clients built from it are rebuilt on the next request.
+
+    Every client is wrapped in a :class:`GuardedClient`, so all operations
+    share the rate limiting, retry and circuit breaker policy of their
+    tenancy and region.
+    """
+
+    def __init__(
+        self,
+        config_file: Optional[str] = None,
+        service_endpoints: Optional[dict[str, str]] = None,
+        guard_registry: Optional[GuardRegistry] = None,
+    ):
+        # None means the SDK default location (~/.oci/config)
+        self.config_file = config_file
+        self.service_endpoints = dict(service_endpoints or {})
+        self.guards = guard_registry or guards
+        self._lock = threading.Lock()
+        self._entries: dict[str, _SignerEntry] = {}
+        self.hits = 0
+        self.misses = 0
+        self.rebuilds = 0
+
+    def get(
+        self,
+        client_type: str,
+        profile: Optional[str] = None,
+        region: Optional[str] = None,
+    ):
+        """Return a pooled client of ``client_type`` for the profile and region."""
+        if client_type not in _CLIENT_CLASSES:
+            raise ValueError(f"Unknown client type: {client_type}")
+        with self._lock:
+            entry = self._entry(profile)
+            key = (region or entry.config.get("region"), client_type)
+            client = entry.clients.get(key)
+            if client is not None:
+                self.hits += 1
+                return client
+
+            self.misses += 1
+            with metrics.timed(CLIENT_BUILD_DURATION, client=client_type):
+                client = self._build_client(entry, client_type, key[0])
+            entry.clients[key] = client
+            return client
+
+    def default_region(self, profile: Optional[str] = None) -> Optional[str]:
+        """Return the region configured for a profile."""
+        with self._lock:
+            return self._entry(profile).config.get("region")
+
+    def _entry(self, profile: Optional[str]) -> _SignerEntry:
+        """Return the signer entry of a profile, reloading it if its token changed."""
+        profile = profile or _default_profile()
+        entry = self._entries.get(profile)
+        if entry is not None and _token_mtime(entry.token_file) != entry.token_mtime:
+            logger.info(f"Security token changed, rebuilding profile {profile}")
+            self.rebuilds += 1
+            entry = None
+        if entry is None:
+            with metrics.timed(SIGNER_LOAD_DURATION):
+                entry = self._load_signer(profile)
+            self._entries[profile] = entry
+        return entry
+
+    def clear(self):
+        """Drop every pooled signer and client."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss/rebuild counters and the number of pooled clients."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "rebuilds": self.rebuilds,
+                "profiles": len(self._entries),
+                "clients": sum(len(e.clients) for e in self._entries.values()),
+            }
+
+    def _load_signer(self, profile: str) -> _SignerEntry:
+        import oci
+
+        config = oci.config.from_file(
+            file_location=self.config_file or oci.config.DEFAULT_LOCATION,
+            profile_name=profile,
+        )
+
+        user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
+        config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
+
+        private_key = oci.signer.load_private_key_from_file(config["key_file"])
+        token_file = os.path.expanduser(config["security_token_file"])
+        # Stat before reading so a refresh racing with us triggers a rebuild
+        token_mtime = _token_mtime(token_file)
+        with open(token_file, "r") as f:
+            token = f.read()
+        signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
+        return _SignerEntry(
+            config=config,
+            signer=signer,
+            token_file=token_file,
+            token_mtime=token_mtime,
+        )
+
+    def _build_client(
+        self, entry: _SignerEntry, client_type: str, region: Optional[str]
+    ):
+        import oci
+
+        config = entry.config
+        if region and region != config.get("region"):
+            config = dict(config, region=region)
+        # Retries and circuit breaking are done by the guard, not the SDK
+        kwargs = {
+            "retry_strategy": oci.retry.NoneRetryStrategy(),
+            "circuit_breaker_strategy": oci.circuit_breaker.NoCircuitBreakerStrategy(),
+        }
+        endpoint = self.service_endpoints.get(client_type)
+        if endpoint:
+            kwargs["service_endpoint"] = endpoint
+        client = _client_class(client_type)(config, signer=entry.signer, **kwargs)
+        guard = self.guards.get(
+            config.get("tenancy"), config.get("region"), client_type
+        )
+        return GuardedClient(client, guard)
+
+
+client_pool = ClientPool(
+    config_file=os.getenv("OCI_CONFIG_FILE"),
+    service_endpoints={
+        client_type: os.environ[variable]
+        for client_type, variable in _ENDPOINT_VARIABLES.items()
+        if os.getenv(variable)
+    },
+)
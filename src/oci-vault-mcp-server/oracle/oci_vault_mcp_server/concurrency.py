@@ -0,0 +1,316 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional, TypeVar
+
+from oracle.oci_vault_mcp_server.metrics import COALESCED_CALLS, metrics
+from oracle.oci_vault_mcp_server.shared import (
+    ModelCodec,
+    SharedBackend,
+    metadata_codec,
+    shared_backend,
+    shared_key,
+    shared_lease,
+)
+
+logger = Logger(__name__, level="INFO")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BlockingExecutor:
+    """
+    Runs blocking OCI SDK calls off the event loop.
+
+    Calls are executed on a bounded thread pool shared by all tools, and at
+    most ``per_vault_limit`` calls against the same vault run at once so a
+    burst against one vault cannot starve requests for the others.
+    """
+
+    def __init__(self, max_workers: int = 32, per_vault_limit: int = 8):
+        self.max_workers = max_workers
+        self.per_vault_limit = per_vault_limit
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # asyncio primitives are bound to a loop, so keep one set per loop
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.in_flight = 0
+        self.completed = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="oci-vault"
+                )
+            return self._executor
+
+    def _semaphore(self, vault_key: Optional[str]) -> Optional[asyncio.Semaphore]:
+        if not vault_key or self.per_vault_limit <= 0:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.setdefault(loop, {})
+        semaphore = semaphores.get(vault_key)
+        if semaphore is None:
+            semaphore = semaphores[vault_key] = asyncio.Semaphore(self.per_vault_limit)
+        return semaphore
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        vault_key: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """Run ``fn(*args, **kwargs)`` on the pool, limited per ``vault_key``."""
+        semaphore = self._semaphore(vault_key)
+        if semaphore is None:
+            return await self._submit(fn, args, kwargs)
+        async with semaphore:
+            return await self._submit(fn, args, kwargs)
+
+    async def _submit(self, fn, args, kwargs):
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs)
+        context = contextvars.copy_context()
+        self.in_flight += 1
+        try:
+            return await loop.run_in_executor(self.executor, context.run, call)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "per_vault_limit": self.per_vault_limit,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+        }
+
+
+async def map_bounded(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], limit: int
+) -> list[R]:
+    """Await ``fn(item)`` for every item with at most ``limit`` in flight.
+
+    Results are returned in the order of ``items``.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def call(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+
+    return await asyncio.gather(*(call(item) for item in items))
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates identical in-flight calls.
+
+    The first caller for a key runs the function; callers arriving with the
+    same key while it runs wait for it and receive the same result (or the
+    same exception) instead of issuing their own OCI request. Nothing is kept
+    once the call completes, so this is not a cache.
+
+    With a shared ``backend`` the calling replica's leader also takes a lease
+    on the key there. Leaders on other replicas wait for the lease holder's
+    result (for at most ``lease`` seconds) instead of repeating the call, and
+    run it themselves if the holder fails. Results ``codec`` cannot encode
+    are not shared.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        backend: Optional[SharedBackend] = None,
+        codec: Optional[ModelCodec] = None,
+        lease: float = 30.0,
+        poll_interval: float = 0.05,
+    ):
+        self.enabled = enabled
+        self.backend = backend
+        self.codec = codec
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self.leaders = 0
+        self.coalesced = 0
+        self.remote_coalesced = 0
+        self.remote_fallbacks = 0
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run ``fn(*args, **kwargs)``, or join the identical call already running.
+
+        ``key[0]`` names the operation in the coalesced calls metric.
+        """
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.leaders += 1
+            else:
+                flight.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            metrics.inc(COALESCED_CALLS, operation=key[0])
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            if self.backend is not None:
+                flight.result = self._do_shared(key, fn, *args, **kwargs)
+            else:
+                flight.result = fn(*args, **kwargs)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+
+    def _do_shared(self, key: Hashable, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run ``fn`` under a lease on ``key``, or wait for another replica's run.
+
+        If the backend cannot be reached, ``fn`` is run without coordination.
+        """
+        flight_id = uuid.uuid4().hex.encode()
+        try:
+            generation = int(self.backend.get(shared_key("flights", "generation")) or 0)
+            lease_key = shared_key("lease", (generation, key))
+            leased = self.backend.add(lease_key, flight_id, self.lease)
+        except Exception as e:
+            logger.warning(f"Shared flight backend unavailable: {str(e)}")
+            leased, lease_key = None, None
+
+        if leased is not False:
+            try:
+                result = fn(*args, **kwargs)
+                if leased:
+                    self._share(flight_id, result)
+                return result
+            finally:
+                if leased:
+                    self._release(lease_key)
+
+        try:
+            data = self._wait_for_leader(lease_key)
+        except Exception as e:
+            logger.warning(f"Shared flight backend unavailable: {str(e)}")
+            data = None
+        if data is not None:
+            with self._lock:
+                self.remote_coalesced += 1
+            metrics.inc(COALESCED_CALLS, operation=key[0])
+            return self.codec.decode(data)
+        # The leader failed, timed out or had a result that cannot be shared
+        with self._lock:
+            self.remote_fallbacks += 1
+        return fn(*args, **kwargs)
+
+    def _wait_for_leader(self, lease_key: str) -> Optional[bytes]:
+        """Poll for the result of the lease holder; None if it gives up."""
+        deadline = time.monotonic() + self.lease
+        leader = self.backend.get(lease_key)
+        while leader is not None and time.monotonic() < deadline:
+            data = self.backend.get(shared_key("result", leader))
+            if data is None and self.backend.get(lease_key) != leader:
+                # Released: look once more, as the result is stored first
+                return self.backend.get(shared_key("result", leader))
+            if data is not None:
+                return data
+            time.sleep(self.poll_interval)
+        return None
+
+    def _share(self, flight_id: bytes, result: Any):
+        try:
+            self.backend.set(
+                shared_key("result", flight_id), self.codec.encode(result), self.lease
+            )
+        except TypeError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not share flight result: {str(e)}")
+
+    def _release(self, lease_key: str):
+        try:
+            self.backend.delete(lease_key)
+        except Exception as e:
+            logger.warning(f"Could not release flight lease: {str(e)}")
+
+    def forget(self):
+        """Make later callers start new calls instead of joining running ones.
+
+        Used after writes, so a read that started before the write is not
+        handed to callers that arrive after it, on any replica.
+        """
+        with self._lock:
+            self._flights.clear()
+        if self.backend is not None:
+            try:
+                self.backend.incr(shared_key("flights", "generation"))
+            except Exception as e:
+                logger.warning(f"Could not end shared flights: {str(e)}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                "enabled": self.enabled,
+                "in_flight": len(self._flights),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+            }
+            if self.backend is not None:
+                stats["remote_coalesced"] = self.remote_coalesced
+                stats["remote_fallbacks"] = self.remote_fallbacks
+            return stats
+
+
+blocking = BlockingExecutor(
+    max_workers=int(os.getenv("OCI_VAULT_MAX_WORKERS", "32")),
+    per_vault_limit=int(os.getenv("OCI_VAULT_MAX_CONCURRENCY_PER_VAULT", "8")),
+)
+
+single_flight = SingleFlight(
+    enabled=os.getenv("OCI_VAULT_COALESCE_ENABLED", "true").lower()
+    in ("1", "true", "yes"),
+    backend=shared_backend,
+    codec=metadata_codec,
+    lease=shared_lease,
+)
@@ -0,0 +1,112 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from oracle.oci_vault_mcp_server.models import SecretFilter, SecretMetadata
+
+SecretPredicate = Callable[[SecretMetadata], bool]
+
+
+def tags_match(secret: SecretMetadata, tags: Optional[dict]) -> bool:
+    """Check freeform tags (``key``) and defined tags (``namespace.key``)."""
+    if not tags:
+        return True
+    freeform = secret.freeform_tags or {}
+    defined = secret.defined_tags or {}
+    for key, value in tags.items():
+        if key in freeform:
+            actual = freeform[key]
+        elif "." in key:
+            namespace, _, name = key.partition(".")
+            if name not in defined.get(namespace, {}):
+                return False
+            actual = defined[namespace][name]
+        else:
+            return False
+        if value is not None and str(actual) != str(value):
+            return False
+    return True
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _in_range(
+    value: Optional[datetime], after: Optional[datetime], before: Optional[datetime]
+) -> bool:
+    return (
+        value is not None
+        and (after is None or value > after)
+        and (before is None or value < before)
+    )
+
+
+def oci_filter_params(secret_filter: Optional[SecretFilter]) -> dict:
+    """Return the ``list_secrets`` query parameters OCI applies itself."""
+    if secret_filter is None:
+        return {}
+    params = {
+        "lifecycle_state": secret_filter.lifecycle_state,
+        "sort_by": secret_filter.sort_by,
+        "sort_order": secret_filter.sort_order,
+    }
+    return {k: v for k, v in params.items() if v is not None}
+
+
+def secret_predicate(
+    secret_filter: Optional[SecretFilter], pushed_down: bool = True
+) -> Optional[SecretPredicate]:
+    """
+    Return a check for the conditions of ``secret_filter`` OCI does not apply.
+
+    With ``pushed_down`` false (for secrets that did not come from a filtered
+    OCI listing, such as the local index) the lifecycle state is checked too.
+    Returns None when there is nothing to check.
+    """
+    if secret_filter is None:
+        return None
+    checks: list[SecretPredicate] = []
+    if secret_filter.lifecycle_state and not pushed_down:
+        state = secret_filter.lifecycle_state
+        checks.append(lambda s: s.lifecycle_state == state)
+    if secret_filter.name_prefix:
+        prefix = secret_filter.name_prefix.lower()
+        checks.append(lambda s: (s.name or "").lower().startswith(prefix))
+    if secret_filter.name_contains:
+        needle = secret_filter.name_contains.lower()
+        checks.append(lambda s: needle in (s.name or "").lower())
+    if secret_filter.tags:
+        tags = secret_filter.tags
+        checks.append(lambda s: tags_match(s, tags))
+    created = (_utc(secret_filter.created_after), _utc(secret_filter.created_before))
+    if created != (None, None):
+        checks.append(lambda s: _in_range(s.time_created, *created))
+    rotated = (_utc(secret_filter.rotated_after), _utc(secret_filter.rotated_before))
+    if rotated != (None, None):
+        checks.append(lambda s: _in_range(s.last_rotation_time, *rotated))
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda s: all(check(s) for check in checks)
+
+
+def sort_secrets(
+    secrets: list[SecretMetadata], secret_filter: Optional[SecretFilter]
+) -> list[SecretMetadata]:
+    """Sort secrets that did not come from OCI in the requested order."""
+    if secret_filter is None or secret_filter.sort_by is None:
+        return secrets
+    reverse = secret_filter.sort_order == "DESC"
+    if secret_filter.sort_by == "NAME":
+        return sorted(secrets, key=lambda s: s.name or "", reverse=reverse)
+    epoch = datetime.min.replace(tzinfo=timezone.utc)
+    return sorted(secrets, key=lambda s: s.time_created or epoch, reverse=reverse)
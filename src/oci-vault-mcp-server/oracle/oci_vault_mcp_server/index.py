@@ -0,0 +1,215 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import difflib
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from oracle.oci_vault_mcp_server.filters import tags_match
+from oracle.oci_vault_mcp_server.models import SecretMetadata
+
+MATCH_MODES = ("substring", "prefix", "fuzzy")
+
+# Minimum similarity ratio for a fuzzy match
+FUZZY_CUTOFF = 0.6
+
+
+class VaultIndex:
+    """
+    In-memory index of the names, descriptions and tags of one vault's secrets.
+    """
+
+    def __init__(self, vault_id: str, compartment_id: str):
+        self.vault_id = vault_id
+        self.compartment_id = compartment_id
+        self._secrets: dict[str, SecretMetadata] = {}
+        # (lower-case name, lower-case description, secret), rebuilt lazily
+        self._rows: Optional[list[tuple[str, str, SecretMetadata]]] = None
+        self.lock = threading.Lock()
+        self.built_at: Optional[float] = None
+        self.refreshed_at: Optional[float] = None
+        self.watermark: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._secrets)
+
+    def replace(self, secrets: Iterable[SecretMetadata], now: float):
+        """Replace the whole index with the result of a full listing."""
+        self._secrets = {s.id: s for s in secrets if s.id}
+        self._rows = None
+        self.watermark = max(
+            (s.time_created for s in self._secrets.values() if s.time_created),
+            default=None,
+        )
+        self.built_at = self.refreshed_at = now
+
+    def merge(self, secrets: Iterable[SecretMetadata], now: Optional[float] = None):
+        """Insert or update individual secrets."""
+        for secret in secrets:
+            if not secret.id:
+                continue
+            self._secrets[secret.id] = secret
+            if secret.time_created and (
+                self.watermark is None or secret.time_created > self.watermark
+            ):
+                self.watermark = secret.time_created
+        self._rows = None
+        if now is not None:
+            self.refreshed_at = now
+
+    def search(
+        self,
+        query: str,
+        mode: str = "substring",
+        tags: Optional[dict] = None,
+        include_description: bool = True,
+        limit: Optional[int] = None,
+    ) -> list[SecretMetadata]:
+        """Return the secrets matching ``query`` in the given match ``mode``."""
+        if mode not in MATCH_MODES:
+            raise ValueError(f"match must be one of {', '.join(MATCH_MODES)}")
+        with self.lock:
+            if self._rows is None:
+                self._rows = [
+                    ((s.name or "").lower(), (s.description or "").lower(), s)
+                    for s in self._secrets.values()
+                ]
+            rows = self._rows
+        needle = query.lower()
+
+        if mode == "fuzzy":
+            scored = []
+            for name, _, secret in rows:
+                if not tags_match(secret, tags):
+                    continue
+                if needle in name:
+                    score = 1.0
+                else:
+                    score = difflib.SequenceMatcher(None, needle, name).ratio()
+                if score >= FUZZY_CUTOFF:
+                    scored.append((score, name, secret))
+            scored.sort(key=lambda row: (-row[0], row[1]))
+            matches = [secret for _, _, secret in scored]
+        else:
+            matches = []
+            for name, description, secret in rows:
+                if mode == "prefix":
+                    found = name.startswith(needle)
+                else:
+                    found = needle in name or (
+                        include_description and needle in description
+                    )
+                if found and tags_match(secret, tags):
+                    matches.append(secret)
+            matches.sort(key=lambda s: s.name or "")
+
+        return matches[:limit] if limit is not None else matches
+
+
+class SecretIndex:
+    """
+    Per-vault secret indexes with a bounded staleness.
+
+    An index older than ``refresh_interval`` is refreshed incrementally (only
+    secrets created since the newest indexed secret are fetched); one older
+    than ``max_staleness`` is rebuilt from a full listing, which also picks up
+    changes the incremental refresh cannot see.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = 30.0,
+        max_staleness: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.refresh_interval = refresh_interval
+        self.max_staleness = max_staleness
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (cache namespace, vault OCID, compartment OCID) -> index
+        self._indexes: dict[tuple[str, str, str], VaultIndex] = {}
+        self.full_refreshes = 0
+        self.incremental_refreshes = 0
+
+    def get(
+        self,
+        vault_id: str,
+        compartment_id: str,
+        load_all: Callable[[], list[SecretMetadata]],
+        load_since: Callable[[datetime], list[SecretMetadata]],
+        force: bool = False,
+        namespace: str = "",
+    ) -> VaultIndex:
+        """Return the index of a vault, refreshing it first if it is stale."""
+        key = (namespace, vault_id, compartment_id)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = VaultIndex(vault_id, compartment_id)
+                self._indexes[key] = index
+
+        with index.lock:
+            now = self._clock()
+            if (
+                force
+                or index.built_at is None
+                or now - index.built_at >= self.max_staleness
+            ):
+                index.replace(load_all(), now)
+                self.full_refreshes += 1
+            elif now - index.refreshed_at >= self.refresh_interval:
+                if index.watermark is None:
+                    index.merge(load_all(), now)
+                else:
+                    index.merge(load_since(index.watermark), now)
+                self.incremental_refreshes += 1
+        return index
+
+    def upsert(self, secret: SecretMetadata, namespace: str = ""):
+        """
+        Apply a secret written by this server to the index of its vault.
+
+        Only the index of the writer's cache ``namespace`` is updated; the
+        same vault's indexes in other namespaces are rebuilt on their next
+        use with their own credentials.
+        """
+        with self._lock:
+            matches = [
+                (key[0] == namespace, index)
+                for key, index in self._indexes.items()
+                if key[1] == secret.vault_id
+                and index.compartment_id == secret.compartment_id
+            ]
+        for own, index in matches:
+            with index.lock:
+                if own:
+                    index.merge([secret])
+                else:
+                    index.built_at = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "vaults": len(self._indexes),
+                "secrets": sum(len(index) for index in self._indexes.values()),
+                "full_refreshes": self.full_refreshes,
+                "incremental_refreshes": self.incremental_refreshes,
+            }
+
+
+index_enabled = os.getenv("OCI_VAULT_INDEX_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+secret_index = SecretIndex(
+    refresh_interval=float(os.getenv("OCI_VAULT_INDEX_REFRESH_SECONDS", "30")),
+    max_staleness=float(os.getenv("OCI_VAULT_INDEX_MAX_STALENESS_SECONDS", "300")),
+)
@@ -0,0 +1,180 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+TOOL_CALLS = "oci_vault_tool_calls_total"
+TOOL_ERRORS = "oci_vault_tool_errors_total"
+TOOL_DURATION = "oci_vault_tool_duration_seconds"
+LIST_PAGES = "oci_vault_list_pages_total"
+LIST_PAGE_DURATION = "oci_vault_list_page_request_seconds"
+LIST_PAGE_MAPPING = "oci_vault_list_page_mapping_seconds"
+SIGNER_LOAD_DURATION = "oci_vault_signer_load_seconds"
+CLIENT_BUILD_DURATION = "oci_vault_client_build_seconds"
+OCI_RETRIES = "oci_vault_oci_retries_total"
+OCI_THROTTLES = "oci_vault_oci_throttled_total"
+RATE_LIMIT_WAIT = "oci_vault_rate_limit_wait_seconds_total"
+CIRCUIT_REJECTIONS = "oci_vault_circuit_rejections_total"
+COALESCED_CALLS = "oci_vault_coalesced_calls_total"
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+class MetricsRegistry:
+    """
+    Minimal thread-safe registry of counters and histograms.
+
+    Rendered in the Prometheus text exposition format. Component statistics
+    (such as cache hit counters) are exported as gauges through collectors
+    evaluated at render time, so they cost nothing on the hot path.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._meta: dict[str, tuple[str, str]] = {}
+        self._buckets: dict[str, tuple] = {}
+        self._counters: dict[tuple[str, tuple], float] = {}
+        # name, labels -> [count per bucket..., +Inf count, sum]
+        self._histograms: dict[tuple[str, tuple], list] = {}
+        self._collectors: dict[str, Callable[[], dict]] = {}
+
+    def counter(self, name: str, help: str):
+        self._meta[name] = ("counter", help)
+
+    def histogram(self, name: str, help: str, buckets: tuple = DEFAULT_BUCKETS):
+        self._meta[name] = ("histogram", help)
+        self._buckets[name] = tuple(sorted(buckets))
+
+    def register_stats(self, component: str, stats: Callable[[], dict]):
+        """Export the numeric values of ``stats()`` as ``oci_vault_<component>_*``."""
+        self._collectors[component] = stats
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        buckets = self._buckets[name]
+        key = (name, tuple(sorted(labels.items())))
+        index = bisect.bisect_left(buckets, value)
+        with self._lock:
+            series = self._histograms.get(key)
+            if series is None:
+                series = self._histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def timed(self, name: str, **labels) -> Iterator[None]:
+        """Observe the duration of the ``with`` block in histogram ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {k: list(v) for k, v in self._histograms.items()}
+
+        lines: list[str] = []
+        for name, (kind, help) in sorted(self._meta.items()):
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "counter":
+                for (series, labels), value in sorted(counters.items()):
+                    if series == name:
+                        lines.append(
+                            f"{name}{_format_labels(labels)} {_format_value(value)}"
+                        )
+                continue
+            buckets = self._buckets[name]
+            for (series, labels), values in sorted(histograms.items()):
+                if series != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(buckets + (float("inf"),), values):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    bucket_labels = _format_labels(labels + (("le", le),))
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                total = _format_value(values[-1])
+                lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+
+        for component, stats in sorted(self._collectors.items()):
+            for key, value in stats().items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                name = f"oci_vault_{component}_{key}"
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+metrics.counter(TOOL_CALLS, "Number of MCP tool calls.")
+metrics.counter(TOOL_ERRORS, "Number of MCP tool calls that raised an error.")
+metrics.histogram(TOOL_DURATION, "Duration of MCP tool calls.")
+metrics.counter(LIST_PAGES, "Number of pages requested from OCI list operations.")
+metrics.histogram(LIST_PAGE_DURATION, "Duration of OCI list page requests.")
+metrics.histogram(
+    LIST_PAGE_MAPPING, "Time spent mapping a page of OCI results to response models."
+)
+metrics.histogram(SIGNER_LOAD_DURATION, "Time spent loading OCI config and signers.")
+metrics.histogram(CLIENT_BUILD_DURATION, "Time spent constructing OCI clients.")
+metrics.counter(OCI_RETRIES, "Number of retried OCI requests, by reason.")
+metrics.counter(OCI_THROTTLES, "Number of OCI requests rejected with 429.")
+metrics.counter(RATE_LIMIT_WAIT, "Time spent waiting for the client-side rate limiter.")
+metrics.counter(
+    CIRCUIT_REJECTIONS, "Number of OCI requests rejected by an open circuit."
+)
+metrics.counter(
+    COALESCED_CALLS,
+    "Number of calls served by joining an identical in-flight OCI request.",
+)
@@ -5,19 +5,22 @@ https://oss.oracle.com/licenses/upl.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Literal, Optional
 
-import oci
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+if TYPE_CHECKING:
+    import oci
 
 
 def _oci_to_dict(obj):
     """Best-effort conversion of OCI SDK model objects to plain dicts."""
     if obj is None:
         return None
-    try:
-        from oci.util import to_dict as oci_to_dict
+    from oci.util import to_dict as oci_to_dict
 
+    try:
         return oci_to_dict(obj)
     except Exception:
         pass
@@ -28,6 +31,56 @@ def _oci_to_dict(obj):
     return None
 
 
+class _RowReader:
+    """
+    Reads model fields from OCI SDK objects into dicts.
+
+    Each field lists candidate attribute names; the first one that is set
+    wins, even when its value is falsy.
+    OCI SDK models keep each value in a ``_<name>`` instance attribute behind
+    a property, so for them the attributes to read are resolved once per
+    class and fetched from the instance ``__dict__`` with one ``itemgetter``
+    call instead of a property call per field.
+    """
+
+    def __init__(self, fields: tuple[tuple[str, tuple[str, ...]], ...]):
+        self.fields = fields
+        self._readers: dict[type, Callable[[Any], dict]] = {}
+
+    def __call__(self, obj: Any) -> dict:
+        reader = self._readers.get(type(obj))
+        if reader is None:
+            reader = self._readers[type(obj)] = self._compile(obj)
+        return reader(obj)
+
+    def _compile(self, obj: Any) -> Callable[[Any], dict]:
+        cls = type(obj)
+        if not cls.__module__.startswith("oci."):
+            return self._read_any
+        names, slots = [], []
+        for name, candidates in self.fields:
+            for candidate in candidates:
+                if isinstance(getattr(cls, candidate, None), property):
+                    names.append(name)
+                    slots.append(f"_{candidate}")
+                    break
+        if len(slots) < 2 or not all(slot in vars(obj) for slot in slots):
+            return self._read_any
+        get = itemgetter(*slots)
+        return lambda item: dict(zip(names, get(item.__dict__)))
+
+    def _read_any(self, obj: Any) -> dict:
+        row = {}
+        for name, candidates in self.fields:
+            value = None
+            for candidate in candidates:
+                value = getattr(obj, candidate, None)
+                if value is not None:
+                    break
+            row[name] = value
+        return row
+
+
 # region SecretMetadata
 
 
@@ -61,6 +114,14 @@ class SecretMetadata(BaseModel):
     time_of_current_version: Optional[datetime] = Field(
         None, description="The date and time the current version was created."
     )
+    current_version_number: Optional[int] = Field(
+        None,
+        description="The version number of the current version. "
+        "Only returned by get_secret_metadata, not by listings.",
+    )
+    last_rotation_time: Optional[datetime] = Field(
+        None, description="The date and time the secret was last rotated by OCI."
+    )
     time_of_deletion: Optional[datetime] = Field(
         None, description="The scheduled deletion time of the secret."
     )
@@ -78,26 +139,186 @@ class SecretMetadata(BaseModel):
     )
 
 
+_read_secret_metadata = _RowReader(
+    (
+        ("id", ("id",)),
+        ("lifecycle_state", ("lifecycle_state",)),
+        ("vault_id", ("vault_id",)),
+        ("compartment_id", ("compartment_id",)),
+        ("name", ("secret_name", "name")),
+        ("description", ("description",)),
+        ("secret_version_count", ("secret_version_count",)),
+        ("time_created", ("time_created",)),
+        ("time_of_current_version", ("time_of_current_version",)),
+        ("current_version_number", ("current_version_number",)),
+        ("last_rotation_time", ("last_rotation_time",)),
+        ("time_of_deletion", ("time_of_deletion",)),
+        ("rotation_config", ("rotation_config",)),
+        ("freeform_tags", ("freeform_tags",)),
+        ("defined_tags", ("defined_tags",)),
+    )
+)
+_secret_metadata_list = TypeAdapter(List[SecretMetadata])
+
+
+def _secret_metadata_row(sm: Any) -> dict:
+    row = _read_secret_metadata(sm)
+    if row.get("rotation_config") is not None:
+        row["rotation_config"] = _oci_to_dict(row["rotation_config"])
+    return row
+
+
 def map_secret_metadata(
-    sm: oci.vault.models.SecretSummary,
+    sm: "oci.vault.models.SecretSummary",
 ) -> SecretMetadata:
     """
     Convert an oci.vault.models.SecretSummary to SecretMetadata.
     """
-    return SecretMetadata(
-        id=getattr(sm, "id", None),
-        lifecycle_state=getattr(sm, "lifecycle_state", None),
-        vault_id=getattr(sm, "vault_id", None),
-        compartment_id=getattr(sm, "compartment_id", None),
-        name=getattr(sm, "name", None),
-        description=getattr(sm, "description", None),
-        secret_version_count=getattr(sm, "secret_version_count", None),
-        time_created=getattr(sm, "time_created", None),
-        time_of_current_version=getattr(sm, "time_of_current_version", None),
-        time_of_deletion=getattr(sm, "time_of_deletion", None),
-        rotation_config=_oci_to_dict(getattr(sm, "rotation_config", None)),
-        freeform_tags=getattr(sm, "freeform_tags", None),
-        defined_tags=getattr(sm, "defined_tags", None),
+    return SecretMetadata(**_secret_metadata_row(sm))
+
+
+def map_secret_metadata_page(
+    items: Iterable["oci.vault.models.SecretSummary"],
+) -> List[SecretMetadata]:
+    """
+    Convert a page of OCI secret summaries to SecretMetadata.
+
+    The whole page is validated in a single call.
+    """
+    return _secret_metadata_list.validate_python(
+        [_secret_metadata_row(sm) for sm in items]
+    )
+
+
+class RegionalSecretMetadata(SecretMetadata):
+    """
+    The metadata for a secret, with the region it was listed in.
+    """
+
+    region: Optional[str] = Field(
+        None, description="The region the secret was listed in."
+    )
+
+
+_regional_secret_metadata_list = TypeAdapter(List[RegionalSecretMetadata])
+
+
+def map_regional_secret_metadata_page(
+    items: Iterable["oci.vault.models.SecretSummary"], region: Optional[str]
+) -> List[RegionalSecretMetadata]:
+    """
+    Convert a page of OCI secret summaries listed in ``region``.
+    """
+    rows = [_secret_metadata_row(sm) for sm in items]
+    for row in rows:
+        row["region"] = region
+    return _regional_secret_metadata_list.validate_python(rows)
+
+
+class SecretMetadataPage(BaseModel):
+    """
+    A single page of secret metadata returned in cursor mode.
+    """
+
+    items: List[SecretMetadata] = Field(..., description="The secrets on this page.")
+    next_page_token: Optional[str] = Field(
+        None,
+        description="Pass as page_token to fetch the next page. "
+        "None when there are no more pages.",
+    )
+
+
+class SecretSource(BaseModel):
+    """
+    One region, compartment and vault queried by a multi-vault listing.
+    """
+
+    region: Optional[str] = Field(None, description="The region queried.")
+    compartment_id: str = Field(..., description="The OCID of the compartment queried.")
+    vault_id: Optional[str] = Field(
+        None,
+        description="The OCID of the vault queried. None when every vault in the compartment was listed.",
+    )
+    secrets: int = Field(0, description="The number of matching secrets found.")
+    duration_ms: Optional[float] = Field(
+        None, description="How long the listing took, in milliseconds."
+    )
+    error: Optional[str] = Field(
+        None, description="The error that made this listing fail, if any."
+    )
+
+
+class SecretListing(BaseModel):
+    """
+    Secrets merged from several vaults, compartments and regions.
+    """
+
+    secrets: List[RegionalSecretMetadata] = Field(
+        ..., description="The secrets found, without duplicates."
+    )
+    sources: List[SecretSource] = Field(
+        ...,
+        description="Every region, compartment and vault queried, with its outcome.",
+    )
+    failed: int = Field(0, description="The number of sources that failed.")
+
+
+# endregion
+
+# region SecretFilter
+
+SecretLifecycleState = Literal[
+    "CREATING",
+    "ACTIVE",
+    "UPDATING",
+    "DELETING",
+    "DELETED",
+    "SCHEDULING_DELETION",
+    "PENDING_DELETION",
+    "CANCELLING_DELETION",
+    "FAILED",
+]
+
+
+class SecretFilter(BaseModel):
+    """
+    Conditions a listed secret must meet.
+
+    ``lifecycle_state`` and the sort order are sent to OCI; everything else
+    is checked page by page as the listing arrives.
+    """
+
+    lifecycle_state: Optional[SecretLifecycleState] = Field(
+        None, description="Only secrets in this lifecycle state."
+    )
+    tags: Optional[Dict[str, Optional[str]]] = Field(
+        None,
+        description="Only secrets with these tags. Keys are freeform tag names or "
+        "'namespace.key' for defined tags; a null value matches any value.",
+    )
+    name_prefix: Optional[str] = Field(
+        None, description="Only secrets whose name starts with this (case-insensitive)."
+    )
+    name_contains: Optional[str] = Field(
+        None, description="Only secrets whose name contains this (case-insensitive)."
+    )
+    created_after: Optional[datetime] = Field(
+        None, description="Only secrets created after this time."
+    )
+    created_before: Optional[datetime] = Field(
+        None, description="Only secrets created before this time."
+    )
+    rotated_after: Optional[datetime] = Field(
+        None, description="Only secrets last rotated by OCI after this time."
+    )
+    rotated_before: Optional[datetime] = Field(
+        None, description="Only secrets last rotated by OCI before this time."
+    )
+    sort_by: Optional[Literal["TIMECREATED", "NAME"]] = Field(
+        None, description="The field to sort by."
+    )
+    sort_order: Optional[Literal["ASC", "DESC"]] = Field(
+        None, description="The sort order."
     )
 
 
@@ -128,18 +349,52 @@ class SecretVersion(BaseModel):
     )
 
 
+_secret_version_list = TypeAdapter(List[SecretVersion])
+
+
 def map_secret_version(
-    sv: oci.vault.models.SecretVersionSummary,
+    sv: "oci.vault.models.SecretVersionSummary",
 ) -> SecretVersion:
     """
     Convert an oci.vault.models.SecretVersionSummary to SecretVersion.
     """
+    stages = getattr(sv, "stages", None)
+    if stages is None:
+        stages = getattr(sv, "version_stage", None)
     return SecretVersion(
         version_number=getattr(sv, "version_number", None),
         time_created=getattr(sv, "time_created", None),
         time_of_deletion=getattr(sv, "time_of_deletion", None),
         lifecycle_state=getattr(sv, "lifecycle_state", None),
-        version_stage=getattr(sv, "version_stage", None),
+        version_stage=stages,
+    )
+
+
+def map_secret_version_page(
+    items: Iterable["oci.vault.models.SecretVersionSummary"],
+) -> List[SecretVersion]:
+    """
+    Convert a page of OCI secret version summaries to SecretVersion.
+
+    Versions keep the per-item mapping: with five small fields, neither a
+    cached attribute reader nor validating the page in one call measured
+    faster in ``benchmarks/mapping.py``.
+    """
+    return [map_secret_version(sv) for sv in items]
+
+
+class SecretVersionPage(BaseModel):
+    """
+    A single page of secret versions returned in cursor mode.
+    """
+
+    items: List[SecretVersion] = Field(
+        ..., description="The secret versions on this page."
+    )
+    next_page_token: Optional[str] = Field(
+        None,
+        description="Pass as page_token to fetch the next page. "
+        "None when there are no more pages.",
     )
 
 
@@ -152,6 +407,180 @@ class Secret(BaseModel):
     versions: Optional[List[SecretVersion]] = Field(
         None, description="The versions of the secret."
     )
+    timings_ms: Optional[Dict[str, float]] = Field(
+        None,
+        description="Time in milliseconds spent on each OCI sub-request "
+        "(metadata, versions) and in total.",
+    )
+
+
+class SecretResult(BaseModel):
+    """
+    The outcome of fetching a single secret as part of a bulk request.
+    """
+
+    secret_id: Optional[str] = Field(None, description="The OCID of the secret.")
+    name: Optional[str] = Field(None, description="The name of the secret.")
+    metadata: Optional[SecretMetadata] = Field(
+        None, description="The metadata of the secret."
+    )
+    bundle: Optional[Dict[str, Any]] = Field(
+        None, description="The current secret bundle, if it was requested."
+    )
+    error: Optional[str] = Field(
+        None, description="The error that prevented this secret from being fetched."
+    )
+
+
+# endregion
+
+# region ChangeFeed
+
+
+class SecretChange(BaseModel):
+    """
+    A secret that changed since a timestamp or watermark.
+    """
+
+    secret_id: str = Field(..., description="The OCID of the secret.")
+    name: Optional[str] = Field(None, description="The name of the secret.")
+    change: Literal["created", "updated", "removed"] = Field(
+        ...,
+        description="'created' for new secrets, 'updated' for secrets whose metadata "
+        "or versions changed, 'removed' for secrets no longer listed.",
+    )
+    lifecycle_state: Optional[str] = Field(
+        None, description="The current lifecycle state of the secret."
+    )
+    versions: List[SecretVersion] = Field(
+        default_factory=list,
+        description="The versions created since the timestamp or watermark.",
+    )
+    error: Optional[str] = Field(
+        None, description="The error that prevented the versions from being listed."
+    )
+
+
+class ChangeFeed(BaseModel):
+    """
+    The secrets of a vault that changed since a timestamp or watermark.
+    """
+
+    changes: List[SecretChange] = Field(
+        default_factory=list, description="The changed secrets."
+    )
+    watermark: str = Field(
+        ..., description="Pass to the next changes_since call to continue from here."
+    )
+    since: Optional[datetime] = Field(
+        None, description="The time changes were looked for from."
+    )
+    scanned: int = Field(0, description="The number of secrets listed.")
+    skipped: int = Field(
+        0, description="The number of unchanged secrets whose versions were not listed."
+    )
+    version_listings: int = Field(
+        0, description="The number of secrets whose versions were listed."
+    )
+
+
+# endregion
+
+# region RotationReport
+
+
+class AgeBucket(BaseModel):
+    """
+    The number of secrets whose age falls in a range of days.
+    """
+
+    label: str = Field(..., description="The range, e.g. '30-90d'.")
+    min_days: int = Field(..., description="The lower bound of the range, in days.")
+    max_days: Optional[int] = Field(
+        None,
+        description="The upper bound of the range, in days. None for the last bucket.",
+    )
+    secrets: int = Field(0, description="The number of secrets in the range.")
+
+
+class RotationFinding(BaseModel):
+    """
+    A secret that is overdue for rotation.
+    """
+
+    secret_id: str = Field(..., description="The OCID of the secret.")
+    name: Optional[str] = Field(None, description="The name of the secret.")
+    vault_id: Optional[str] = Field(
+        None, description="The OCID of the vault that contains the secret."
+    )
+    region: Optional[str] = Field(
+        None, description="The region the secret was listed in."
+    )
+    age_days: float = Field(
+        ..., description="Days since the secret was last rotated, or created if never."
+    )
+    max_age_days: float = Field(
+        ...,
+        description="The age the secret should have been rotated by: its rotation "
+        "interval if scheduled rotation is enabled, otherwise the scan's max_age_days.",
+    )
+    age_confirmed: bool = Field(
+        False,
+        description="Whether the age was confirmed from the creation time of the "
+        "current version, which also covers versions created manually.",
+    )
+
+
+class RotationReport(BaseModel):
+    """
+    Rotation readiness of the secrets of one or more vaults.
+    """
+
+    as_of: datetime = Field(..., description="The time ages were measured at.")
+    max_age_days: float = Field(
+        ...,
+        description="The age after which secrets without scheduled rotation are overdue.",
+    )
+    scanned: int = Field(0, description="The number of secrets listed.")
+    lifecycle_states: Dict[str, int] = Field(
+        default_factory=dict,
+        description="The number of secrets in each lifecycle state.",
+    )
+    pending_deletion: int = Field(
+        0, description="The number of secrets scheduled for deletion."
+    )
+    age_buckets: List[AgeBucket] = Field(
+        default_factory=list,
+        description="The ages of secrets that are not deleted or scheduled for deletion.",
+    )
+    unknown_age: int = Field(
+        0,
+        description="The number of those secrets without a creation or rotation time.",
+    )
+    rotation_configured: int = Field(
+        0, description="The number of those secrets with a rotation configuration."
+    )
+    scheduled_rotation_enabled: int = Field(
+        0, description="The number of those secrets with scheduled rotation enabled."
+    )
+    overdue: int = Field(
+        0, description="The number of those secrets overdue for rotation."
+    )
+    possibly_overdue: int = Field(
+        0,
+        description="How many of the overdue secrets were only judged from listing "
+        "times; they may have had a version created manually since.",
+    )
+    oldest_overdue: List[RotationFinding] = Field(
+        default_factory=list,
+        description="The most overdue secrets, most overdue first. Secrets found "
+        "to have a recent current version are left out.",
+    )
+    sources: List[SecretSource] = Field(
+        default_factory=list,
+        description="Every region, compartment and vault scanned, with its outcome.",
+    )
+    failed: int = Field(0, description="The number of sources that failed.")
 
 
 # endregion
@@ -207,6 +636,55 @@ class CreateSecretVersionResponse(BaseModel):
     )
 
 
+# endregion
+
+# region SecretWrite
+
+
+class SecretWrite(BaseModel):
+    """
+    A secret to create or rotate as part of a bulk write.
+    """
+
+    name: Optional[str] = Field(
+        None,
+        description="The name of the secret. Created if no secret of this name exists in the vault.",
+    )
+    secret_id: Optional[str] = Field(
+        None, description="The OCID of an existing secret to rotate."
+    )
+    secret_value: str = Field(..., description="The secret value/content to store")
+    content_type: Optional[str] = Field(
+        None,
+        description="Accepted for compatibility. OCI Vault stores all secret content base64-encoded.",
+    )
+    description: Optional[str] = Field(
+        None, description="A brief description, used when the secret is created."
+    )
+
+
+class SecretWriteResult(BaseModel):
+    """
+    The outcome of one item of a bulk write.
+    """
+
+    name: Optional[str] = Field(None, description="The name of the secret.")
+    secret_id: Optional[str] = Field(None, description="The OCID of the secret.")
+    action: Optional[Literal["create", "rotate", "unchanged"]] = Field(
+        None,
+        description="What was done, or in a dry run what would be done: "
+        "'create' a secret, 'rotate' it to a new version, or leave it 'unchanged' "
+        "because its current content already matches.",
+    )
+    dry_run: bool = Field(False, description="Whether this was a dry run.")
+    version_number: Optional[int] = Field(
+        None, description="The new current version number after a rotation."
+    )
+    error: Optional[str] = Field(
+        None, description="The error that prevented this item from being written."
+    )
+
+
 # endregion
 
 # region UpdateSecretMetadataResponse
@@ -254,3 +732,92 @@ class DeleteSecretResponse(BaseModel):
 
 
 # endregion
+
+# region Projection
+
+
+class ProjectedPage(BaseModel):
+    """
+    A page of items reduced to the requested fields.
+    """
+
+    items: List[Dict[str, Any]] = Field(
+        ..., description="The items on this page, with only the requested fields."
+    )
+    next_page_token: Optional[str] = Field(
+        None,
+        description="Pass as page_token to fetch the next page. "
+        "None when there are no more pages.",
+    )
+
+
+class Table(BaseModel):
+    """
+    Items in columnar form: the field names once, then one row of values per item.
+    """
+
+    columns: List[str] = Field(..., description="The field names, in row order.")
+    rows: List[List[Any]] = Field(
+        ..., description="One list of values per item, in the order of columns."
+    )
+    next_page_token: Optional[str] = Field(
+        None,
+        description="Pass as page_token to fetch the next page. "
+        "None when there are no more pages or outside cursor mode.",
+    )
+
+
+_list_adapters = {
+    SecretMetadata: _secret_metadata_list,
+    SecretVersion: _secret_version_list,
+}
+
+
+def select_fields(
+    model: type[BaseModel], fields: Optional[Iterable[str]]
+) -> Optional[List[str]]:
+    """
+    Validate a field selection against a model.
+
+    Entries may themselves be comma-separated (``["id,name"]``). Returns the
+    field names in the requested order, or None when no selection was given.
+    """
+    if fields is None:
+        return None
+    names = []
+    for entry in fields:
+        for name in entry.split(","):
+            name = name.strip()
+            if name and name not in names:
+                names.append(name)
+    unknown = [name for name in names if name not in model.model_fields]
+    if unknown or not names:
+        raise ValueError(
+            f"Unknown fields for {model.__name__}: {', '.join(unknown) or '(none given)'}. "
+            f"Valid fields: {', '.join(model.model_fields)}"
+        )
+    return names
+
+
+def project(
+    items: List[BaseModel],
+    model: type[BaseModel],
+    fields: Optional[List[str]],
+    columnar: bool = False,
+) -> Any:
+    """
+    Reduce a list of models to plain rows of the selected fields.
+
+    The whole list is serialized in one call. Returns a list of dicts, or a
+    ``Table`` when ``columnar`` is set; ``fields`` of None selects every field.
+    """
+    names = fields or list(model.model_fields)
+    rows = _list_adapters[model].dump_python(
+        items, mode="json", include={"__all__": set(names)}
+    )
+    if columnar:
+        return Table(columns=names, rows=[[row[n] for n in names] for row in rows])
+    return rows
+
+
+# endregion
@@ -0,0 +1,164 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import base64
+import contextvars
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from oracle.oci_vault_mcp_server.metrics import (
+    LIST_PAGE_DURATION,
+    LIST_PAGE_MAPPING,
+    LIST_PAGES,
+    metrics,
+)
+
+# Page size requested from OCI list operations, independent of result limits
+default_page_size = int(os.getenv("OCI_VAULT_PAGE_SIZE", "1000"))
+
+_prefetch_workers = int(os.getenv("OCI_VAULT_PREFETCH_WORKERS", "8"))
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetch_lock = threading.Lock()
+
+
+def _fingerprint(query: tuple) -> str:
+    return hashlib.sha256(repr(query).encode()).hexdigest()[:16]
+
+
+def encode_page_token(next_page: Optional[str], query: tuple) -> Optional[str]:
+    """
+    Wrap an OCI ``next_page`` value in an opaque continuation token.
+
+    The token is bound to ``query`` so it cannot be replayed against a
+    different vault, compartment or secret.
+    """
+    if not next_page:
+        return None
+    payload = json.dumps({"p": next_page, "q": _fingerprint(query)})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_page_token(token: Optional[str], query: tuple) -> Optional[str]:
+    """Return the OCI ``page`` wrapped by ``token`` after checking its query."""
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        next_page, fingerprint = payload["p"], payload["q"]
+    except Exception:
+        raise ValueError("page_token is not a valid continuation token")
+    if fingerprint != _fingerprint(query):
+        raise ValueError("page_token was issued for a different query")
+    return next_page
+
+
+def _prefetcher() -> ThreadPoolExecutor:
+    global _prefetch_executor
+    with _prefetch_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(
+                max_workers=_prefetch_workers, thread_name_prefix="oci-vault-prefetch"
+            )
+        return _prefetch_executor
+
+
+def collect_pages(
+    list_call: Callable[..., Any],
+    map_item: Optional[Callable[[Any], Any]] = None,
+    limit: Optional[int] = None,
+    page: Optional[str] = None,
+    single_page: bool = False,
+    on_page: Optional[Callable[[list, int], None]] = None,
+    page_size: Optional[int] = None,
+    prefetch: bool = True,
+    until: Optional[Callable[[list], bool]] = None,
+    map_page: Optional[Callable[[list], list]] = None,
+    where: Optional[Callable[[Any], bool]] = None,
+    **kwargs,
+) -> tuple[list, Optional[str]]:
+    """
+    Call an OCI ``list_*`` operation page by page and map every item.
+
+    Items are mapped one by one with ``map_item``, or a page at a time with
+    ``map_page``.
+
+    Returns at most ``limit`` mapped items and the ``next_page`` of the last
+    response, which is ``None`` once the listing is exhausted. With
+    ``single_page`` only the page starting at ``page`` is fetched. ``on_page``
+    is called with each mapped page and the running total as soon as the page
+    arrives.
+
+    Pages are requested with ``page_size`` items (never more than still needed
+    to reach ``limit``), independent of ``limit``. While one page is being
+    mapped the next one is already being fetched in the background.
+
+    If ``until`` returns true for a page of raw items, no further pages are
+    fetched.
+
+    With ``where``, only mapped items it returns true for are kept, page by
+    page, and ``limit`` counts kept items. Full pages are requested then. In
+    single-page mode the page is requested with at most ``limit`` items and
+    returned whole, so no match is cut off before ``next_page``; it may hold
+    fewer than ``limit`` items.
+    """
+    page_size = page_size or default_page_size
+    operation = getattr(list_call, "__name__", "list")
+
+    def request(page_token: Optional[str], fetched: int):
+        if limit is None or (where is not None and not single_page):
+            page_limit = page_size
+        else:
+            page_limit = min(page_size, limit - fetched)
+        metrics.inc(LIST_PAGES, operation=operation)
+        with metrics.timed(LIST_PAGE_DURATION, operation=operation):
+            return list_call(page=page_token, limit=page_limit, **kwargs)
+
+    items: list = []
+    fetched = 0
+    response = request(page, fetched)
+
+    while True:
+        fetched += len(response.data)
+        next_page = response.next_page if response.has_next_page else None
+        more = (
+            not single_page
+            and next_page is not None
+            and (limit is None or where is not None or fetched < limit)
+            and (until is None or not until(response.data))
+        )
+        pending = None
+        # A filtered listing with a limit may be done after this page
+        if more and prefetch and (where is None or limit is None):
+            context = contextvars.copy_context()
+            pending = _prefetcher().submit(context.run, request, next_page, fetched)
+
+        data = response.data
+        if limit is not None and where is None:
+            data = data[: limit - len(items)]
+        with metrics.timed(LIST_PAGE_MAPPING, operation=operation):
+            if map_page is not None:
+                mapped = map_page(data)
+            else:
+                mapped = [map_item(item) for item in data]
+            if where is not None:
+                mapped = [item for item in mapped if where(item)]
+                # The rest of a single page would be lost behind next_page
+                if limit is not None and not single_page:
+                    mapped = mapped[: limit - len(items)]
+        items.extend(mapped)
+        if on_page is not None:
+            on_page(mapped, len(items))
+
+        if not more or (limit is not None and len(items) >= limit):
+            break
+        response = pending.result() if pending else request(next_page, fetched)
+
+    return items, next_page
@@ -0,0 +1,235 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import heapq
+import itertools
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, Optional
+
+from oracle.oci_vault_mcp_server.models import (
+    AgeBucket,
+    RotationFinding,
+    RotationReport,
+    SecretMetadata,
+)
+
+# Upper bounds of the default age buckets, in days
+DEFAULT_AGE_BUCKETS = (30, 90, 180, 365)
+
+# Secrets in these states are counted, but not judged on their age
+_PENDING_DELETION = {"SCHEDULING_DELETION", "PENDING_DELETION"}
+_GONE = {"DELETING", "DELETED"}
+
+# Overdue secrets kept per reported one, to replace those whose confirmed age
+# shows a recent version
+_SPARE_FINDINGS = 4
+
+# OCI rotation intervals are ISO 8601 durations in days, e.g. P30D
+_INTERVAL = re.compile(r"^P(?:(\d+)W)?(?:(\d+)D)?$")
+
+
+def rotation_interval_days(rotation_config: Optional[dict]) -> Optional[float]:
+    """Return the scheduled rotation interval of a secret, or None if it has none."""
+    if not rotation_config or not rotation_config.get("is_scheduled_rotation_enabled"):
+        return None
+    match = _INTERVAL.match(str(rotation_config.get("rotation_interval") or ""))
+    if match is None or not any(match.groups()):
+        return None
+    weeks, days = (int(g or 0) for g in match.groups())
+    return float(weeks * 7 + days)
+
+
+def secret_age_days(secret: SecretMetadata, now: datetime) -> Optional[float]:
+    """Days since the secret was last rotated, or created if it never was."""
+    changed = max(
+        (
+            t
+            for t in (
+                secret.last_rotation_time,
+                secret.time_of_current_version,
+                secret.time_created,
+            )
+            if t is not None
+        ),
+        default=None,
+    )
+    if changed is None:
+        return None
+    return (now - changed).total_seconds() / 86400
+
+
+class RotationScan:
+    """
+    Running rotation-readiness totals over a stream of listed secrets.
+
+    Only counters and a multiple of the ``top`` most overdue secrets are
+    kept, so memory does not grow with the number of secrets added. Scans of
+    separate vaults can run independently and be combined with :meth:`merge`.
+    """
+
+    def __init__(
+        self,
+        now: datetime,
+        max_age_days: float = 90,
+        buckets: Iterable[int] = DEFAULT_AGE_BUCKETS,
+        top: int = 20,
+    ):
+        self.now = now
+        self.max_age_days = max_age_days
+        self.bounds = sorted(set(buckets))
+        self.top = top
+        self.kept = top * _SPARE_FINDINGS
+        self.scanned = 0
+        self.lifecycle_states: Counter = Counter()
+        self.pending_deletion = 0
+        self.bucket_counts = [0] * (len(self.bounds) + 1)
+        self.unknown_age = 0
+        self.rotation_configured = 0
+        self.scheduled_rotation_enabled = 0
+        self.overdue = 0
+        # Min-heap of (days overdue, secret OCID, tie-breaker, finding)
+        self._overdue: list[tuple[float, str, int, RotationFinding]] = []
+        self._sequence = itertools.count()
+
+    def add(self, secret: SecretMetadata):
+        self.scanned += 1
+        state = secret.lifecycle_state or "UNKNOWN"
+        self.lifecycle_states[state] += 1
+        if state in _PENDING_DELETION:
+            self.pending_deletion += 1
+            return
+        if state in _GONE:
+            return
+
+        if secret.rotation_config:
+            self.rotation_configured += 1
+        interval = rotation_interval_days(secret.rotation_config)
+        if interval is not None:
+            self.scheduled_rotation_enabled += 1
+
+        age = secret_age_days(secret, self.now)
+        if age is None:
+            self.unknown_age += 1
+            return
+        self.bucket_counts[self._bucket(age)] += 1
+
+        limit = interval if interval is not None else self.max_age_days
+        if age <= limit:
+            return
+        self.overdue += 1
+        if self.top <= 0:
+            return
+        days_overdue = age - limit
+        if len(self._overdue) >= self.kept and days_overdue <= self._overdue[0][0]:
+            return
+        finding = RotationFinding(
+            secret_id=secret.id or "",
+            name=secret.name,
+            vault_id=secret.vault_id,
+            region=getattr(secret, "region", None),
+            age_days=round(age, 2),
+            max_age_days=limit,
+        )
+        self._push(days_overdue, finding)
+
+    def _bucket(self, age: float) -> int:
+        return next(
+            (i for i, bound in enumerate(self.bounds) if age < bound), len(self.bounds)
+        )
+
+    def _push(self, days_overdue: float, finding: RotationFinding):
+        entry = (days_overdue, finding.secret_id, next(self._sequence), finding)
+        if len(self._overdue) < self.kept:
+            heapq.heappush(self._overdue, entry)
+        elif entry > self._overdue[0]:
+            heapq.heapreplace(self._overdue, entry)
+
+    def add_page(self, secrets: Iterable[SecretMetadata]) -> list:
+        """Add a page of secrets and return an empty page, so none are kept."""
+        for secret in secrets:
+            self.add(secret)
+        return []
+
+    def merge(self, other: "RotationScan"):
+        """Add the totals of a scan run with the same settings."""
+        self.scanned += other.scanned
+        self.lifecycle_states.update(other.lifecycle_states)
+        self.pending_deletion += other.pending_deletion
+        self.bucket_counts = [
+            a + b for a, b in zip(self.bucket_counts, other.bucket_counts)
+        ]
+        self.unknown_age += other.unknown_age
+        self.rotation_configured += other.rotation_configured
+        self.scheduled_rotation_enabled += other.scheduled_rotation_enabled
+        self.overdue += other.overdue
+        for days_overdue, _, _, finding in other._overdue:
+            self._push(days_overdue, finding)
+
+    def findings(self) -> list[RotationFinding]:
+        """Return the ``top`` most overdue secrets, most overdue first."""
+        entries = heapq.nlargest(self.top, self._overdue)
+        return [entry[-1] for entry in entries]
+
+    def confirm(self, secret_id: str, changed: datetime):
+        """
+        Re-age a kept overdue secret from the time its current version was
+        created, which listings do not show.
+
+        A secret that turns out to be rotated in time is no longer overdue.
+        """
+        for index, (days_overdue, kept_id, sequence, finding) in enumerate(
+            self._overdue
+        ):
+            if kept_id == secret_id:
+                break
+        else:
+            return
+        listed_age = days_overdue + finding.max_age_days
+        age = min(listed_age, (self.now - changed).total_seconds() / 86400)
+        self.bucket_counts[self._bucket(listed_age)] -= 1
+        self.bucket_counts[self._bucket(age)] += 1
+        if age <= finding.max_age_days:
+            self.overdue -= 1
+            del self._overdue[index]
+        else:
+            finding.age_days = round(age, 2)
+            finding.age_confirmed = True
+            entry = (age - finding.max_age_days, kept_id, sequence, finding)
+            self._overdue[index] = entry
+        heapq.heapify(self._overdue)
+
+    def age_buckets(self) -> list[AgeBucket]:
+        lower = [0] + self.bounds
+        upper: list[Optional[int]] = list(self.bounds) + [None]
+        return [
+            AgeBucket(
+                label=f"{low}-{high}d" if high is not None else f"{low}d+",
+                min_days=low,
+                max_days=high,
+                secrets=count,
+            )
+            for low, high, count in zip(lower, upper, self.bucket_counts)
+        ]
+
+    def report(self) -> RotationReport:
+        findings = self.findings()
+        confirmed = sum(1 for entry in self._overdue if entry[-1].age_confirmed)
+        return RotationReport(
+            as_of=self.now,
+            max_age_days=self.max_age_days,
+            scanned=self.scanned,
+            lifecycle_states=dict(self.lifecycle_states),
+            pending_deletion=self.pending_deletion,
+            age_buckets=self.age_buckets(),
+            unknown_age=self.unknown_age,
+            rotation_configured=self.rotation_configured,
+            scheduled_rotation_enabled=self.scheduled_rotation_enabled,
+            overdue=self.overdue,
+            possibly_overdue=self.overdue - confirmed,
+            oldest_overdue=findings,
+        )
@@ -4,91 +4,500 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import asyncio
+import base64
+import contextvars
+import hashlib
+import hmac
+import json
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from logging import Logger
-from typing import Optional
-
-import oci
-from fastmcp import FastMCP
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, Optional, Union
+
+from fastmcp import Context, FastMCP
+from fastmcp.server.dependencies import get_access_token, get_http_headers
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from oracle.oci_vault_mcp_server.bundles import (
+    bundle_cache,
+    content_allowlist,
+    decode_content,
+    zeroize,
+)
+from oracle.oci_vault_mcp_server.cache import (
+    TTLCache,
+    metadata_cache,
+    secret_tag,
+    vault_tag,
+)
+from oracle.oci_vault_mcp_server.changes import (
+    change_tracker,
+    moved_since,
+    secret_fingerprint,
+)
+from oracle.oci_vault_mcp_server.clients import (
+    IDENTITY_CLIENT,
+    SECRETS_CLIENT,
+    VAULTS_CLIENT,
+    client_pool,
+)
+from oracle.oci_vault_mcp_server.concurrency import (
+    blocking,
+    map_bounded,
+    single_flight,
+)
+from oracle.oci_vault_mcp_server.filters import (
+    oci_filter_params,
+    secret_predicate,
+    sort_secrets,
+)
+from oracle.oci_vault_mcp_server.index import VaultIndex, index_enabled, secret_index
+from oracle.oci_vault_mcp_server.metrics import (
+    TOOL_CALLS,
+    TOOL_DURATION,
+    TOOL_ERRORS,
+    metrics,
+)
 from oracle.oci_vault_mcp_server.models import (
+    ChangeFeed,
     CreateSecretResponse,
     CreateSecretVersionResponse,
     DeleteSecretResponse,
+    ProjectedPage,
+    RegionalSecretMetadata,
+    RotationFinding,
+    RotationReport,
     Secret,
+    SecretChange,
+    SecretFilter,
+    SecretLifecycleState,
+    SecretListing,
     SecretMetadata,
+    SecretMetadataPage,
+    SecretResult,
+    SecretSource,
     SecretVersion,
+    SecretVersionPage,
+    SecretWrite,
+    SecretWriteResult,
+    Table,
     UpdateSecretMetadataResponse,
     map_secret_metadata,
-    map_secret_version,
+    map_regional_secret_metadata_page,
+    map_secret_metadata_page,
+    map_secret_version_page,
+    project,
+    select_fields,
+)
+from oracle.oci_vault_mcp_server.pagination import (
+    collect_pages,
+    decode_page_token,
+    encode_page_token,
 )
+from oracle.oci_vault_mcp_server.rotation import DEFAULT_AGE_BUCKETS, RotationScan
+from oracle.oci_vault_mcp_server.sessions import VaultContext, api_key_session, sessions
+from oracle.oci_vault_mcp_server.snapshot import snapshot_store
 from pydantic import Field
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
-from . import __project__, __version__
+from . import __project__
+
+if TYPE_CHECKING:
+    import oci
 
 logger = Logger(__name__, level="INFO")
 
 mcp = FastMCP(name=__project__)
 
-# Global configuration for vault and compartment
-# These can be set via environment variables or MCP settings
-_default_vault_id = os.getenv("OCI_VAULT_ID")
-_default_compartment_id = os.getenv("OCI_COMPARTMENT_ID")
-
 
-def set_vault_config(vault_id: str, compartment_id: str):
-    """Set the default vault and compartment for all operations."""
-    global _default_vault_id, _default_compartment_id
-    _default_vault_id = vault_id
-    _default_compartment_id = compartment_id
+class MetricsMiddleware(Middleware):
+    """Records the call count, error count and latency of every tool call."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        tool = context.message.name
+        metrics.inc(TOOL_CALLS, tool=tool)
+        start = time.perf_counter()
+        try:
+            return await call_next(context)
+        except Exception:
+            metrics.inc(TOOL_ERRORS, tool=tool)
+            raise
+        finally:
+            metrics.observe(TOOL_DURATION, time.perf_counter() - start, tool=tool)
+
+
+def _session_key(context: MiddlewareContext) -> Optional[str]:
+    """Identify the tenant of a request: its OAuth client, API key or MCP session."""
+    access_token = get_access_token()
+    if access_token is not None and access_token.client_id:
+        return f"client:{access_token.client_id}"
+    api_key = get_http_headers().get(_session_key_header)
+    if api_key:
+        return api_key_session(api_key)
+    ctx = context.fastmcp_context
+    if ctx is not None and ctx.request_context is not None:
+        return f"session:{ctx.session_id}"
+    return None
+
+
+class SessionMiddleware(Middleware):
+    """Serves every tool call with the vault configuration of its session."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        with sessions.bind(_session_key(context)):
+            return await call_next(context)
+
+
+mcp.add_middleware(MetricsMiddleware())
+mcp.add_middleware(SessionMiddleware())
+metrics.register_stats("client_pool", client_pool.stats)
+metrics.register_stats("metadata_cache", metadata_cache.stats)
+metrics.register_stats("executor", blocking.stats)
+metrics.register_stats("secret_index", secret_index.stats)
+metrics.register_stats("bundle_cache", bundle_cache.stats)
+metrics.register_stats("throttling", client_pool.guards.stats)
+metrics.register_stats("single_flight", single_flight.stats)
+metrics.register_stats("sessions", sessions.stats)
+
+# HTTP header whose value selects a per-API-key configuration
+_session_key_header = os.getenv("OCI_VAULT_SESSION_KEY_HEADER", "x-api-key").lower()
+
+# Maximum number of secrets fetched concurrently by a bulk request
+_bulk_concurrency = int(os.getenv("OCI_VAULT_BULK_CONCURRENCY", "16"))
+
+# Maximum number of listings run at once by a multi-vault listing
+_fanout_concurrency = int(os.getenv("OCI_VAULT_FANOUT_CONCURRENCY", "8"))
+
+# Maximum number of secrets written concurrently by a bulk write
+_write_concurrency = int(os.getenv("OCI_VAULT_WRITE_CONCURRENCY", "8"))
+
+
+def set_vault_config(
+    vault_id: str,
+    compartment_id: str,
+    profile: Optional[str] = None,
+    region: Optional[str] = None,
+) -> VaultContext:
+    """Set the default vault and compartment of the current session."""
+    context = sessions.configure_current(
+        vault_id=vault_id, compartment_id=compartment_id, profile=profile, region=region
+    )
     logger.info(
         f"Vault config updated: vault_id={vault_id}, compartment_id={compartment_id}"
     )
+    return context
 
 
 def get_vault_config() -> tuple[Optional[str], Optional[str]]:
-    """Get the current vault and compartment configuration."""
-    return _default_vault_id, _default_compartment_id
+    """Get the vault and compartment configuration of the current session."""
+    context = sessions.current()
+    return context.vault_id, context.compartment_id
+
+
+def _default_vault(vault_id: Optional[str]) -> Optional[str]:
+    return vault_id or sessions.current().vault_id
+
+
+def _namespace() -> str:
+    """Cache namespace of the current session's credentials."""
+    return sessions.current().namespace
+
+
+def _snapshot_allowed() -> bool:
+    # The snapshot only holds listings made with the default credentials
+    return _namespace() == ""
+
+
+def _resolve_vault(
+    vault_id: Optional[str], compartment_id: Optional[str]
+) -> tuple[str, str]:
+    """Return the given vault and compartment or the session's defaults."""
+    context = sessions.current()
+    effective_vault_id = vault_id or context.vault_id
+    effective_compartment_id = compartment_id or context.compartment_id
+
+    if not effective_vault_id:
+        raise ValueError(
+            "vault_id is required. Either provide vault_id parameter, call configure_vault or set OCI_VAULT_ID environment variable"
+        )
+    if not effective_compartment_id:
+        raise ValueError(
+            "compartment_id is required. Either provide compartment_id parameter, call configure_vault or set OCI_COMPARTMENT_ID environment variable"
+        )
+    return effective_vault_id, effective_compartment_id
 
 
-def get_vault_client():
-    logger.info("entering get_vault_client")
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
+def _session_client(client_type: str, region: Optional[str]):
+    context = sessions.current()
+    return client_pool.get(
+        client_type, profile=context.profile, region=region or context.region
     )
 
-    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
-    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
 
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
-    token_file = os.path.expanduser(config["security_token_file"])
-    token = None
-    with open(token_file, "r") as f:
-        token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    return oci.vault.VaultsClient(config, signer=signer)
+def get_vault_client(region: Optional[str] = None):
+    """Return the pooled VaultsClient for the session's profile."""
+    return _session_client(VAULTS_CLIENT, region)
+
+
+def get_secrets_client(region: Optional[str] = None):
+    """Return the pooled SecretsClient for the session's profile."""
+    return _session_client(SECRETS_CLIENT, region)
+
+
+def get_identity_client(region: Optional[str] = None):
+    """Return the pooled IdentityClient for the session's profile."""
+    return _session_client(IDENTITY_CLIENT, region)
+
+
+# Vault of recently seen secrets, for the per-vault concurrency limit. It is
+# kept in-process, so looking it up on the event loop never waits on a shared
+# cache backend, and a secret never moves to another vault.
+_secret_vaults = TTLCache(
+    max_entries=int(os.getenv("OCI_VAULT_CACHE_MAX_ENTRIES", "1024")) * 8,
+    ttl=3600.0,
+)
+
+
+def _remember_vaults(secrets: Iterable[SecretMetadata]):
+    for secret in secrets:
+        if secret.id and secret.vault_id:
+            _secret_vaults.set(secret.id, secret.vault_id)
+
+
+def _cache_metadata_list(key: tuple, secrets: list[SecretMetadata], vault_id: str):
+    tags = [vault_tag(vault_id)] + [secret_tag(s.id) for s in secrets]
+    metadata_cache.set(key, list(secrets), tags=tags)
+    _remember_vaults(secrets)
+
+
+def invalidate_secret(secret_id: str, vault_id: Optional[str] = None):
+    """Drop cached metadata for a secret and, if known, the listings of its vault."""
+    metadata_cache.invalidate_tag(secret_tag(secret_id))
+    metadata_cache.invalidate_tag(vault_tag(vault_id))
+    snapshot_store.forget(secret_id, vault_id)
+    single_flight.forget()
+
+
+def _in_background(fn: Callable, *args):
+    """Run ``fn`` on the OCI thread pool without waiting for it."""
+
+    def run():
+        try:
+            fn(*args)
+        except Exception as e:
+            logger.error(f"Error in background {fn.__name__}: {str(e)}")
+
+    # Keep the caller's session, so the work uses its credentials
+    blocking.executor.submit(contextvars.copy_context().run, run)
+
+
+def _vault_of_secret(secret_id: str) -> Optional[str]:
+    """
+    Best-effort vault lookup used to apply the per-vault concurrency limit.
+
+    Secrets not seen yet count against the session's default vault, so a
+    burst of first calls is still limited.
+    """
+    return _secret_vaults.peek(secret_id) or sessions.current().vault_id
 
 
-def get_secrets_client():
-    logger.info("entering get_secrets_client")
-    config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
+def _page_reporter(
+    ctx: Optional[Context],
+    fields: Optional[list[str]] = None,
+) -> Optional[Callable[[list, int], None]]:
+    """
+    Return an on_page callback that sends every page to the client as progress.
+
+    ``fields`` must already have been validated with ``select_fields``.
+    """
+    if ctx is None:
+        return None
+    loop = asyncio.get_running_loop()
+    include = set(fields) if fields else None
+
+    def on_page(items: list, total: int):
+        message = json.dumps(
+            [item.model_dump(mode="json", include=include) for item in items]
+        )
+        future = asyncio.run_coroutine_threadsafe(
+            ctx.report_progress(progress=total, message=message), loop
+        )
+        try:
+            # Wait so a slow client applies back-pressure to the listing
+            future.result()
+        except Exception as e:
+            logger.error(f"Error reporting page progress: {str(e)}")
+
+    return on_page
+
+
+def _project_result(
+    result: Union[list, SecretMetadataPage, SecretVersionPage],
+    model: type,
+    fields: Optional[list[str]],
+    columnar: bool,
+):
+    """Apply a validated field selection and output mode to a list tool result."""
+    if fields is None and not columnar:
+        return result
+    if not isinstance(result, (SecretMetadataPage, SecretVersionPage)):
+        return project(result, model, fields, columnar)
+    projected = project(result.items, model, fields, columnar)
+    if columnar:
+        projected.next_page_token = result.next_page_token
+        return projected
+    return ProjectedPage(items=projected, next_page_token=result.next_page_token)
+
+
+def _list_secret_metadata(
+    tool: str,
+    query: dict,
+    limit: Optional[int],
+    bypass_cache: bool,
+    page_token: Optional[str],
+    cursor: bool,
+    on_page: Optional[Callable[[list, int], None]],
+    secret_filter: Optional[SecretFilter] = None,
+) -> Union[list[SecretMetadata], SecretMetadataPage]:
+    """Shared implementation of list_secrets and search_secrets."""
+    query_key = (tool, _namespace()) + tuple(query.values())
+    filtered = secret_filter is not None and secret_filter != SecretFilter()
+    if filtered:
+        query_key += (secret_filter.model_dump_json(exclude_none=True),)
+    cursor = cursor or page_token is not None
+
+    cache_key = query_key + (limit,)
+    if not cursor and not bypass_cache:
+        cached = metadata_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Found {len(cached)} Secrets (cached)")
+            return list(cached)
+        if (
+            tool == "list_secrets"
+            and on_page is None
+            and not filtered
+            and _snapshot_allowed()
+        ):
+            # After a restart, answer from the snapshot and reconcile behind it
+            snapshot = snapshot_store.take_secrets(
+                query["vault_id"], query["compartment_id"]
+            )
+            if snapshot is not None:
+                _cache_metadata_list(query_key + (None,), snapshot, query["vault_id"])
+                _in_background(
+                    _list_secret_metadata, tool, query, None, True, None, False, None
+                )
+                secrets = snapshot[:limit] if limit is not None else snapshot
+                logger.info(f"Found {len(secrets)} Secrets (snapshot)")
+                return secrets
+
+    # Identical listings already running are joined rather than repeated;
+    # joined callers get the result but no page progress of their own
+    return single_flight.do(
+        query_key + (limit, page_token, cursor),
+        _fetch_secret_listing,
+        tool,
+        query,
+        query_key,
+        limit,
+        page_token,
+        cursor,
+        on_page,
+        secret_filter if filtered else None,
     )
 
-    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
-    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
 
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
-    token_file = os.path.expanduser(config["security_token_file"])
-    token = None
-    with open(token_file, "r") as f:
-        token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    return oci.secrets.SecretsClient(config, signer=signer)
+def _fetch_secret_listing(
+    tool: str,
+    query: dict,
+    query_key: tuple,
+    limit: Optional[int],
+    page_token: Optional[str],
+    cursor: bool,
+    on_page: Optional[Callable[[list, int], None]],
+    secret_filter: Optional[SecretFilter],
+) -> Union[list[SecretMetadata], SecretMetadataPage]:
+    client = get_vault_client()
+    # OCI applies the lifecycle state and sort order; the rest is checked per page
+    secrets, next_page = collect_pages(
+        client.list_secrets,
+        map_page=map_secret_metadata_page,
+        limit=limit,
+        page=decode_page_token(page_token, query_key),
+        single_page=cursor,
+        on_page=on_page,
+        where=secret_predicate(secret_filter),
+        **query,
+        **oci_filter_params(secret_filter),
+    )
+    logger.info(f"Found {len(secrets)} Secrets")
+
+    if cursor:
+        _remember_vaults(secrets)
+        return SecretMetadataPage(
+            items=secrets,
+            next_page_token=encode_page_token(next_page, query_key),
+        )
+    _cache_metadata_list(query_key + (limit,), secrets, query["vault_id"])
+    if (
+        snapshot_store.enabled
+        and tool == "list_secrets"
+        and limit is None
+        and secret_filter is None
+        and _snapshot_allowed()
+    ):
+        _in_background(
+            snapshot_store.save_secrets,
+            query["vault_id"],
+            query["compartment_id"],
+            secrets,
+        )
+    return secrets
+
+
+def _list_secrets(
+    vault_id: Optional[str],
+    compartment_id: Optional[str],
+    limit: Optional[int],
+    bypass_cache: bool,
+    page_token: Optional[str] = None,
+    cursor: bool = False,
+    on_page: Optional[Callable[[list, int], None]] = None,
+    fields: Optional[list[str]] = None,
+    columnar: bool = False,
+    secret_filter: Optional[SecretFilter] = None,
+) -> Union[list[SecretMetadata], SecretMetadataPage, list[dict], ProjectedPage, Table]:
+    try:
+        fields = select_fields(SecretMetadata, fields)
+        # Use provided values or fall back to defaults
+        effective_vault_id, effective_compartment_id = _resolve_vault(
+            vault_id, compartment_id
+        )
+        query = {
+            "vault_id": effective_vault_id,
+            "compartment_id": effective_compartment_id,
+        }
+        secrets = _list_secret_metadata(
+            "list_secrets",
+            query,
+            limit,
+            bypass_cache,
+            page_token,
+            cursor,
+            on_page,
+            secret_filter,
+        )
+        return _project_result(secrets, SecretMetadata, fields, columnar)
+
+    except Exception as e:
+        logger.error(f"Error in list_secrets tool: {str(e)}")
+        raise e
 
 
 @mcp.tool(description="Lists all secrets in a vault")
-def list_secrets(
+async def list_secrets(
     vault_id: Optional[str] = Field(
         None,
         description="The OCID of the vault. If not provided, uses the configured default vault.",
@@ -99,58 +508,209 @@ def list_secrets(
     ),
     limit: Optional[int] = Field(
         None,
-        description="The maximum number of secrets to return. If None, there is no limit.",
+        description="The maximum number of secrets to return. If None, there is no limit. In cursor mode, the page size.",
         ge=1,
     ),
-) -> list[SecretMetadata]:
-    secrets: list[SecretMetadata] = []
-
+    bypass_cache: bool = Field(
+        False,
+        description="Skip the metadata cache and read directly from OCI.",
+    ),
+    page_token: Optional[str] = Field(
+        None,
+        description="The continuation token returned by a previous call. Implies cursor mode.",
+    ),
+    cursor: bool = Field(
+        False,
+        description="Return a single page and a continuation token instead of the full list.",
+    ),
+    stream: bool = Field(
+        False,
+        description="Send each page to the client as a progress notification as soon as it arrives.",
+    ),
+    fields: Optional[list[str]] = Field(
+        None,
+        description="Only return these fields of each secret, e.g. id, name, lifecycle_state. "
+        "Entries may be comma-separated. If None, every field is returned.",
+    ),
+    columnar: bool = Field(
+        False,
+        description="Return a table of column names and one row of values per secret instead of a list of objects.",
+    ),
+    lifecycle_state: Optional[SecretLifecycleState] = Field(
+        None,
+        description="Only return secrets in this lifecycle state (applied by OCI).",
+    ),
+    name_prefix: Optional[str] = Field(
+        None,
+        description="Only return secrets whose name starts with this (case-insensitive).",
+    ),
+    created_after: Optional[datetime] = Field(
+        None,
+        description="Only return secrets created after this time (ISO 8601, UTC if no offset is given).",
+    ),
+    created_before: Optional[datetime] = Field(
+        None,
+        description="Only return secrets created before this time.",
+    ),
+    rotated_after: Optional[datetime] = Field(
+        None,
+        description="Only return secrets last rotated by OCI after this time.",
+    ),
+    rotated_before: Optional[datetime] = Field(
+        None,
+        description="Only return secrets last rotated by OCI before this time.",
+    ),
+    sort_by: Optional[Literal["TIMECREATED", "NAME"]] = Field(
+        None,
+        description="Sort by creation time or name (applied by OCI).",
+    ),
+    sort_order: Optional[Literal["ASC", "DESC"]] = Field(
+        None,
+        description="The sort order (applied by OCI).",
+    ),
+    tags: Optional[dict[str, Optional[str]]] = Field(
+        None,
+        description="Only return secrets with these tags. Keys are freeform tag names or "
+        "'namespace.key' for defined tags; a null value matches any value.",
+    ),
+    ctx: Context = None,
+) -> Union[list[SecretMetadata], SecretMetadataPage, list[dict], ProjectedPage, Table]:
     try:
-        # Use provided values or fall back to defaults
-        effective_vault_id = vault_id or _default_vault_id
-        effective_compartment_id = compartment_id or _default_compartment_id
-
-        if not effective_vault_id:
-            raise ValueError(
-                "vault_id is required. Either provide vault_id parameter or set OCI_VAULT_ID environment variable"
-            )
-        if not effective_compartment_id:
-            raise ValueError(
-                "compartment_id is required. Either provide compartment_id parameter or set OCI_COMPARTMENT_ID environment variable"
-            )
+        # Validated before any page is listed or streamed
+        fields = select_fields(SecretMetadata, fields)
+    except Exception as e:
+        logger.error(f"Error in list_secrets tool: {str(e)}")
+        raise e
+    return await blocking.run(
+        _list_secrets,
+        vault_id,
+        compartment_id,
+        limit,
+        bypass_cache,
+        page_token,
+        cursor,
+        _page_reporter(ctx, fields) if stream else None,
+        fields=fields,
+        columnar=columnar,
+        secret_filter=SecretFilter(
+            lifecycle_state=lifecycle_state,
+            tags=tags,
+            name_prefix=name_prefix,
+            created_after=created_after,
+            created_before=created_before,
+            rotated_after=rotated_after,
+            rotated_before=rotated_before,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        ),
+        vault_key=_default_vault(vault_id),
+    )
 
-        client = get_vault_client()
 
-        response: oci.response.Response = None
-        has_next_page = True
-        next_page: str = None
+def _vault_secret_index(
+    vault_id: str, compartment_id: str, force: bool = False
+) -> VaultIndex:
+    """Return the local secret index of a vault, refreshing it if stale."""
+    client = get_vault_client()
+
+    def load_all() -> list[SecretMetadata]:
+        return _list_secrets(vault_id, compartment_id, None, force)
+
+    def load_since(watermark: datetime) -> list[SecretMetadata]:
+        def reached_watermark(page: list) -> bool:
+            return any(s.time_created and s.time_created <= watermark for s in page)
+
+        secrets, _ = collect_pages(
+            client.list_secrets,
+            map_page=map_secret_metadata_page,
+            prefetch=False,
+            until=reached_watermark,
+            vault_id=vault_id,
+            compartment_id=compartment_id,
+            sort_by="TIMECREATED",
+            sort_order="DESC",
+        )
+        return [s for s in secrets if s.time_created and s.time_created > watermark]
 
-        while has_next_page and (limit is None or len(secrets) < limit):
-            kwargs = {
-                "vault_id": effective_vault_id,
-                "compartment_id": effective_compartment_id,
-                "page": next_page,
-                "limit": limit,
-            }
+    return secret_index.get(
+        vault_id, compartment_id, load_all, load_since, force, namespace=_namespace()
+    )
 
-            response = client.list_secrets(**kwargs)
-            has_next_page = response.has_next_page
-            next_page = response.next_page if hasattr(response, "next_page") else None
 
-            data: list[oci.vault.models.SecretSummary] = response.data
-            for secret_summary in data:
-                secrets.append(map_secret_metadata(secret_summary))
+def _search_secrets(
+    name: str,
+    vault_id: Optional[str],
+    compartment_id: Optional[str],
+    limit: Optional[int],
+    bypass_cache: bool,
+    page_token: Optional[str] = None,
+    cursor: bool = False,
+    on_page: Optional[Callable[[list, int], None]] = None,
+    match: Optional[str] = None,
+    tags: Optional[dict] = None,
+    fields: Optional[list[str]] = None,
+    columnar: bool = False,
+    secret_filter: Optional[SecretFilter] = None,
+) -> Union[list[SecretMetadata], SecretMetadataPage, list[dict], ProjectedPage, Table]:
+    try:
+        fields = select_fields(SecretMetadata, fields)
+        # Use provided values or fall back to defaults
+        effective_vault_id, effective_compartment_id = _resolve_vault(
+            vault_id, compartment_id
+        )
 
-        logger.info(f"Found {len(secrets)} Secrets")
-        return secrets
+        if match is None and (tags or index_enabled):
+            match = "substring"
+        if match is not None:
+            if cursor or page_token is not None:
+                raise ValueError(
+                    "cursor mode is not supported for local index matching"
+                )
+            index = _vault_secret_index(
+                effective_vault_id, effective_compartment_id, force=bypass_cache
+            )
+            # The index holds every secret, so nothing has been filtered by OCI
+            where = secret_predicate(secret_filter, pushed_down=False)
+            ordered = secret_filter is not None and secret_filter.sort_by is not None
+            secrets = index.search(
+                name,
+                mode=match,
+                tags=tags,
+                limit=None if where or ordered else limit,
+            )
+            if where is not None:
+                secrets = [s for s in secrets if where(s)]
+            secrets = sort_secrets(secrets, secret_filter)[:limit]
+            logger.info(f"Found {len(secrets)} Secrets (index)")
+            return _project_result(secrets, SecretMetadata, fields, columnar)
+
+        # OCI only matches exact names, so substrings are matched page by page
+        query = {
+            "vault_id": effective_vault_id,
+            "compartment_id": effective_compartment_id,
+        }
+        secret_filter = (secret_filter or SecretFilter()).model_copy(
+            update={"name_contains": name}
+        )
+        secrets = _list_secret_metadata(
+            "search_secrets",
+            query,
+            limit,
+            bypass_cache,
+            page_token,
+            cursor,
+            on_page,
+            secret_filter,
+        )
+        return _project_result(secrets, SecretMetadata, fields, columnar)
 
     except Exception as e:
-        logger.error(f"Error in list_secrets tool: {str(e)}")
+        logger.error(f"Error in search_secrets tool: {str(e)}")
         raise e
 
 
 @mcp.tool(description="Search for secrets by name")
-def search_secrets(
+async def search_secrets(
     name: str = Field(
         ..., description="The name (full or substring) of the secret to search for"
     ),
@@ -164,197 +724,1200 @@ def search_secrets(
     ),
     limit: Optional[int] = Field(
         None,
-        description="The maximum number of secrets to return. If None, there is no limit.",
+        description="The maximum number of secrets to return. If None, there is no limit. In cursor mode, the page size.",
         ge=1,
     ),
-) -> list[SecretMetadata]:
-    secrets: list[SecretMetadata] = []
+    bypass_cache: bool = Field(
+        False,
+        description="Skip the metadata cache and read directly from OCI.",
+    ),
+    page_token: Optional[str] = Field(
+        None,
+        description="The continuation token returned by a previous call. Implies cursor mode.",
+    ),
+    cursor: bool = Field(
+        False,
+        description="Return a single page and a continuation token instead of the full list.",
+    ),
+    stream: bool = Field(
+        False,
+        description="Send each page to the client as a progress notification as soon as it arrives.",
+    ),
+    match: Optional[Literal["substring", "prefix", "fuzzy"]] = Field(
+        None,
+        description="Match against the local secret index instead of searching in OCI. "
+        "Defaults to 'substring' when OCI_VAULT_INDEX_ENABLED is set or tags are given.",
+    ),
+    tags: Optional[dict[str, str]] = Field(
+        None,
+        description="Only return secrets with these tags. Keys are freeform tag names or 'namespace.key' for defined tags.",
+    ),
+    fields: Optional[list[str]] = Field(
+        None,
+        description="Only return these fields of each secret, e.g. id, name, lifecycle_state. "
+        "Entries may be comma-separated. If None, every field is returned.",
+    ),
+    columnar: bool = Field(
+        False,
+        description="Return a table of column names and one row of values per secret instead of a list of objects.",
+    ),
+    lifecycle_state: Optional[SecretLifecycleState] = Field(
+        None,
+        description="Only return secrets in this lifecycle state (applied by OCI).",
+    ),
+    name_prefix: Optional[str] = Field(
+        None,
+        description="Only return secrets whose name starts with this (case-insensitive).",
+    ),
+    created_after: Optional[datetime] = Field(
+        None,
+        description="Only return secrets created after this time (ISO 8601, UTC if no offset is given).",
+    ),
+    created_before: Optional[datetime] = Field(
+        None,
+        description="Only return secrets created before this time.",
+    ),
+    rotated_after: Optional[datetime] = Field(
+        None,
+        description="Only return secrets last rotated by OCI after this time.",
+    ),
+    rotated_before: Optional[datetime] = Field(
+        None,
+        description="Only return secrets last rotated by OCI before this time.",
+    ),
+    sort_by: Optional[Literal["TIMECREATED", "NAME"]] = Field(
+        None,
+        description="Sort by creation time or name (applied by OCI).",
+    ),
+    sort_order: Optional[Literal["ASC", "DESC"]] = Field(
+        None,
+        description="The sort order (applied by OCI).",
+    ),
+    ctx: Context = None,
+) -> Union[list[SecretMetadata], SecretMetadataPage, list[dict], ProjectedPage, Table]:
+    try:
+        # Validated before any page is listed or streamed
+        fields = select_fields(SecretMetadata, fields)
+    except Exception as e:
+        logger.error(f"Error in search_secrets tool: {str(e)}")
+        raise e
+    return await blocking.run(
+        _search_secrets,
+        name,
+        vault_id,
+        compartment_id,
+        limit,
+        bypass_cache,
+        page_token,
+        cursor,
+        _page_reporter(ctx, fields) if stream else None,
+        match=match,
+        tags=tags,
+        fields=fields,
+        columnar=columnar,
+        secret_filter=SecretFilter(
+            lifecycle_state=lifecycle_state,
+            name_prefix=name_prefix,
+            created_after=created_after,
+            created_before=created_before,
+            rotated_after=rotated_after,
+            rotated_before=rotated_before,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        ),
+        vault_key=_default_vault(vault_id),
+    )
 
+
+def _metadata_key(secret_id: str) -> tuple:
+    return ("get_secret_metadata", _namespace(), secret_id)
+
+
+def _get_secret_metadata(secret_id: str, bypass_cache: bool) -> SecretMetadata:
     try:
-        # Use provided values or fall back to defaults
-        effective_vault_id = vault_id or _default_vault_id
-        effective_compartment_id = compartment_id or _default_compartment_id
+        cache_key = _metadata_key(secret_id)
+        if not bypass_cache:
+            cached = metadata_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Retrieved secret metadata: {secret_id} (cached)")
+                return cached
+
+        metadata = single_flight.do(cache_key, _fetch_secret_metadata, secret_id)
+        logger.info(f"Retrieved secret metadata: {secret_id}")
+        return metadata
 
-        if not effective_vault_id:
-            raise ValueError(
-                "vault_id is required. Either provide vault_id parameter or set OCI_VAULT_ID environment variable"
-            )
-        if not effective_compartment_id:
-            raise ValueError(
-                "compartment_id is required. Either provide compartment_id parameter or set OCI_COMPARTMENT_ID environment variable"
-            )
+    except Exception as e:
+        logger.error(f"Error in get_secret_metadata tool: {str(e)}")
+        raise e
 
-        client = get_vault_client()
 
-        response: oci.response.Response = None
-        has_next_page = True
-        next_page: str = None
-
-        while has_next_page and (limit is None or len(secrets) < limit):
-            kwargs = {
-                "vault_id": effective_vault_id,
-                "compartment_id": effective_compartment_id,
-                "search_by_name": name,
-                "page": next_page,
-                "limit": limit,
-            }
+def _fetch_secret_metadata(secret_id: str) -> SecretMetadata:
+    client = get_vault_client()
+    response = client.get_secret(secret_id=secret_id)
+    metadata = map_secret_metadata(response.data)
+    metadata_cache.set(
+        _metadata_key(secret_id),
+        metadata,
+        tags=[secret_tag(secret_id), vault_tag(metadata.vault_id)],
+    )
+    _remember_vaults([metadata])
+    return metadata
 
-            response = client.list_secrets(**kwargs)
-            has_next_page = response.has_next_page
-            next_page = response.next_page if hasattr(response, "next_page") else None
 
-            data: list[oci.vault.models.SecretSummary] = response.data
-            for secret_summary in data:
-                secrets.append(map_secret_metadata(secret_summary))
+@mcp.tool(description="Gets the metadata of a secret by ID")
+async def get_secret_metadata(
+    secret_id: str = Field(
+        ...,
+        description="The OCID of the secret",
+    ),
+    bypass_cache: bool = Field(
+        False,
+        description="Skip the metadata cache and read directly from OCI.",
+    ),
+) -> SecretMetadata:
+    return await blocking.run(
+        _get_secret_metadata,
+        secret_id,
+        bypass_cache,
+        vault_key=_vault_of_secret(secret_id),
+    )
+
 
-        logger.info(f"Found {len(secrets)} Secrets")
-        return secrets
+def _list_secret_versions(
+    secret_id: str,
+    limit: Optional[int],
+    page_token: Optional[str] = None,
+    cursor: bool = False,
+    on_page: Optional[Callable[[list, int], None]] = None,
+    fields: Optional[list[str]] = None,
+    columnar: bool = False,
+) -> Union[list[SecretVersion], SecretVersionPage, list[dict], ProjectedPage, Table]:
+    try:
+        fields = select_fields(SecretVersion, fields)
+        query_key = ("list_secret_versions", _namespace(), secret_id)
+        cursor = cursor or page_token is not None
+
+        if not cursor and on_page is None and _snapshot_allowed():
+            # After a restart, answer from the snapshot and refresh behind it
+            snapshot = snapshot_store.take_versions(secret_id)
+            if snapshot is not None:
+                _in_background(_list_secret_versions, secret_id, None)
+                versions = snapshot[:limit] if limit is not None else snapshot
+                logger.info(f"Found {len(versions)} Secret Versions (snapshot)")
+                return _project_result(versions, SecretVersion, fields, columnar)
+
+        # Projection is per caller, so only the OCI listing is shared
+        versions = single_flight.do(
+            query_key + (limit, page_token, cursor),
+            _fetch_secret_versions,
+            secret_id,
+            query_key,
+            limit,
+            page_token,
+            cursor,
+            on_page,
+        )
+        return _project_result(versions, SecretVersion, fields, columnar)
 
     except Exception as e:
-        logger.error(f"Error in search_secrets tool: {str(e)}")
+        logger.error(f"Error in list_secret_versions tool: {str(e)}")
         raise e
 
 
-@mcp.tool(description="Gets the metadata of a secret by ID")
-def get_secret_metadata(
+def _fetch_secret_versions(
+    secret_id: str,
+    query_key: tuple,
+    limit: Optional[int],
+    page_token: Optional[str],
+    cursor: bool,
+    on_page: Optional[Callable[[list, int], None]],
+) -> Union[list[SecretVersion], SecretVersionPage]:
+    # Secret versions are listed through the Vaults API, not the Secrets API
+    client = get_vault_client()
+    versions, next_page = collect_pages(
+        client.list_secret_versions,
+        map_page=map_secret_version_page,
+        limit=limit,
+        page=decode_page_token(page_token, query_key),
+        single_page=cursor,
+        on_page=on_page,
+        secret_id=secret_id,
+    )
+    logger.info(f"Found {len(versions)} Secret Versions")
+
+    if snapshot_store.enabled and not cursor and limit is None and _snapshot_allowed():
+        _in_background(snapshot_store.save_versions, secret_id, versions)
+    if cursor:
+        return SecretVersionPage(
+            items=versions,
+            next_page_token=encode_page_token(next_page, query_key),
+        )
+    return versions
+
+
+@mcp.tool(description="Lists all versions of a secret")
+async def list_secret_versions(
     secret_id: str = Field(
         ...,
         description="The OCID of the secret",
     ),
-) -> SecretMetadata:
+    limit: Optional[int] = Field(
+        None,
+        description="The maximum number of versions to return. If None, there is no limit. In cursor mode, the page size.",
+        ge=1,
+    ),
+    page_token: Optional[str] = Field(
+        None,
+        description="The continuation token returned by a previous call. Implies cursor mode.",
+    ),
+    cursor: bool = Field(
+        False,
+        description="Return a single page and a continuation token instead of the full list.",
+    ),
+    stream: bool = Field(
+        False,
+        description="Send each page to the client as a progress notification as soon as it arrives.",
+    ),
+    fields: Optional[list[str]] = Field(
+        None,
+        description="Only return these fields of each version, e.g. version_number, version_stage. "
+        "Entries may be comma-separated. If None, every field is returned.",
+    ),
+    columnar: bool = Field(
+        False,
+        description="Return a table of column names and one row of values per version instead of a list of objects.",
+    ),
+    ctx: Context = None,
+) -> Union[list[SecretVersion], SecretVersionPage, list[dict], ProjectedPage, Table]:
     try:
-        client = get_vault_client()
-        response = client.get_secret(secret_id=secret_id)
-        secret_summary = response.data
+        # Validated before any page is listed or streamed
+        fields = select_fields(SecretVersion, fields)
+    except Exception as e:
+        logger.error(f"Error in list_secret_versions tool: {str(e)}")
+        raise e
+    return await blocking.run(
+        _list_secret_versions,
+        secret_id,
+        limit,
+        page_token,
+        cursor,
+        _page_reporter(ctx, fields) if stream else None,
+        fields=fields,
+        columnar=columnar,
+        vault_key=_vault_of_secret(secret_id),
+    )
+
+
+SecretStage = Literal["CURRENT", "PENDING", "PREVIOUS", "LATEST", "DEPRECATED"]
 
-        logger.info(f"Retrieved secret metadata: {secret_id}")
-        return map_secret_metadata(secret_summary)
+
+def _fetch_secret_bundle(
+    secret_id: Optional[str],
+    version_number: Optional[int],
+    stage: Optional[str] = None,
+    secret_name: Optional[str] = None,
+    vault_id: Optional[str] = None,
+) -> tuple[dict, Optional[bytearray]]:
+    """Fetch a secret bundle by OCID or by name and split it into a result dict and its content."""
+    client = get_secrets_client()
+
+    kwargs = {}
+    if version_number is not None:
+        kwargs["version_number"] = version_number
+    if stage is not None:
+        kwargs["stage"] = stage
+
+    if secret_id is None:
+        response = client.get_secret_bundle_by_name(
+            secret_name=secret_name, vault_id=vault_id, **kwargs
+        )
+    else:
+        response = client.get_secret_bundle(secret_id=secret_id, **kwargs)
+    secret_bundle = response.data
+
+    result = {
+        "secret_id": secret_bundle.secret_id,
+        "version_number": secret_bundle.version_number,
+        "stages": secret_bundle.stages,
+        "time_created": (
+            str(secret_bundle.time_created) if secret_bundle.time_created else None
+        ),
+        "content_type": (
+            secret_bundle.secret_bundle_content.content_type
+            if secret_bundle.secret_bundle_content
+            else None
+        ),
+    }
+
+    # Extract secret value if available
+    content_buffer = None
+    if secret_bundle.secret_bundle_content:
+        content = secret_bundle.secret_bundle_content
+        if hasattr(content, "content"):
+            # Content is only returned on request (see _get_secret_value);
+            # keep it in a buffer that can be zeroized
+            result["has_content"] = True
+            if content.content is not None:
+                content_buffer = bytearray(content.content, "ascii")
+        if hasattr(content, "name"):
+            result["name"] = content.name
+
+    return result, content_buffer
+
+
+def _bundle_key(
+    secret_id: str, version_number: Optional[int], stage: Optional[str]
+) -> tuple:
+    return (secret_id, version_number, stage, sessions.current().credentials)
+
+
+def _reload_secret_bundle(
+    secret_id: str,
+    version_number: Optional[int],
+    stage: Optional[str],
+    credentials: VaultContext,
+) -> tuple[dict, Optional[bytearray]]:
+    """Refresh a cached bundle with the profile and region it was first read with."""
+    with sessions.bind(None, credentials):
+        return _fetch_secret_bundle(secret_id, version_number, stage)
+
+
+bundle_cache.loader = _reload_secret_bundle
+
+
+def _check_content_allowed(secret_id: str, name: Optional[str]):
+    if content_allowlist.allows(secret_id, name):
+        return
+    if name is None and content_allowlist.name_patterns:
+        name = _get_secret_metadata(secret_id, False).name
+        if content_allowlist.allows(secret_id, name):
+            return
+    raise PermissionError(
+        f"Content of secret {secret_id} is not allowed by OCI_VAULT_CONTENT_ALLOWLIST"
+    )
+
+
+def _get_secret_value(
+    secret_id: Optional[str],
+    version_number: Optional[int],
+    stage: Optional[str] = None,
+    secret_name: Optional[str] = None,
+    vault_id: Optional[str] = None,
+    content_encoding: Optional[Literal["base64", "text"]] = None,
+) -> dict:
+    try:
+        if secret_id is None:
+            if not secret_name:
+                raise ValueError("Either secret_id or secret_name is required")
+            vault_id = _default_vault(vault_id)
+            if not vault_id:
+                raise ValueError(
+                    "vault_id is required to look up a secret by name. Either provide vault_id parameter, call configure_vault or set OCI_VAULT_ID environment variable"
+                )
+        elif content_encoding is not None:
+            # Check before fetching, so disallowed content is never loaded
+            _check_content_allowed(secret_id, None)
+
+        cached = None
+        if secret_id is not None:
+            cached = bundle_cache.get(_bundle_key(secret_id, version_number, stage))
+        if cached is not None:
+            result, content = cached
+        else:
+            result, content = _fetch_secret_bundle(
+                secret_id, version_number, stage, secret_name, vault_id
+            )
+        decoded = None
+        try:
+            if content_encoding is not None:
+                if secret_id is None:
+                    _check_content_allowed(result["secret_id"], secret_name)
+                if content is not None:
+                    decoded = decode_content(content, content_encoding)
+            if cached is None and bundle_cache.enabled:
+                # The cache takes ownership of the content buffer
+                key = _bundle_key(result["secret_id"], version_number, stage)
+                bundle_cache.put(key, result, content)
+                content = None
+        finally:
+            zeroize(content)
+        if decoded is not None:
+            result["content"] = decoded
+            result["content_encoding"] = content_encoding
+
+        logger.info(
+            f"Retrieved secret value: {result['secret_id']}"
+            + (" (cached)" if cached is not None else "")
+        )
+        return result
 
     except Exception as e:
-        logger.error(f"Error in get_secret_metadata tool: {str(e)}")
+        logger.error(f"Error in get_secret_value tool: {str(e)}")
         raise e
 
 
-@mcp.tool(description="Lists all versions of a secret")
-def list_secret_versions(
+@mcp.tool(description="Gets the secret value for a specific version")
+async def get_secret_value(
+    secret_id: Optional[str] = Field(
+        None,
+        description="The OCID of the secret. Either secret_id or secret_name is required.",
+    ),
+    version_number: Optional[int] = Field(
+        None,
+        description="The version number of the secret. If not specified, returns the current version.",
+    ),
+    stage: Optional[SecretStage] = Field(
+        None,
+        description="Return the version in this rotation stage instead of the current version.",
+    ),
+    secret_name: Optional[str] = Field(
+        None,
+        description="Look the secret up by name in vault_id instead of by secret_id",
+    ),
+    vault_id: Optional[str] = Field(
+        None,
+        description="The vault to look secret_name up in. Uses OCI_VAULT_ID env var if not provided.",
+    ),
+    content: Optional[Literal["base64", "text"]] = Field(
+        None,
+        description="Also return the secret content, as base64 or as UTF-8 text. "
+        "Only for secrets allowed by OCI_VAULT_CONTENT_ALLOWLIST.",
+    ),
+) -> dict:
+    return await blocking.run(
+        _get_secret_value,
+        secret_id,
+        version_number,
+        stage,
+        secret_name,
+        vault_id,
+        content,
+        vault_key=_vault_of_secret(secret_id) if secret_id else vault_id,
+    )
+
+
+def _timed(fn, *args):
+    """Call ``fn(*args)`` and return its result with the elapsed milliseconds."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, round((time.perf_counter() - start) * 1000, 3)
+
+
+@mcp.tool(description="Gets a complete secret with metadata and versions")
+async def get_secret(
     secret_id: str = Field(
         ...,
         description="The OCID of the secret",
     ),
-    limit: Optional[int] = Field(
+    max_versions: Optional[int] = Field(
+        None,
+        description="The maximum number of versions to return. If None, all versions are returned.",
+        ge=1,
+    ),
+) -> Secret:
+    """Get a secret's metadata and versions.
+
+    Metadata and versions are fetched concurrently, so the latency is that of
+    the slower request rather than the sum of both.
+    """
+    try:
+        vault_key = _vault_of_secret(secret_id)
+        start = time.perf_counter()
+        (metadata, metadata_ms), (versions, versions_ms) = await asyncio.gather(
+            blocking.run(
+                _timed, _get_secret_metadata, secret_id, False, vault_key=vault_key
+            ),
+            blocking.run(
+                _timed,
+                _list_secret_versions,
+                secret_id,
+                max_versions,
+                vault_key=vault_key,
+            ),
+        )
+        total_ms = round((time.perf_counter() - start) * 1000, 3)
+
+        logger.info(f"Retrieved complete secret: {secret_id}")
+        return Secret(
+            metadata=metadata,
+            versions=versions,
+            timings_ms={
+                "metadata": metadata_ms,
+                "versions": versions_ms,
+                "total": total_ms,
+            },
+        )
+
+    except Exception as e:
+        logger.error(f"Error in get_secret tool: {str(e)}")
+        raise e
+
+
+async def _fetch_secret_result(
+    secret_id: Optional[str],
+    name: Optional[str],
+    metadata: Optional[SecretMetadata],
+    include_bundle: bool,
+) -> SecretResult:
+    result = SecretResult(secret_id=secret_id, name=name, metadata=metadata)
+    try:
+        if secret_id is None:
+            raise LookupError(f"No secret named '{name}' in the vault")
+        vault_key = _vault_of_secret(secret_id)
+        if result.metadata is None:
+            result.metadata = await blocking.run(
+                _get_secret_metadata, secret_id, False, vault_key=vault_key
+            )
+            result.name = result.metadata.name
+        if include_bundle:
+            result.bundle = await blocking.run(
+                _get_secret_value, secret_id, None, vault_key=vault_key
+            )
+    except Exception as e:
+        result.error = str(e)
+    return result
+
+
+@mcp.tool(
+    description="Gets the metadata and optionally the current bundle of many secrets"
+)
+async def get_secrets(
+    secret_ids: Optional[list[str]] = Field(
+        None,
+        description="The OCIDs of the secrets to fetch",
+    ),
+    names: Optional[list[str]] = Field(
+        None,
+        description="The names of secrets to fetch from the vault",
+    ),
+    vault_id: Optional[str] = Field(
+        None,
+        description="The OCID of the vault used to resolve names. If not provided, uses the configured default vault.",
+    ),
+    compartment_id: Optional[str] = Field(
+        None,
+        description="The OCID of the compartment used to resolve names. If not provided, uses the configured default compartment.",
+    ),
+    include_bundle: bool = Field(
+        False,
+        description="Also fetch the current secret bundle of each secret.",
+    ),
+    max_concurrency: Optional[int] = Field(
+        None,
+        description="The maximum number of secrets fetched at once. Defaults to OCI_VAULT_BULK_CONCURRENCY.",
+        ge=1,
+        le=64,
+    ),
+) -> list[SecretResult]:
+    """Fetch many secrets in one call.
+
+    Secrets are fetched concurrently and a failure for one secret is reported
+    in its ``error`` field instead of failing the whole request.
+    """
+    try:
+        items: list[tuple] = [(secret_id, None, None) for secret_id in secret_ids or []]
+
+        if names:
+            effective_vault_id, effective_compartment_id = _resolve_vault(
+                vault_id, compartment_id
+            )
+            # A single (cached) listing resolves every name and supplies its metadata
+            listing = await blocking.run(
+                _list_secrets,
+                effective_vault_id,
+                effective_compartment_id,
+                None,
+                False,
+                vault_key=effective_vault_id,
+            )
+            by_name = {secret.name: secret for secret in listing}
+            for name in names:
+                metadata = by_name.get(name)
+                items.append((metadata.id if metadata else None, name, metadata))
+
+        results = await map_bounded(
+            lambda item: _fetch_secret_result(*item, include_bundle),
+            items,
+            max_concurrency or _bulk_concurrency,
+        )
+
+        failed = sum(1 for result in results if result.error)
+        logger.info(f"Fetched {len(results) - failed} Secrets ({failed} failed)")
+        return results
+
+    except Exception as e:
+        logger.error(f"Error in get_secrets tool: {str(e)}")
+        raise e
+
+
+def _refresh_secret_index(
+    vault_id: Optional[str], compartment_id: Optional[str]
+) -> dict:
+    try:
+        effective_vault_id, effective_compartment_id = _resolve_vault(
+            vault_id, compartment_id
+        )
+        index = _vault_secret_index(
+            effective_vault_id, effective_compartment_id, force=True
+        )
+        logger.info(f"Refreshed secret index: {effective_vault_id}")
+        return {
+            "vault_id": effective_vault_id,
+            "compartment_id": effective_compartment_id,
+            "secrets": len(index),
+            "watermark": str(index.watermark) if index.watermark else None,
+        }
+
+    except Exception as e:
+        logger.error(f"Error in refresh_secret_index tool: {str(e)}")
+        raise e
+
+
+@mcp.tool(
+    description="Rebuilds the local secret index used for fast name and tag search"
+)
+async def refresh_secret_index(
+    vault_id: Optional[str] = Field(
+        None,
+        description="The OCID of the vault. If not provided, uses the configured default vault.",
+    ),
+    compartment_id: Optional[str] = Field(
+        None,
+        description="The OCID of the compartment. If not provided, uses the configured default compartment.",
+    ),
+) -> dict:
+    return await blocking.run(
+        _refresh_secret_index,
+        vault_id,
+        compartment_id,
+        vault_key=_default_vault(vault_id),
+    )
+
+
+def _region_of(ocid: str) -> Optional[str]:
+    """Return the region encoded in a regional OCID, or None if it has none."""
+    import oci
+
+    # ocid1.<type>.<realm>.<region>.<unique id>
+    parts = ocid.split(".")
+    code = parts[3].lower() if len(parts) >= 5 else ""
+    if code in oci.regions.REGIONS:
+        return code
+    return oci.regions.REGIONS_SHORT_NAMES.get(code)
+
+
+def _subcompartments(compartment_id: str) -> list[str]:
+    """Return a compartment and every active compartment below it."""
+    client = get_identity_client()
+    if compartment_id.startswith("ocid1.tenancy."):
+        # The whole tree below the root is available in a single listing
+        children, _ = collect_pages(
+            client.list_compartments,
+            map_item=lambda c: c.id,
+            compartment_id=compartment_id,
+            compartment_id_in_subtree=True,
+            access_level="ACCESSIBLE",
+            lifecycle_state="ACTIVE",
+        )
+        return [compartment_id] + children
+
+    found, parents = [compartment_id], [compartment_id]
+    while parents:
+        level = []
+        for parent in parents:
+            children, _ = collect_pages(
+                client.list_compartments,
+                map_item=lambda c: c.id,
+                compartment_id=parent,
+                lifecycle_state="ACTIVE",
+            )
+            level.extend(children)
+        found.extend(level)
+        parents = level
+    return found
+
+
+def _secret_sources(
+    vault_ids: Optional[list[str]],
+    compartment_ids: Optional[list[str]],
+    include_subcompartments: bool,
+    regions: Optional[list[str]],
+) -> list[SecretSource]:
+    """
+    Expand the requested vaults, compartments and regions into listings.
+
+    A vault OCID that encodes its region is listed in that region only; every
+    other listing is run in each of ``regions`` (or the configured region).
+    """
+    if not vault_ids and not compartment_ids:
+        vault_id, compartment_id = _resolve_vault(None, None)
+        vault_ids, compartment_ids = [vault_id], [compartment_id]
+    if not compartment_ids:
+        _, compartment_id = _resolve_vault(vault_ids[0], None)
+        compartment_ids = [compartment_id]
+
+    compartments = list(dict.fromkeys(compartment_ids))
+    if include_subcompartments:
+        compartments = list(
+            dict.fromkeys(c for root in compartments for c in _subcompartments(root))
+        )
+    context = sessions.current()
+    default_region = context.region or client_pool.default_region(context.profile)
+    default_regions = list(dict.fromkeys(regions or [default_region]))
+
+    sources = {}
+    for compartment_id in compartments:
+        for vault_id in vault_ids or [None]:
+            vault_region = _region_of(vault_id) if vault_id else None
+            for region in [vault_region] if vault_region else default_regions:
+                key = (region, compartment_id, vault_id)
+                sources.setdefault(
+                    key,
+                    SecretSource(
+                        region=region, compartment_id=compartment_id, vault_id=vault_id
+                    ),
+                )
+    return list(sources.values())
+
+
+def _list_source_secrets(
+    source: SecretSource, name: Optional[str]
+) -> list[RegionalSecretMetadata]:
+    """List the secrets of one source, optionally filtered by a name substring."""
+    kwargs = {"compartment_id": source.compartment_id}
+    if source.vault_id:
+        kwargs["vault_id"] = source.vault_id
+    client = get_vault_client(source.region)
+    secrets, _ = collect_pages(
+        client.list_secrets,
+        map_page=lambda page: map_regional_secret_metadata_page(page, source.region),
+        **kwargs,
+    )
+    if name:
+        needle = name.lower()
+        secrets = [s for s in secrets if needle in (s.name or "").lower()]
+    return secrets
+
+
+@mcp.tool(
+    description="Lists or searches secrets across several vaults, compartments and regions concurrently"
+)
+async def list_secrets_across_vaults(
+    vault_ids: Optional[list[str]] = Field(
+        None,
+        description="The OCIDs of the vaults to list. If not provided, every vault in the compartments is listed.",
+    ),
+    compartment_ids: Optional[list[str]] = Field(
+        None,
+        description="The OCIDs of the compartments to list. If not provided, uses the configured default compartment.",
+    ),
+    include_subcompartments: bool = Field(
+        False,
+        description="Also list every active compartment below the given compartments.",
+    ),
+    regions: Optional[list[str]] = Field(
+        None,
+        description="The regions to query, e.g. us-ashburn-1. Vault OCIDs are always queried in their own region. "
+        "If not provided, uses the configured region.",
+    ),
+    name: Optional[str] = Field(
+        None,
+        description="Only return secrets whose name contains this text (case-insensitive).",
+    ),
+    max_concurrency: Optional[int] = Field(
         None,
-        description="The maximum number of versions to return. If None, there is no limit.",
+        description="The maximum number of listings run at once. Defaults to OCI_VAULT_FANOUT_CONCURRENCY.",
         ge=1,
+        le=64,
     ),
-) -> list[SecretVersion]:
-    versions: list[SecretVersion] = []
+) -> SecretListing:
+    """List secrets from many vaults, compartments and regions in one call.
 
+    Every combination is listed concurrently with the client pool of its
+    region. A failing listing is reported in its source's ``error`` field
+    instead of failing the whole request.
+    """
     try:
-        client = get_secrets_client()
-
-        response: oci.response.Response = None
-        has_next_page = True
-        next_page: str = None
-
-        while has_next_page and (limit is None or len(versions) < limit):
-            kwargs = {
-                "secret_id": secret_id,
-                "page": next_page,
-                "limit": limit,
-            }
-
-            response = client.list_secret_versions(**kwargs)
-            has_next_page = response.has_next_page
-            next_page = response.next_page if hasattr(response, "next_page") else None
+        sources = await blocking.run(
+            _secret_sources,
+            vault_ids,
+            compartment_ids,
+            include_subcompartments,
+            regions,
+        )
 
-            data: list[oci.vault.models.SecretVersionSummary] = response.data
-            for version_summary in data:
-                versions.append(map_secret_version(version_summary))
+        async def list_source(source: SecretSource) -> list[RegionalSecretMetadata]:
+            start = time.perf_counter()
+            try:
+                secrets = await blocking.run(
+                    _list_source_secrets, source, name, vault_key=source.vault_id
+                )
+                source.secrets = len(secrets)
+                return secrets
+            except Exception as e:
+                source.error = str(e)
+                return []
+            finally:
+                source.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+
+        listings = await map_bounded(
+            list_source, sources, max_concurrency or _fanout_concurrency
+        )
 
-        logger.info(f"Found {len(versions)} Secret Versions")
-        return versions
+        # Overlapping sources (a compartment and one of its vaults) list a secret twice
+        merged = {}
+        for secrets in listings:
+            for secret in secrets:
+                merged.setdefault(secret.id, secret)
+        failed = sum(1 for source in sources if source.error)
+        logger.info(
+            f"Found {len(merged)} Secrets in {len(sources)} sources ({failed} failed)"
+        )
+        return SecretListing(
+            secrets=list(merged.values()), sources=sources, failed=failed
+        )
 
     except Exception as e:
-        logger.error(f"Error in list_secret_versions tool: {str(e)}")
+        logger.error(f"Error in list_secrets_across_vaults tool: {str(e)}")
         raise e
 
 
-@mcp.tool(description="Gets the secret value for a specific version")
-def get_secret_value(
-    secret_id: str = Field(
-        ...,
-        description="The OCID of the secret",
+def _fresh_secret_versions(secret_id: str) -> list[SecretVersion]:
+    """List every version of a secret from OCI, never from the snapshot."""
+    query_key = ("list_secret_versions", _namespace(), secret_id)
+    return single_flight.do(
+        query_key + (None, None, False),
+        _fetch_secret_versions,
+        secret_id,
+        query_key,
+        None,
+        None,
+        False,
+        None,
+    )
+
+
+@mcp.tool(
+    description="Lists the secrets of a vault that changed since a time or a previous "
+    "watermark, with the versions created since then"
+)
+async def changes_since(
+    since: Optional[datetime] = Field(
+        None,
+        description="Report changes after this time (ISO 8601, UTC if no offset is given). "
+        "Either since or watermark is required.",
     ),
-    version_number: Optional[int] = Field(
+    watermark: Optional[str] = Field(
         None,
-        description="The version number of the secret. If not specified, returns the current version.",
+        description="The watermark returned by the previous changes_since call",
     ),
-) -> dict:
-    try:
-        client = get_secrets_client()
+    vault_id: Optional[str] = Field(
+        None,
+        description="The OCID of the vault. If not provided, uses the configured default vault.",
+    ),
+    compartment_id: Optional[str] = Field(
+        None,
+        description="The OCID of the compartment. If not provided, uses the configured default compartment.",
+    ),
+    verify: bool = Field(
+        False,
+        description="Also check secrets whose listed metadata is unchanged for new versions, "
+        "with one OCI call per secret.",
+    ),
+    max_concurrency: Optional[int] = Field(
+        None,
+        description="The maximum number of secrets checked at once. Defaults to OCI_VAULT_BULK_CONCURRENCY.",
+        ge=1,
+        le=64,
+    ),
+) -> ChangeFeed:
+    """Report the secrets that changed since a time or watermark.
 
-        kwargs = {
-            "secret_id": secret_id,
-        }
-        if version_number is not None:
-            kwargs["version_number"] = version_number
-
-        response = client.get_secret_bundle(**kwargs)
-        secret_bundle = response.data
-
-        result = {
-            "secret_id": secret_bundle.secret_id,
-            "version_number": secret_bundle.version_number,
-            "stages": secret_bundle.stages,
-            "time_created": str(secret_bundle.time_created)
-            if secret_bundle.time_created
-            else None,
-            "content_type": secret_bundle.secret_bundle_content.content_type
-            if secret_bundle.secret_bundle_content
-            else None,
-        }
+    One listing of the vault is compared with the state behind the watermark
+    (or, without one, with ``since``); versions are only listed for secrets
+    whose listed metadata moved. Secrets that could not be checked keep their
+    previous state, so the next call reports them again.
+    """
+    try:
+        vault_id, compartment_id = _resolve_vault(vault_id, compartment_id)
+        query = ("changes_since", _namespace(), vault_id, compartment_id)
+        state = None
+        if watermark is not None:
+            if since is not None:
+                raise ValueError("Pass either since or watermark, not both")
+            since, state = change_tracker.recall(watermark, query)
+        elif since is None:
+            raise ValueError("Either since or watermark is required")
+        elif since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        # Taken before listing, so nothing between listing and return is missed
+        listed_at = datetime.now(timezone.utc)
+        secrets = await blocking.run(
+            _list_secrets, vault_id, compartment_id, None, True, vault_key=vault_id
+        )
 
-        # Extract secret value if available
-        if secret_bundle.secret_bundle_content:
-            content = secret_bundle.secret_bundle_content
-            if hasattr(content, "content"):
-                # For base64 content, we typically don't return the actual content
-                # but can return metadata instead
-                result["has_content"] = True
-            if hasattr(content, "name"):
-                result["name"] = content.name
-
-        logger.info(f"Retrieved secret value: {secret_id}")
-        return result
+        new_state = {}
+        changes: dict[str, SecretChange] = {}
+        unchanged = []
+        for secret in secrets:
+            fingerprint = secret_fingerprint(secret)
+            previous = state.get(secret.id) if state is not None else None
+            if state is not None:
+                if previous is None:
+                    change = "created"
+                elif previous[0] != fingerprint:
+                    change = "updated"
+                else:
+                    change = None
+            elif secret.time_created is not None and secret.time_created > since:
+                change = "created"
+            else:
+                change = "updated" if moved_since(secret, since) else None
+            new_state[secret.id] = (fingerprint, previous[1] if previous else None)
+            if change is None:
+                unchanged.append(secret)
+            else:
+                changes[secret.id] = SecretChange(
+                    secret_id=secret.id,
+                    name=secret.name,
+                    change=change,
+                    lifecycle_state=secret.lifecycle_state,
+                )
+
+        async def version_moved(secret: SecretMetadata) -> bool:
+            # A known version number is checked with one get_secret call
+            known = new_state[secret.id][1]
+            if known is None:
+                return True
+            try:
+                metadata = await blocking.run(
+                    _get_secret_metadata, secret.id, True, vault_key=vault_id
+                )
+            except Exception:
+                # Fall back to listing the versions
+                return True
+            return metadata.current_version_number != known
+
+        limit = max_concurrency or _bulk_concurrency
+        probed = []
+        if verify and unchanged:
+            moved = await map_bounded(version_moved, unchanged, limit)
+            probed = [s for s, m in zip(unchanged, moved) if m]
+
+        async def list_versions(item: tuple[SecretMetadata, Optional[SecretChange]]):
+            secret, change = item
+            previous = state.get(secret.id) if state is not None else None
+            try:
+                versions = await blocking.run(
+                    _fresh_secret_versions, secret.id, vault_key=vault_id
+                )
+            except Exception as e:
+                if change is not None:
+                    change.error = str(e)
+                # Keep the old state so the next call looks at this secret again
+                if previous is None:
+                    new_state.pop(secret.id, None)
+                else:
+                    new_state[secret.id] = previous
+                return
+            numbers = [
+                v.version_number for v in versions if v.version_number is not None
+            ]
+            new_state[secret.id] = (new_state[secret.id][0], max(numbers, default=None))
+            recent = [
+                v
+                for v in versions
+                if v.time_created is not None and v.time_created > since
+            ]
+            if change is None and recent:
+                change = changes[secret.id] = SecretChange(
+                    secret_id=secret.id,
+                    name=secret.name,
+                    change="updated",
+                    lifecycle_state=secret.lifecycle_state,
+                )
+            if change is not None:
+                change.versions = recent
+
+        by_id = {secret.id: secret for secret in secrets}
+        to_list = [(by_id[i], change) for i, change in changes.items()] + [
+            (secret, None) for secret in probed
+        ]
+        await map_bounded(list_versions, to_list, limit)
+
+        for secret_id in (state or {}).keys() - by_id.keys():
+            changes[secret_id] = SecretChange(secret_id=secret_id, change="removed")
+
+        logger.info(
+            f"Found {len(changes)} changed Secrets of {len(secrets)} "
+            f"({len(to_list)} version listings)"
+        )
+        return ChangeFeed(
+            changes=list(changes.values()),
+            watermark=change_tracker.remember(query, listed_at, new_state),
+            since=since,
+            scanned=len(secrets),
+            skipped=len(secrets) - len(to_list),
+            version_listings=len(to_list),
+        )
 
     except Exception as e:
-        logger.error(f"Error in get_secret_value tool: {str(e)}")
+        logger.error(f"Error in changes_since tool: {str(e)}")
         raise e
 
 
-@mcp.tool(description="Gets a complete secret with metadata and versions")
-def get_secret(
-    secret_id: str = Field(
-        ...,
-        description="The OCID of the secret",
-    ),
-) -> Secret:
-    try:
-        # Get metadata
-        vault_client = get_vault_client()
-        metadata_response = vault_client.get_secret(secret_id=secret_id)
-        metadata = map_secret_metadata(metadata_response.data)
+def _scan_source_rotation(source: SecretSource, scan: RotationScan):
+    """Add every secret of one source to ``scan`` page by page, keeping none."""
+    kwargs = {"compartment_id": source.compartment_id}
+    if source.vault_id:
+        kwargs["vault_id"] = source.vault_id
+    client = get_vault_client(source.region)
 
-        # Get versions
-        secrets_client = get_secrets_client()
-        versions_response = secrets_client.list_secret_versions(secret_id=secret_id)
-        versions = [map_secret_version(v) for v in versions_response.data]
+    def add_page(page: list) -> list:
+        return scan.add_page(map_regional_secret_metadata_page(page, source.region))
 
-        logger.info(f"Retrieved complete secret: {secret_id}")
-        return Secret(metadata=metadata, versions=versions)
+    collect_pages(client.list_secrets, map_page=add_page, **kwargs)
+    source.secrets = scan.scanned
+
+
+def _current_version_time(secret_id: str, region: Optional[str]) -> datetime:
+    """Return when the current version of a secret was created."""
+    client = get_vault_client(region)
+    secret = client.get_secret(secret_id=secret_id).data
+    version = client.get_secret_version(
+        secret_id=secret_id, secret_version_number=secret.current_version_number
+    ).data
+    return version.time_created
+
+
+@mcp.tool(
+    description="Reports rotation readiness (age buckets, rotation coverage, overdue "
+    "and pending-deletion secrets) across one or more vaults"
+)
+async def scan_rotation_readiness(
+    vault_ids: Optional[list[str]] = Field(
+        None,
+        description="The OCIDs of the vaults to scan. If not provided, every vault in the compartments is scanned.",
+    ),
+    compartment_ids: Optional[list[str]] = Field(
+        None,
+        description="The OCIDs of the compartments to scan. If not provided, uses the configured default compartment.",
+    ),
+    include_subcompartments: bool = Field(
+        False,
+        description="Also scan every active compartment below the given compartments.",
+    ),
+    regions: Optional[list[str]] = Field(
+        None,
+        description="The regions to query, e.g. us-ashburn-1. Vault OCIDs are always queried in their own region. "
+        "If not provided, uses the configured region.",
+    ),
+    max_age_days: float = Field(
+        90,
+        description="Secrets without scheduled rotation are overdue once they are older than this many days.",
+        gt=0,
+    ),
+    age_buckets: Optional[list[int]] = Field(
+        None,
+        description="The upper bounds of the age buckets, in days. Defaults to 30, 90, 180 and 365.",
+    ),
+    top: int = Field(
+        20,
+        description="The number of most overdue secrets to list in the report.",
+        ge=0,
+        le=1000,
+    ),
+    max_concurrency: Optional[int] = Field(
+        None,
+        description="The maximum number of vaults scanned at once. Defaults to OCI_VAULT_FANOUT_CONCURRENCY.",
+        ge=1,
+        le=64,
+    ),
+) -> RotationReport:
+    """Scan vaults for secrets that are overdue for rotation.
+
+    Every vault is listed concurrently and each page is folded into running
+    totals as it arrives, so only counters and the ``top`` findings are kept
+    however many secrets are scanned. A secret's age is the time since OCI
+    last rotated it, or since it was created; versions created manually are
+    not visible in listings, so the ages of the ``top`` most overdue secrets
+    are confirmed from their current version, at most
+    OCI_VAULT_BULK_CONCURRENCY at once, before they are reported.
+    """
+    try:
+        sources = await blocking.run(
+            _secret_sources,
+            vault_ids,
+            compartment_ids,
+            include_subcompartments,
+            regions,
+        )
+        now = datetime.now(timezone.utc)
+        buckets = age_buckets or DEFAULT_AGE_BUCKETS
+
+        async def scan_source(source: SecretSource) -> RotationScan:
+            scan = RotationScan(now, max_age_days, buckets, top)
+            start = time.perf_counter()
+            try:
+                await blocking.run(
+                    _scan_source_rotation, source, scan, vault_key=source.vault_id
+                )
+            except Exception as e:
+                # Secrets scanned before the failure still count
+                source.error = str(e)
+                source.secrets = scan.scanned
+            finally:
+                source.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+            return scan
+
+        scans = await map_bounded(
+            scan_source, sources, max_concurrency or _fanout_concurrency
+        )
+        total = RotationScan(now, max_age_days, buckets, top)
+        for scan in scans:
+            total.merge(scan)
+
+        async def confirm_age(finding: RotationFinding) -> Optional[datetime]:
+            try:
+                return await blocking.run(
+                    _current_version_time,
+                    finding.secret_id,
+                    finding.region,
+                    vault_key=finding.vault_id,
+                )
+            except Exception as e:
+                # Reported as possibly overdue
+                logger.error(
+                    f"Error confirming rotation age of {finding.secret_id}: {str(e)}"
+                )
+                return None
+
+        # Secrets found to be rotated recently make room for the next ones
+        tried: set[str] = set()
+        while True:
+            findings = [f for f in total.findings() if f.secret_id not in tried]
+            if not findings:
+                break
+            tried.update(f.secret_id for f in findings)
+            # Bounded like a bulk read, not by max_concurrency, which is
+            # the number of vaults listed at once
+            changed = await map_bounded(confirm_age, findings, _bulk_concurrency)
+            for finding, time_changed in zip(findings, changed):
+                if time_changed is not None:
+                    total.confirm(finding.secret_id, time_changed)
+
+        report = total.report()
+        report.sources = sources
+        report.failed = sum(1 for source in sources if source.error)
+        logger.info(
+            f"Scanned {report.scanned} Secrets in {len(sources)} sources "
+            f"({report.overdue} overdue, {report.failed} failed)"
+        )
+        return report
 
     except Exception as e:
-        logger.error(f"Error in get_secret tool: {str(e)}")
+        logger.error(f"Error in scan_rotation_readiness tool: {str(e)}")
         raise e
 
 
@@ -367,19 +1930,31 @@ def configure_vault(
     compartment_id: str = Field(
         ..., description="The OCID of the compartment to use as default"
     ),
+    profile: Optional[str] = Field(
+        None,
+        description="The OCI config profile to use. Must be allowed by OCI_VAULT_ALLOWED_PROFILES. "
+        "If not provided, uses OCI_CONFIG_PROFILE.",
+    ),
+    region: Optional[str] = Field(
+        None,
+        description="The region to use, e.g. us-ashburn-1. If not provided, uses the region of the profile.",
+    ),
 ) -> dict:
-    """Configure the default vault and compartment.
+    """Configure the default vault and compartment of this session.
 
     These defaults will be used by list_secrets and search_secrets
-    if vault_id and compartment_id parameters are not provided.
+    if vault_id and compartment_id parameters are not provided. They only
+    apply to the calling MCP session (or API key); other sessions keep theirs.
     """
     try:
-        set_vault_config(vault_id, compartment_id)
+        context = set_vault_config(vault_id, compartment_id, profile, region)
         return {
             "status": "success",
             "message": "Vault configuration updated",
-            "vault_id": vault_id,
-            "compartment_id": compartment_id,
+            "vault_id": context.vault_id,
+            "compartment_id": context.compartment_id,
+            "profile": context.profile,
+            "region": context.region,
         }
     except Exception as e:
         logger.error(f"Error in configure_vault tool: {str(e)}")
@@ -388,68 +1963,84 @@ def configure_vault(
 
 @mcp.tool(description="Get the current vault and compartment configuration")
 def get_vault_config_tool() -> dict:
-    """Get the currently configured default vault and compartment."""
+    """Get the default vault and compartment of this session."""
     try:
-        vault_id, compartment_id = get_vault_config()
+        context = sessions.current()
         return {
-            "vault_id": vault_id,
-            "compartment_id": compartment_id,
-            "configured": vault_id is not None and compartment_id is not None,
+            "vault_id": context.vault_id,
+            "compartment_id": context.compartment_id,
+            "profile": context.profile,
+            "region": context.region,
+            "configured": context.vault_id is not None
+            and context.compartment_id is not None,
         }
     except Exception as e:
         logger.error(f"Error in get_vault_config_tool: {str(e)}")
         raise e
 
 
-@mcp.tool(description="Creates a new secret in the vault")
-def create_secret(
-    name: str = Field(
-        ...,
-        description="The human-friendly name of the secret",
-    ),
-    secret_value: str = Field(
-        ...,
-        description="The secret value/content to store",
-    ),
-    description: Optional[str] = Field(
-        None,
-        description="A brief description of the secret",
-    ),
-    content_type: Optional[str] = Field(
-        None,
-        description="The content type of the secret (e.g., 'application/json', 'text/plain'). Defaults to 'application/octet-stream'.",
-    ),
-    vault_id: Optional[str] = Field(
-        None,
-        description="The OCID of the vault. If not provided, uses the configured default vault.",
-    ),
-    compartment_id: Optional[str] = Field(
-        None,
-        description="The OCID of the compartment. If not provided, uses the configured default compartment.",
-    ),
+@mcp.tool(description="Get client pool and cache statistics for this server process")
+def get_server_stats() -> dict:
+    """Get hit/miss/rebuild counters of the shared OCI client pool and caches."""
+    return {
+        "client_pool": client_pool.stats(),
+        "metadata_cache": metadata_cache.stats(),
+        "executor": blocking.stats(),
+        "secret_index": secret_index.stats(),
+        "bundle_cache": bundle_cache.stats(),
+        "snapshot": snapshot_store.stats(),
+        "single_flight": single_flight.stats(),
+        "change_tracker": change_tracker.stats(),
+        "sessions": sessions.stats(),
+        "throttling": client_pool.guards.stats(),
+    }
+
+
+@mcp.tool(description="Get Prometheus-format metrics of tool calls and OCI requests")
+def get_metrics() -> str:
+    """Get tool call, OCI request, mapping and client construction metrics."""
+    return metrics.render()
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    """Serve metrics for Prometheus scraping in HTTP transport mode."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+def _secret_content(
+    secret_value: str,
+) -> "oci.vault.models.Base64SecretContentDetails":
+    """Encode a secret value the way the Vaults API expects it."""
+    import oci
+
+    return oci.vault.models.Base64SecretContentDetails(
+        content_type=oci.vault.models.SecretContentDetails.CONTENT_TYPE_BASE64,
+        content=base64.b64encode(secret_value.encode("utf-8")).decode("ascii"),
+        stage=oci.vault.models.SecretContentDetails.STAGE_CURRENT,
+    )
+
+
+def _create_secret(
+    name: str,
+    secret_value: str,
+    description: Optional[str],
+    content_type: Optional[str],
+    vault_id: Optional[str],
+    compartment_id: Optional[str],
 ) -> CreateSecretResponse:
-    """Create a new secret in the vault."""
     try:
         # Use provided values or fall back to defaults
-        effective_vault_id = vault_id or _default_vault_id
-        effective_compartment_id = compartment_id or _default_compartment_id
+        effective_vault_id, effective_compartment_id = _resolve_vault(
+            vault_id, compartment_id
+        )
 
-        if not effective_vault_id:
-            raise ValueError(
-                "vault_id is required. Either provide vault_id parameter or set OCI_VAULT_ID environment variable"
-            )
-        if not effective_compartment_id:
-            raise ValueError(
-                "compartment_id is required. Either provide compartment_id parameter or set OCI_COMPARTMENT_ID environment variable"
-            )
+        import oci
 
         client = get_vault_client()
 
         # Prepare secret content
-        secret_content = oci.vault.models.SecretContentDetails(
-            content_type=content_type or "application/octet-stream",
-            content=secret_value,
-        )
+        secret_content = _secret_content(secret_value)
 
         # Create the secret
         create_secret_details = oci.vault.models.CreateSecretDetails(
@@ -465,6 +2056,10 @@ def create_secret(
         )
 
         secret = response.data
+        metadata_cache.invalidate_tag(vault_tag(secret.vault_id))
+        snapshot_store.forget(vault_id=secret.vault_id)
+        single_flight.forget()
+        secret_index.upsert(map_secret_metadata(secret), namespace=_namespace())
         logger.info(f"Created secret: {name} (ID: {secret.id})")
 
         return CreateSecretResponse(
@@ -483,55 +2078,79 @@ def create_secret(
         raise e
 
 
-@mcp.tool(description="Creates a new version of an existing secret")
-def update_secret(
-    secret_id: str = Field(
+@mcp.tool(description="Creates a new secret in the vault")
+async def create_secret(
+    name: str = Field(
         ...,
-        description="The OCID of the secret to update",
+        description="The human-friendly name of the secret",
     ),
     secret_value: str = Field(
         ...,
-        description="The new secret value/content",
+        description="The secret value/content to store",
+    ),
+    description: Optional[str] = Field(
+        None,
+        description="A brief description of the secret",
     ),
     content_type: Optional[str] = Field(
         None,
-        description="The content type of the secret (e.g., 'application/json', 'text/plain'). Defaults to 'application/octet-stream'.",
+        description="Accepted for compatibility. OCI Vault stores all secret content base64-encoded and keeps no content type.",
     ),
-) -> CreateSecretVersionResponse:
-    """Create a new version of an existing secret.
+    vault_id: Optional[str] = Field(
+        None,
+        description="The OCID of the vault. If not provided, uses the configured default vault.",
+    ),
+    compartment_id: Optional[str] = Field(
+        None,
+        description="The OCID of the compartment. If not provided, uses the configured default compartment.",
+    ),
+) -> CreateSecretResponse:
+    """Create a new secret in the vault."""
+    return await blocking.run(
+        _create_secret,
+        name,
+        secret_value,
+        description,
+        content_type,
+        vault_id,
+        compartment_id,
+        vault_key=_default_vault(vault_id),
+    )
 
-    Each update creates a new version, the previous version is not deleted.
-    """
+
+def _update_secret(
+    secret_id: str,
+    secret_value: str,
+    content_type: Optional[str],
+) -> CreateSecretVersionResponse:
     try:
-        client = get_secrets_client()
+        import oci
 
-        # Prepare secret content
-        secret_content = oci.vault.models.SecretContentDetails(
-            content_type=content_type or "application/octet-stream",
-            content=secret_value,
-        )
+        client = get_vault_client()
 
-        # Create new secret version
-        create_secret_version_details = oci.vault.models.CreateSecretVersionDetails(
-            secret_content=secret_content,
-        )
+        # Prepare secret content
+        secret_content = _secret_content(secret_value)
 
-        response = client.create_secret_version(
+        # New content creates a new version that becomes the current one
+        response = client.update_secret(
             secret_id=secret_id,
-            create_secret_version_details=create_secret_version_details,
+            update_secret_details=oci.vault.models.UpdateSecretDetails(
+                secret_content=secret_content,
+            ),
         )
 
-        version = response.data
+        secret = response.data
+        invalidate_secret(secret_id)
+        bundle_cache.invalidate(secret_id)
         logger.info(f"Created new version for secret: {secret_id}")
 
         return CreateSecretVersionResponse(
             status="success",
             message="Secret version created successfully",
             secret_id=secret_id,
-            version_number=version.version_number,
-            lifecycle_state=version.lifecycle_state,
-            time_created=str(version.time_created) if version.time_created else None,
-            stages=version.stages,
+            version_number=secret.current_version_number,
+            lifecycle_state=secret.lifecycle_state,
+            stages=[secret_content.stage],
         )
 
     except Exception as e:
@@ -539,27 +2158,212 @@ def update_secret(
         raise e
 
 
-@mcp.tool(description="Updates the metadata of a secret")
-def update_secret_metadata(
+@mcp.tool(description="Creates a new version of an existing secret")
+async def update_secret(
     secret_id: str = Field(
         ...,
         description="The OCID of the secret to update",
     ),
-    description: Optional[str] = Field(
+    secret_value: str = Field(
+        ...,
+        description="The new secret value/content",
+    ),
+    content_type: Optional[str] = Field(
         None,
-        description="The new description of the secret",
+        description="Accepted for compatibility. OCI Vault stores all secret content base64-encoded and keeps no content type.",
     ),
-    freeform_tags: Optional[dict] = Field(
+) -> CreateSecretVersionResponse:
+    """Create a new version of an existing secret.
+
+    Each update creates a new version, the previous version is not deleted.
+    """
+    return await blocking.run(
+        _update_secret,
+        secret_id,
+        secret_value,
+        content_type,
+        vault_key=_vault_of_secret(secret_id),
+    )
+
+
+def _content_matches(secret_id: str, secret_value: str) -> bool:
+    """
+    Whether the current version of a secret holds exactly ``secret_value``.
+
+    Digests of the base64 content are compared, so the stored value is never
+    decoded.
+    """
+    _, content = _fetch_secret_bundle(secret_id, None)
+    try:
+        if content is None:
+            return False
+        expected = base64.b64encode(secret_value.encode("utf-8"))
+        return hmac.compare_digest(
+            hashlib.sha256(content).digest(), hashlib.sha256(expected).digest()
+        )
+    finally:
+        zeroize(content)
+
+
+def _put_secret(
+    item: SecretWrite,
+    result: SecretWriteResult,
+    existing: Optional[SecretMetadata],
+    vault_id: Optional[str],
+    compartment_id: Optional[str],
+    dry_run: bool,
+    skip_unchanged: bool,
+):
+    """Create or rotate one secret of a bulk write, recording the outcome."""
+    secret_id = item.secret_id or (existing.id if existing else None)
+    if secret_id is None:
+        result.action = "create"
+        if not dry_run:
+            created = _create_secret(
+                item.name,
+                item.secret_value,
+                item.description,
+                item.content_type,
+                vault_id,
+                compartment_id,
+            )
+            result.secret_id = created.secret_id
+        return
+
+    result.secret_id = secret_id
+    if skip_unchanged and _content_matches(secret_id, item.secret_value):
+        result.action = "unchanged"
+        return
+    result.action = "rotate"
+    if not dry_run:
+        updated = _update_secret(secret_id, item.secret_value, item.content_type)
+        result.version_number = updated.version_number
+
+
+@mcp.tool(description="Creates or rotates many secrets concurrently")
+async def put_secrets(
+    items: list[SecretWrite] = Field(
+        ...,
+        description="The secrets to write. Items with a secret_id are rotated; items with a name are "
+        "created, or rotated if the vault already has a secret of that name.",
+    ),
+    vault_id: Optional[str] = Field(
         None,
-        description="Free-form tags as a key-value dictionary (e.g., {'environment': 'prod', 'team': 'platform'})",
+        description="The OCID of the vault used for names. If not provided, uses the configured default vault.",
     ),
-    defined_tags: Optional[dict] = Field(
+    compartment_id: Optional[str] = Field(
         None,
-        description="Defined tags as a nested dictionary (e.g., {'namespace.key': {'subkey': 'value'}})",
+        description="The OCID of the compartment used for names. If not provided, uses the configured default compartment.",
+    ),
+    dry_run: bool = Field(
+        False,
+        description="Report what would be done without creating or rotating anything.",
+    ),
+    skip_unchanged: bool = Field(
+        True,
+        description="Do not rotate secrets whose current content already matches the new value.",
+    ),
+    max_concurrency: Optional[int] = Field(
+        None,
+        description="The maximum number of secrets written at once. Defaults to OCI_VAULT_WRITE_CONCURRENCY.",
+        ge=1,
+        le=64,
     ),
+) -> list[SecretWriteResult]:
+    """Create or rotate many secrets in one call.
+
+    Secrets are written concurrently and a failure for one item is reported in
+    its ``error`` field instead of failing the whole request. Writing the same
+    secret twice in one request is reported as an error on the repeat.
+    """
+    try:
+        results = [
+            SecretWriteResult(name=item.name, secret_id=item.secret_id, dry_run=dry_run)
+            for item in items
+        ]
+
+        effective_vault_id = effective_compartment_id = None
+        by_name: dict[str, SecretMetadata] = {}
+        if any(item.secret_id is None for item in items):
+            effective_vault_id, effective_compartment_id = _resolve_vault(
+                vault_id, compartment_id
+            )
+            # A single fresh listing tells which names already exist
+            listing = await blocking.run(
+                _list_secrets,
+                effective_vault_id,
+                effective_compartment_id,
+                None,
+                True,
+                vault_key=effective_vault_id,
+            )
+            # Names of secrets pending deletion are not rotated
+            by_name = {
+                secret.name: secret
+                for secret in listing
+                if secret.lifecycle_state == "ACTIVE"
+            }
+
+        work, seen = [], set()
+        for item, result in zip(items, results):
+            existing = by_name.get(item.name) if item.secret_id is None else None
+            # Items naming an existing secret target the same secret as its OCID
+            key = item.secret_id or (existing.id if existing else item.name)
+            if key is None:
+                result.error = "Either name or secret_id is required"
+            elif key in seen:
+                result.error = f"Duplicate item for secret '{item.name or key}'"
+            else:
+                seen.add(key)
+                work.append((item, result, existing))
+
+        async def write(
+            work_item: tuple[SecretWrite, SecretWriteResult, Optional[SecretMetadata]],
+        ):
+            item, result, existing = work_item
+
+            try:
+                await blocking.run(
+                    _put_secret,
+                    item,
+                    result,
+                    existing,
+                    effective_vault_id,
+                    effective_compartment_id,
+                    dry_run,
+                    skip_unchanged,
+                    vault_key=(
+                        effective_vault_id
+                        if item.secret_id is None
+                        else _vault_of_secret(item.secret_id)
+                    ),
+                )
+            except Exception as e:
+                result.error = str(e)
+
+        await map_bounded(write, work, max_concurrency or _write_concurrency)
+
+        failed = sum(1 for result in results if result.error)
+        logger.info(
+            f"Wrote {len(results) - failed} Secrets ({failed} failed"
+            + (", dry run)" if dry_run else ")")
+        )
+        return results
+
+    except Exception as e:
+        logger.error(f"Error in put_secrets tool: {str(e)}")
+        raise e
+
+
+def _update_secret_metadata(
+    secret_id: str,
+    description: Optional[str],
+    freeform_tags: Optional[dict],
+    defined_tags: Optional[dict],
 ) -> UpdateSecretMetadataResponse:
-    """Update the metadata of a secret without creating a new version."""
     try:
+        import oci
+
         client = get_vault_client()
 
         # Build update details with only provided fields
@@ -578,6 +2382,8 @@ def update_secret_metadata(
         )
 
         secret = response.data
+        invalidate_secret(secret_id, secret.vault_id)
+        secret_index.upsert(map_secret_metadata(secret), namespace=_namespace())
         logger.info(f"Updated secret metadata: {secret_id}")
 
         return UpdateSecretMetadataResponse(
@@ -596,25 +2402,43 @@ def update_secret_metadata(
         raise e
 
 
-@mcp.tool(description="Schedules a secret for deletion")
-def delete_secret(
+@mcp.tool(description="Updates the metadata of a secret")
+async def update_secret_metadata(
     secret_id: str = Field(
         ...,
-        description="The OCID of the secret to delete",
+        description="The OCID of the secret to update",
     ),
-    time_of_deletion_in_days: Optional[int] = Field(
+    description: Optional[str] = Field(
         None,
-        description="Number of days until the secret is deleted (minimum 7, maximum 30). If not provided, uses OCI default (usually 30 days).",
-        ge=7,
-        le=30,
+        description="The new description of the secret",
     ),
-) -> DeleteSecretResponse:
-    """Schedule a secret for deletion.
+    freeform_tags: Optional[dict] = Field(
+        None,
+        description="Free-form tags as a key-value dictionary (e.g., {'environment': 'prod', 'team': 'platform'})",
+    ),
+    defined_tags: Optional[dict] = Field(
+        None,
+        description="Defined tags as a nested dictionary (e.g., {'namespace.key': {'subkey': 'value'}})",
+    ),
+) -> UpdateSecretMetadataResponse:
+    """Update the metadata of a secret without creating a new version."""
+    return await blocking.run(
+        _update_secret_metadata,
+        secret_id,
+        description,
+        freeform_tags,
+        defined_tags,
+        vault_key=_vault_of_secret(secret_id),
+    )
 
-    Secrets in OCI Vault cannot be immediately deleted. They must be scheduled
-    for deletion and are permanently deleted after the specified waiting period.
-    """
+
+def _delete_secret(
+    secret_id: str,
+    time_of_deletion_in_days: Optional[int],
+) -> DeleteSecretResponse:
     try:
+        import oci
+
         client = get_vault_client()
 
         # Build delete details
@@ -631,6 +2455,9 @@ def delete_secret(
         )
 
         secret = response.data
+        invalidate_secret(secret_id, secret.vault_id)
+        bundle_cache.invalidate(secret_id)
+        secret_index.upsert(map_secret_metadata(secret), namespace=_namespace())
         logger.info(f"Scheduled deletion for secret: {secret_id}")
 
         return DeleteSecretResponse(
@@ -639,9 +2466,9 @@ def delete_secret(
             secret_id=secret.id,
             name=secret.secret_name,
             lifecycle_state=secret.lifecycle_state,
-            time_of_deletion=str(secret.time_of_deletion)
-            if secret.time_of_deletion
-            else None,
+            time_of_deletion=(
+                str(secret.time_of_deletion) if secret.time_of_deletion else None
+            ),
         )
 
     except Exception as e:
@@ -649,6 +2476,32 @@ def delete_secret(
         raise e
 
 
+@mcp.tool(description="Schedules a secret for deletion")
+async def delete_secret(
+    secret_id: str = Field(
+        ...,
+        description="The OCID of the secret to delete",
+    ),
+    time_of_deletion_in_days: Optional[int] = Field(
+        None,
+        description="Number of days until the secret is deleted (minimum 7, maximum 30). If not provided, uses OCI default (usually 30 days).",
+        ge=7,
+        le=30,
+    ),
+) -> DeleteSecretResponse:
+    """Schedule a secret for deletion.
+
+    Secrets in OCI Vault cannot be immediately deleted. They must be scheduled
+    for deletion and are permanently deleted after the specified waiting period.
+    """
+    return await blocking.run(
+        _delete_secret,
+        secret_id,
+        time_of_deletion_in_days,
+        vault_key=_vault_of_secret(secret_id),
+    )
+
+
 def main():
     host = os.getenv("ORACLE_MCP_HOST")
     port = os.getenv("ORACLE_MCP_PORT")
@@ -0,0 +1,186 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import contextvars
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Callable, Iterable, Iterator, Optional
+
+
+@dataclass(frozen=True)
+class VaultContext:
+    """
+    The defaults one MCP session (or API key) works with.
+
+    ``profile`` selects the OCI config profile, and with it the signer and
+    pooled clients; None means ``OCI_CONFIG_PROFILE``. ``region`` overrides
+    the region of the profile.
+    """
+
+    vault_id: Optional[str] = None
+    compartment_id: Optional[str] = None
+    profile: Optional[str] = None
+    region: Optional[str] = None
+
+    @property
+    def namespace(self) -> str:
+        """Cache namespace; contexts with the same credentials share cached metadata."""
+        return self.profile or ""
+
+    @property
+    def credentials(self) -> "VaultContext":
+        """Only the profile and region, which select the OCI clients."""
+        return VaultContext(profile=self.profile, region=self.region)
+
+
+# (session key, context) of the request being served
+_binding: contextvars.ContextVar[Optional[tuple[Optional[str], VaultContext]]] = (
+    contextvars.ContextVar("oci_vault_session", default=None)
+)
+
+
+def api_key_session(api_key: str) -> str:
+    """Session key for an API key, without keeping the key itself."""
+    return "api-key:" + hashlib.sha256(api_key.encode()).hexdigest()[:32]
+
+
+class SessionRegistry:
+    """
+    Per-session vault configuration.
+
+    Sessions start out with ``default`` (taken from the environment) and only
+    get an entry of their own once they are configured. At most
+    ``max_sessions`` entries are kept; the least recently used one is dropped
+    first, as is any entry unused for ``idle_timeout`` seconds.
+
+    Switching to an OCI profile other than the default is only allowed for
+    profiles in ``allowed_profiles`` (``*`` allows any profile of the config
+    file).
+    """
+
+    def __init__(
+        self,
+        default: VaultContext,
+        max_sessions: int = 1024,
+        idle_timeout: float = 86400.0,
+        allowed_profiles: Iterable[str] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.default = default
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.allowed_profiles = {p.strip() for p in allowed_profiles if p.strip()}
+        self._clock = clock
+        self._lock = threading.Lock()
+        # session key -> (context, last used)
+        self._sessions: OrderedDict[str, tuple[VaultContext, float]] = OrderedDict()
+        self.configured = 0
+        self.evictions = 0
+
+    def get(self, key: Optional[str]) -> VaultContext:
+        """Return the context of a session, or the default if it has none."""
+        if key is None:
+            return self.default
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                return self.default
+            context, last_used = entry
+            now = self._clock()
+            if now - last_used >= self.idle_timeout:
+                del self._sessions[key]
+                self.evictions += 1
+                return self.default
+            self._sessions[key] = (context, now)
+            self._sessions.move_to_end(key)
+            return context
+
+    def configure(self, key: Optional[str], **changes) -> VaultContext:
+        """
+        Change the context of a session and return it.
+
+        Without a session (e.g. when called outside of an MCP request) the
+        default context is changed instead.
+        """
+        profile = changes.get("profile")
+        if profile and not self._profile_allowed(profile):
+            raise PermissionError(
+                f"Profile {profile} is not allowed by OCI_VAULT_ALLOWED_PROFILES"
+            )
+        if key is None:
+            self.default = replace(self.default, **changes)
+            return self.default
+        with self._lock:
+            entry = self._sessions.get(key)
+            context = replace(entry[0] if entry else self.default, **changes)
+            self._sessions[key] = (context, self._clock())
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evictions += 1
+            self.configured += 1
+            return context
+
+    def _profile_allowed(self, profile: str) -> bool:
+        return (
+            profile == self.default.profile
+            or "*" in self.allowed_profiles
+            or profile in self.allowed_profiles
+        )
+
+    @contextmanager
+    def bind(
+        self, key: Optional[str], context: Optional[VaultContext] = None
+    ) -> Iterator[VaultContext]:
+        """Serve the enclosed calls with the context of session ``key``."""
+        context = context or self.get(key)
+        token = _binding.set((key, context))
+        try:
+            yield context
+        finally:
+            _binding.reset(token)
+
+    def current(self) -> VaultContext:
+        """Return the context of the request being served, or the default."""
+        binding = _binding.get()
+        return binding[1] if binding is not None else self.default
+
+    def current_key(self) -> Optional[str]:
+        binding = _binding.get()
+        return binding[0] if binding is not None else None
+
+    def configure_current(self, **changes) -> VaultContext:
+        """Change the context of the session being served, for this call too."""
+        key = self.current_key()
+        context = self.configure(key, **changes)
+        if _binding.get() is not None:
+            _binding.set((key, context))
+        return context
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "configured": self.configured,
+                "evictions": self.evictions,
+                "profiles": len({c.profile for c, _ in self._sessions.values()}),
+            }
+
+
+sessions = SessionRegistry(
+    VaultContext(
+        vault_id=os.getenv("OCI_VAULT_ID"),
+        compartment_id=os.getenv("OCI_COMPARTMENT_ID"),
+    ),
+    max_sessions=int(os.getenv("OCI_VAULT_MAX_SESSIONS", "1024")),
+    idle_timeout=float(os.getenv("OCI_VAULT_SESSION_IDLE_SECONDS", "86400")),
+    allowed_profiles=os.getenv("OCI_VAULT_ALLOWED_PROFILES", "").split(","),
+)
@@ -0,0 +1,246 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator, List, Optional
+
+from oracle.oci_vault_mcp_server.models import (
+    SecretMetadata,
+    SecretMetadataPage,
+    SecretVersion,
+    SecretVersionPage,
+)
+from pydantic import BaseModel, TypeAdapter
+
+
+def shared_key(kind: str, key: Hashable) -> str:
+    """Name a cache key, tag or flight in a shared backend."""
+    return f"{kind}:{hashlib.sha256(repr(key).encode()).hexdigest()[:32]}"
+
+
+class SharedBackend(ABC):
+    """
+    The few key/value operations replicas coordinate through.
+
+    Values are bytes and every key but a counter expires after ``ttl``
+    seconds. ``add`` stores a value only if the key does not exist yet.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.get_many([key])[0]
+
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Return the value of every key, None for missing ones."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float):
+        """Store ``value`` under ``key``."""
+
+    @abstractmethod
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """Store ``value`` unless ``key`` exists; return whether it was stored."""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Remove ``key`` if it exists."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Add one to the counter at ``key`` (0 if missing) and return it."""
+
+    def stats(self) -> dict:
+        return {"backend": type(self).__name__}
+
+
+class RedisBackend(SharedBackend):
+    """A backend on a Redis server (or anything speaking its protocol)."""
+
+    def __init__(self, client: Any, prefix: str = "oci-vault:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        try:
+            import redis
+        except ImportError:
+            raise ImportError(
+                "OCI_VAULT_SHARED_CACHE_URL points to Redis but the redis package "
+                "is not installed; install oci-vault-mcp-server[redis]"
+            )
+        return cls(redis.Redis.from_url(url))
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return self.client.mget([self.prefix + key for key in keys])
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self.client.set(self.prefix + key, value, px=max(int(ttl * 1000), 1))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return bool(
+            self.client.set(
+                self.prefix + key, value, px=max(int(ttl * 1000), 1), nx=True
+            )
+        )
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    def incr(self, key: str) -> int:
+        return self.client.incr(self.prefix + key)
+
+
+class FileBackend(SharedBackend):
+    """
+    A backend in a SQLite file, for replicas on one host and for tests.
+
+    Expiry uses the wall clock, as the file is shared between processes.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        # Create the file owner-only before SQLite opens it
+        os.close(os.open(path, os.O_CREAT | os.O_RDWR, 0o600))
+        self._connection = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+        )
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, value FROM entries WHERE key IN "
+                f"({','.join('?' * len(keys))}) "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (*keys, self._clock()),
+            ).fetchall()
+        found = {key: bytes(value) for key, value in rows}
+        return [found.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes, ttl: float):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                (key, value, self._clock() + ttl),
+            )
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        now = self._clock()
+        with self._lock, self._transaction():
+            self._connection.execute(
+                "DELETE FROM entries WHERE key = ? AND expires_at <= ?", (key, now)
+            )
+            cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO entries VALUES (?, ?, ?)",
+                (key, value, now + ttl),
+            )
+            return cursor.rowcount == 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def incr(self, key: str) -> int:
+        with self._lock, self._transaction():
+            row = self._connection.execute(
+                "SELECT value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            value = int(row[0]) + 1 if row else 1
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, NULL)",
+                (key, str(value).encode()),
+            )
+            return value
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        # Take the write lock up front, so concurrent processes serialize here
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+
+class ModelCodec:
+    """
+    Serializes tool results (models and lists of models) for a shared backend.
+
+    Only the registered models can be encoded and decoded, so nothing read
+    from the backend is ever executed.
+    """
+
+    def __init__(self, *models: type):
+        self._models = {model.__name__: TypeAdapter(model) for model in models}
+        self._lists = {model.__name__: TypeAdapter(List[model]) for model in models}
+
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, list):
+            if not value:
+                return b"[]\n[]"
+            name = type(value[0]).__name__
+            adapter = self._lists.get(name)
+            header = b"[]"
+        else:
+            name = type(value).__name__
+            adapter = self._models.get(name) if isinstance(value, BaseModel) else None
+            header = b""
+        if adapter is None:
+            raise TypeError(f"{name} cannot be shared between replicas")
+        return header + name.encode() + b"\n" + adapter.dump_json(value)
+
+    def decode(self, data: bytes) -> Any:
+        name, _, body = data.partition(b"\n")
+        name = name.decode()
+        if name == "[]":
+            return []
+        if name.startswith("[]"):
+            return self._lists[name[2:]].validate_json(body)
+        return self._models[name].validate_json(body)
+
+
+metadata_codec = ModelCodec(
+    SecretMetadata, SecretVersion, SecretMetadataPage, SecretVersionPage
+)
+
+
+def backend_from_url(url: Optional[str]) -> Optional[SharedBackend]:
+    """
+    Return the backend at ``url``: ``redis://`` (or ``rediss://``, ``unix://``)
+    for a Redis server, ``file://`` or a plain path for a SQLite file.
+    """
+    if not url:
+        return None
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend.from_url(url)
+    path = url.removeprefix("file://")
+    return FileBackend(os.path.expanduser(path))
+
+
+shared_backend = backend_from_url(os.getenv("OCI_VAULT_SHARED_CACHE_URL"))
+
+# How long a replica may lead a shared call before others stop waiting for it
+shared_lease = float(os.getenv("OCI_VAULT_SHARED_LEASE_SECONDS", "30"))
@@ -0,0 +1,262 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from logging import Logger
+from typing import Callable, Optional
+
+from oracle.oci_vault_mcp_server.models import (
+    SecretMetadata,
+    SecretVersion,
+    _secret_metadata_list,
+    _secret_version_list,
+)
+
+logger = Logger(__name__, level="INFO")
+
+# Bump when the stored record format changes; older files are rebuilt
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    vault_id TEXT NOT NULL,
+    compartment_id TEXT NOT NULL,
+    saved_at REAL NOT NULL,
+    PRIMARY KEY (vault_id, compartment_id)
+);
+CREATE TABLE IF NOT EXISTS secrets (
+    vault_id TEXT NOT NULL,
+    compartment_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    secret_id TEXT NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (vault_id, compartment_id, position)
+);
+CREATE INDEX IF NOT EXISTS secrets_by_id ON secrets (secret_id);
+CREATE TABLE IF NOT EXISTS versions (
+    secret_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    record TEXT NOT NULL,
+    saved_at REAL NOT NULL,
+    PRIMARY KEY (secret_id, position)
+);
+"""
+
+
+class SnapshotStore:
+    """
+    On-disk snapshot of secret listings and version lists for warm restarts.
+
+    Only ``SecretMetadata`` and ``SecretVersion`` records are stored; secret
+    contents never are. Each listing is handed out at most once per process
+    (see :meth:`take_secrets`): it only bridges the gap until the first fresh
+    listing, after which the in-memory caches take over.
+
+    ``path`` of None disables the store.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_age: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        # Keys already taken (or refreshed) by this process
+        self._taken: set = set()
+        self.hits = 0
+        self.misses = 0
+        self.saves = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            # Create the file owner-only before SQLite opens it
+            os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            if (
+                connection.execute("PRAGMA user_version").fetchone()[0]
+                != SCHEMA_VERSION
+            ):
+                connection.executescript(
+                    "DROP TABLE IF EXISTS listings;"
+                    "DROP TABLE IF EXISTS secrets;"
+                    "DROP TABLE IF EXISTS versions;"
+                )
+                connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _first_take(self, key: tuple) -> bool:
+        if key in self._taken:
+            return False
+        self._taken.add(key)
+        return True
+
+    def take_secrets(
+        self, vault_id: str, compartment_id: str
+    ) -> Optional[list[SecretMetadata]]:
+        """
+        Return the stored listing of a vault, once per process.
+
+        Returns None if there is no listing younger than ``max_age``, or if
+        this process already took or refreshed it.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            if not self._first_take(("secrets", vault_id, compartment_id)):
+                return None
+            connection = self._connect()
+            listing = connection.execute(
+                "SELECT saved_at FROM listings WHERE vault_id = ? AND compartment_id = ?",
+                (vault_id, compartment_id),
+            ).fetchone()
+            if listing is None or self._clock() - listing[0] > self.max_age:
+                self.misses += 1
+                return None
+            records = connection.execute(
+                "SELECT record FROM secrets WHERE vault_id = ? AND compartment_id = ? "
+                "ORDER BY position",
+                (vault_id, compartment_id),
+            ).fetchall()
+            self.hits += 1
+        return _secret_metadata_list.validate_json(
+            "[" + ",".join(record for (record,) in records) + "]"
+        )
+
+    def save_secrets(
+        self, vault_id: str, compartment_id: str, secrets: list[SecretMetadata]
+    ):
+        """Replace the stored listing of a vault with a complete fresh one."""
+        if not self.enabled:
+            return
+        rows = [
+            (vault_id, compartment_id, position, s.id, s.model_dump_json())
+            for position, s in enumerate(secrets)
+            if isinstance(s, SecretMetadata)
+        ]
+        with self._lock:
+            self._taken.add(("secrets", vault_id, compartment_id))
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "DELETE FROM secrets WHERE vault_id = ? AND compartment_id = ?",
+                    (vault_id, compartment_id),
+                )
+                connection.executemany(
+                    "INSERT INTO secrets VALUES (?, ?, ?, ?, ?)", rows
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO listings VALUES (?, ?, ?)",
+                    (vault_id, compartment_id, self._clock()),
+                )
+            self.saves += 1
+
+    def take_versions(self, secret_id: str) -> Optional[list[SecretVersion]]:
+        """Return the stored versions of a secret, once per process."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            if not self._first_take(("versions", secret_id)):
+                return None
+            records = (
+                self._connect()
+                .execute(
+                    "SELECT record, saved_at FROM versions WHERE secret_id = ? "
+                    "ORDER BY position",
+                    (secret_id,),
+                )
+                .fetchall()
+            )
+            if not records or self._clock() - records[0][1] > self.max_age:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _secret_version_list.validate_json(
+            "[" + ",".join(record for record, _ in records) + "]"
+        )
+
+    def save_versions(self, secret_id: str, versions: list[SecretVersion]):
+        """Replace the stored versions of a secret with a complete fresh list."""
+        if not self.enabled:
+            return
+        now = self._clock()
+        rows = [
+            (secret_id, position, v.model_dump_json(), now)
+            for position, v in enumerate(versions)
+            if isinstance(v, SecretVersion)
+        ]
+        with self._lock:
+            self._taken.add(("versions", secret_id))
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "DELETE FROM versions WHERE secret_id = ?", (secret_id,)
+                )
+                connection.executemany("INSERT INTO versions VALUES (?, ?, ?, ?)", rows)
+            self.saves += 1
+
+    def forget(self, secret_id: Optional[str] = None, vault_id: Optional[str] = None):
+        """Drop what a write made stale: a secret's versions and its vault's listings."""
+        if not self.enabled:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                if secret_id is not None:
+                    connection.execute(
+                        "DELETE FROM versions WHERE secret_id = ?", (secret_id,)
+                    )
+                    if vault_id is None:
+                        row = connection.execute(
+                            "SELECT vault_id FROM secrets WHERE secret_id = ?",
+                            (secret_id,),
+                        ).fetchone()
+                        vault_id = row[0] if row else None
+                if vault_id is not None:
+                    connection.execute(
+                        "DELETE FROM secrets WHERE vault_id = ?", (vault_id,)
+                    )
+                    connection.execute(
+                        "DELETE FROM listings WHERE vault_id = ?", (vault_id,)
+                    )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "saves": self.saves,
+            }
+
+
+_snapshot_dir = os.getenv("OCI_VAULT_SNAPSHOT_DIR")
+
+snapshot_store = SnapshotStore(
+    path=(
+        os.path.join(os.path.expanduser(_snapshot_dir), "snapshot.sqlite3")
+        if _snapshot_dir
+        else None
+    ),
+    max_age=float(os.getenv("OCI_VAULT_SNAPSHOT_MAX_AGE_SECONDS", "86400")),
+)
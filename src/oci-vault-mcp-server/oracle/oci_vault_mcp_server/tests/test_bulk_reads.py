@@ -0,0 +1,87 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import threading
+import time
+
+import pytest
+from oracle.oci_vault_mcp_server import server
+from oracle.oci_vault_mcp_server.models import SecretMetadata
+from oracle.oci_vault_mcp_server.sessions import VaultContext
+
+
+@pytest.fixture
+def vault(monkeypatch):
+    calls = {"metadata": [], "bundle": [], "in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    def get_secret_metadata(secret_id, bypass_cache):
+        with lock:
+            calls["metadata"].append(secret_id)
+            calls["in_flight"] += 1
+            calls["max_in_flight"] = max(calls["max_in_flight"], calls["in_flight"])
+        try:
+            time.sleep(0.05)
+            if secret_id == "broken":
+                raise RuntimeError("NotAuthorizedOrNotFound")
+            return SecretMetadata(id=secret_id, name=f"name-{secret_id}")
+        finally:
+            with lock:
+                calls["in_flight"] -= 1
+
+    def get_secret_value(secret_id, version_number):
+        calls["bundle"].append(secret_id)
+        return {"secret_id": secret_id, "version_number": 1}
+
+    monkeypatch.setattr(
+        server.sessions, "default", VaultContext(vault_id="v1", compartment_id="c1")
+    )
+    monkeypatch.setattr(
+        server,
+        "_list_secrets",
+        lambda *args: [SecretMetadata(id="s-db", name="db", vault_id="v1")],
+    )
+    monkeypatch.setattr(server, "_get_secret_metadata", get_secret_metadata)
+    monkeypatch.setattr(server, "_get_secret_value", get_secret_value)
+    return calls
+
+
+async def get(secret_ids=None, names=None, include_bundle=False, max_concurrency=None):
+    return await server.get_secrets.fn(
+        secret_ids=secret_ids,
+        names=names,
+        vault_id=None,
+        compartment_id=None,
+        include_bundle=include_bundle,
+        max_concurrency=max_concurrency,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_secrets_bounds_concurrency(vault):
+    results = await get(secret_ids=[f"s{i}" for i in range(6)], max_concurrency=2)
+
+    assert [r.name for r in results] == [f"name-s{i}" for i in range(6)]
+    assert vault["max_in_flight"] == 2
+
+
+@pytest.mark.asyncio
+async def test_names_are_resolved_from_one_listing(vault):
+    results = await get(names=["db", "missing"], include_bundle=True)
+
+    assert results[0].secret_id == "s-db"
+    # The listing already supplies the metadata
+    assert vault["metadata"] == []
+    assert vault["bundle"] == ["s-db"]
+    assert "No secret named 'missing'" in results[1].error
+
+
+@pytest.mark.asyncio
+async def test_one_failure_does_not_fail_the_others(vault):
+    results = await get(secret_ids=["s1", "broken", "s2"])
+
+    assert [r.error for r in results] == [None, "NotAuthorizedOrNotFound", None]
+    assert results[2].metadata.name == "name-s2"
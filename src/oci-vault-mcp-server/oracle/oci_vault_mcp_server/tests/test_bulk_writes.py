@@ -0,0 +1,103 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from oracle.oci_vault_mcp_server import server
+from oracle.oci_vault_mcp_server.models import SecretMetadata, SecretWrite
+from oracle.oci_vault_mcp_server.sessions import VaultContext
+
+
+@pytest.fixture
+def vault(monkeypatch):
+    stored = {"s1": "same", "s2": "old"}
+    writes = []
+
+    def create_secret(name, value, description, content_type, vault_id, compartment_id):
+        writes.append(("create", name))
+        return SimpleNamespace(secret_id=f"new-{name}")
+
+    def update_secret(secret_id, value, content_type):
+        writes.append(("rotate", secret_id))
+        return SimpleNamespace(version_number=2)
+
+    monkeypatch.setattr(
+        server.sessions, "default", VaultContext(vault_id="v1", compartment_id="c1")
+    )
+    monkeypatch.setattr(
+        server,
+        "_list_secrets",
+        lambda *args: [
+            SecretMetadata(id="s1", name="db", lifecycle_state="ACTIVE"),
+            SecretMetadata(id="s2", name="api", lifecycle_state="ACTIVE"),
+            SecretMetadata(id="s0", name="old", lifecycle_state="PENDING_DELETION"),
+        ],
+    )
+    monkeypatch.setattr(
+        server, "_content_matches", lambda secret_id, value: stored[secret_id] == value
+    )
+    monkeypatch.setattr(server, "_create_secret", create_secret)
+    monkeypatch.setattr(server, "_update_secret", update_secret)
+    return writes
+
+
+async def put(items, dry_run=False):
+    return await server.put_secrets.fn(
+        items=[SecretWrite(**item) for item in items],
+        vault_id=None,
+        compartment_id=None,
+        dry_run=dry_run,
+        skip_unchanged=True,
+        max_concurrency=None,
+    )
+
+
+ITEMS = [
+    {"name": "db", "secret_value": "same"},
+    {"name": "api", "secret_value": "new"},
+    {"name": "smtp", "secret_value": "new"},
+    {"name": "smtp", "secret_value": "again"},
+    {"secret_value": "orphan"},
+]
+
+
+@pytest.mark.asyncio
+async def test_put_secrets_creates_rotates_and_skips(vault):
+    results = await put(ITEMS)
+
+    assert [r.action for r in results] == ["unchanged", "rotate", "create", None, None]
+    assert results[1].version_number == 2
+    assert results[2].secret_id == "new-smtp"
+    assert "Duplicate" in results[3].error
+    assert "required" in results[4].error
+    assert sorted(vault) == [("create", "smtp"), ("rotate", "s2")]
+
+
+@pytest.mark.asyncio
+async def test_dry_run_writes_nothing(vault):
+    results = await put(ITEMS, dry_run=True)
+
+    assert [r.action for r in results[:3]] == ["unchanged", "rotate", "create"]
+    assert all(r.dry_run for r in results)
+    assert vault == []
+
+
+@pytest.mark.asyncio
+async def test_put_secrets_resolves_names_before_writing(vault):
+    results = await put(
+        [
+            {"secret_id": "s2", "secret_value": "new"},
+            {"name": "api", "secret_value": "other"},
+            {"name": "old", "secret_value": "new"},
+        ]
+    )
+
+    # The name resolves to the secret already rotated by OCID
+    assert "Duplicate" in results[1].error
+    # A name only held by a secret pending deletion is not rotated
+    assert results[2].action == "create"
+    assert sorted(vault) == [("create", "old"), ("rotate", "s2")]
@@ -0,0 +1,170 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import base64
+from types import SimpleNamespace
+
+import pytest
+from oracle.oci_vault_mcp_server import server
+from oracle.oci_vault_mcp_server.bundles import (
+    BundleCache,
+    ContentAllowlist,
+    decode_content,
+)
+from oracle.oci_vault_mcp_server.sessions import VaultContext
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(clock):
+    cache = BundleCache(
+        enabled=True, max_age=10, refresh_ahead=0.5, hot_threshold=2, clock=clock
+    )
+    loads = []
+
+    def loader(secret_id, version_number):
+        loads.append(secret_id)
+        return {"secret_id": secret_id, "version_number": 2}, bytearray(b"new")
+
+    cache.loader = loader
+    # Drive refreshes from the test instead of the background thread
+    cache._refresher = object()
+    return cache, loads
+
+
+def test_bundles_expire_at_max_age():
+    clock = FakeClock()
+    cache, _ = make_cache(clock)
+    cache.put(("s1", None), {"version_number": 1}, bytearray(b"old"))
+
+    assert cache.get(("s1", None))[1] == bytearray(b"old")
+    clock.now = 10
+    assert cache.get(("s1", None)) is None
+
+
+def test_hot_bundles_are_refreshed_ahead_of_expiry():
+    clock = FakeClock()
+    cache, loads = make_cache(clock)
+    cache.put(("hot", None), {"version_number": 1}, bytearray(b"old"))
+    cache.put(("cold", None), {"version_number": 1}, bytearray(b"old"))
+    cache.get(("hot", None))
+    cache.get(("hot", None))
+
+    clock.now = 6
+    cache.refresh_due()
+
+    assert loads == ["hot"]
+    clock.now = 12
+    result, content = cache.get(("hot", None))
+    assert result["version_number"] == 2
+    assert content == bytearray(b"new")
+    assert cache.get(("cold", None)) is None
+
+
+def test_invalidate_zeroizes_content():
+    cache, _ = make_cache(FakeClock())
+    content = bytearray(b"secret")
+    cache.put(("s1", None), {}, content)
+    cache.put(("s1", 3), {}, bytearray(b"v3"))
+
+    cache.invalidate("s1")
+
+    assert content == bytearray(len(b"secret"))
+    assert cache.get(("s1", None)) is None
+    assert cache.get(("s1", 3)) is None
+
+
+def test_allowlist_matches_ocids_and_name_patterns():
+    allowlist = ContentAllowlist(["ocid1.vaultsecret.oc1..a", " app/* ", ""])
+
+    assert allowlist.allows("ocid1.vaultsecret.oc1..a")
+    assert allowlist.allows("ocid1.vaultsecret.oc1..b", "app/db")
+    assert not allowlist.allows("ocid1.vaultsecret.oc1..b", "other/db")
+    assert not allowlist.allows("ocid1.vaultsecret.oc1..b")
+    assert not ContentAllowlist([""]).enabled
+
+
+def test_decode_content():
+    buffer = bytearray(base64.b64encode("pässword".encode()))
+
+    assert decode_content(buffer, "base64") == buffer.decode()
+    assert decode_content(buffer, "text") == "pässword"
+    with pytest.raises(ValueError):
+        decode_content(bytearray(base64.b64encode(b"\xff\xfe")), "text")
+
+
+@pytest.fixture
+def secrets_client(monkeypatch):
+    requests = []
+
+    def bundle(secret_id, **kwargs):
+        requests.append((secret_id, kwargs))
+        return SimpleNamespace(
+            data=SimpleNamespace(
+                secret_id=secret_id,
+                version_number=3,
+                stages=[kwargs.get("stage", "CURRENT")],
+                time_created=None,
+                secret_bundle_content=SimpleNamespace(
+                    content_type="BASE64", content=base64.b64encode(b"hunter2").decode()
+                ),
+            )
+        )
+
+    client = SimpleNamespace(
+        get_secret_bundle=bundle,
+        get_secret_bundle_by_name=lambda secret_name, vault_id, **kwargs: bundle(
+            f"ocid1.vaultsecret.oc1..{secret_name}", **kwargs
+        ),
+    )
+    monkeypatch.setattr(server, "get_secrets_client", lambda: client)
+    monkeypatch.setattr(server, "bundle_cache", BundleCache(enabled=False))
+    monkeypatch.setattr(
+        server, "content_allowlist", ContentAllowlist(["ocid1.vaultsecret.oc1..ok"])
+    )
+    return requests
+
+
+def test_content_is_returned_only_for_allowed_secrets(secrets_client):
+    result = server._get_secret_value(
+        None, None, "PREVIOUS", "ok", "ocid1.vault.oc1..v", "text"
+    )
+
+    assert result["content"] == "hunter2"
+    assert result["stages"] == ["PREVIOUS"]
+    assert "content" not in server._get_secret_value("ocid1.vaultsecret.oc1..ok", None)
+    with pytest.raises(PermissionError):
+        server._get_secret_value(
+            "ocid1.vaultsecret.oc1..no", None, None, None, None, "text"
+        )
+    # Disallowed secrets are rejected before their bundle is fetched
+    assert [secret_id for secret_id, _ in secrets_client] == [
+        "ocid1.vaultsecret.oc1..ok",
+        "ocid1.vaultsecret.oc1..ok",
+    ]
+
+
+def test_refresh_uses_the_profile_and_region_of_the_first_read(monkeypatch):
+    contexts = []
+
+    def fetch(secret_id, version_number, stage):
+        contexts.append(server.sessions.current())
+        return {"secret_id": secret_id}, None
+
+    monkeypatch.setattr(server, "_fetch_secret_bundle", fetch)
+    session = VaultContext(vault_id="v1", profile="TEAM1", region="eu-frankfurt-1")
+    with server.sessions.bind("session:1", session):
+        key = server._bundle_key("s1", None, None)
+
+    server._reload_secret_bundle(*key)
+
+    assert contexts == [VaultContext(profile="TEAM1", region="eu-frankfurt-1")]
@@ -0,0 +1,57 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from oracle.oci_vault_mcp_server.cache import TTLCache, secret_tag, vault_tag
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(max_entries=10, ttl=5, clock=clock)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    clock.now = 6
+    assert cache.get("key") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_entries=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_tag_drops_tagged_entries():
+    cache = TTLCache(max_entries=10, ttl=60)
+    cache.set("list", [1], tags=[vault_tag("vault1"), secret_tag("s1")])
+    cache.set("meta", 1, tags=[secret_tag("s1")])
+    cache.set("other", 2, tags=[vault_tag("vault2")])
+
+    cache.invalidate_tag(secret_tag("s1"))
+    assert cache.get("list") is None
+    assert cache.get("meta") is None
+    assert cache.get("other") == 2
+
+
+def test_zero_ttl_disables_cache():
+    cache = TTLCache(max_entries=10, ttl=0)
+    cache.set("key", "value")
+    assert cache.get("key") is None
@@ -0,0 +1,99 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from oracle.oci_vault_mcp_server import server
+from oracle.oci_vault_mcp_server.changes import ChangeTracker
+from oracle.oci_vault_mcp_server.models import SecretMetadata, SecretVersion
+from oracle.oci_vault_mcp_server.sessions import VaultContext
+
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def vault(monkeypatch):
+    now = datetime.now(timezone.utc)
+    state = {
+        "secrets": [
+            SecretMetadata(id=f"s{i}", name=f"db-{i}", time_created=EPOCH)
+            for i in range(4)
+        ],
+        "versions": {
+            f"s{i}": [SecretVersion(version_number=1, time_created=EPOCH)]
+            for i in range(4)
+        },
+        "listed": [],
+        "now": now,
+    }
+
+    def list_versions(secret_id):
+        state["listed"].append(secret_id)
+        return state["versions"][secret_id]
+
+    monkeypatch.setattr(
+        server.sessions, "default", VaultContext(vault_id="v1", compartment_id="c1")
+    )
+    monkeypatch.setattr(server, "_list_secrets", lambda *args: list(state["secrets"]))
+    monkeypatch.setattr(server, "_fresh_secret_versions", list_versions)
+    monkeypatch.setattr(server, "change_tracker", ChangeTracker())
+    return state
+
+
+async def changes(**kwargs):
+    arguments = {
+        "since": None,
+        "watermark": None,
+        "vault_id": None,
+        "compartment_id": None,
+        "verify": False,
+        "max_concurrency": None,
+    }
+    arguments.update(kwargs)
+    return await server.changes_since.fn(**arguments)
+
+
+@pytest.mark.asyncio
+async def test_watermark_skips_unchanged_secrets(vault):
+    first = await changes(since=EPOCH - timedelta(days=1))
+    assert {c.change for c in first.changes} == {"created"}
+    assert first.version_listings == 4
+
+    vault["listed"].clear()
+    vault["secrets"][1] = vault["secrets"][1].model_copy(
+        update={"description": "rotated"}
+    )
+    vault["versions"]["s1"].append(
+        SecretVersion(version_number=2, time_created=vault["now"] + timedelta(hours=1))
+    )
+    del vault["secrets"][3]
+
+    feed = await changes(watermark=first.watermark)
+
+    assert vault["listed"] == ["s1"]
+    assert feed.skipped == 2
+    by_id = {c.secret_id: c for c in feed.changes}
+    assert by_id["s1"].change == "updated"
+    assert [v.version_number for v in by_id["s1"].versions] == [2]
+    assert by_id["s3"].change == "removed"
+
+    assert (await changes(watermark=feed.watermark)).changes == []
+
+
+@pytest.mark.asyncio
+async def test_timestamp_mode_and_lost_state(vault):
+    feed = await changes(since=datetime(2026, 1, 1))
+    assert feed.changes == [] and vault["listed"] == []
+
+    # Without its state, a watermark still works as a timestamp
+    server.change_tracker._states.clear()
+    assert (await changes(watermark=feed.watermark)).changes == []
+
+    with pytest.raises(ValueError):
+        await changes(watermark=feed.watermark, vault_id="other")
+    with pytest.raises(ValueError):
+        await changes()
@@ -0,0 +1,83 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+
+import pytest
+from oracle.oci_vault_mcp_server import clients
+from oracle.oci_vault_mcp_server.clients import (
+    SECRETS_CLIENT,
+    VAULTS_CLIENT,
+    ClientPool,
+    _SignerEntry,
+)
+
+
+class FakeClient:
+    def __init__(self, config, signer=None, service_endpoint=None, **kwargs):
+        self.config = config
+        self.signer = signer
+        self.service_endpoint = service_endpoint
+
+
+@pytest.fixture
+def pool(monkeypatch, tmp_path):
+    token_file = tmp_path / "token"
+    token_file.write_text("token")
+    loads = []
+
+    def load_signer(self, profile):
+        loads.append(profile)
+        return _SignerEntry(
+            config={"region": "us-phoenix-1"},
+            signer=object(),
+            token_file=str(token_file),
+            token_mtime=os.stat(token_file).st_mtime,
+        )
+
+    monkeypatch.setattr(ClientPool, "_load_signer", load_signer)
+    monkeypatch.setattr(
+        clients,
+        "_CLIENT_CLASSES",
+        {VAULTS_CLIENT: FakeClient, SECRETS_CLIENT: FakeClient},
+    )
+    pool = ClientPool()
+    pool.token_file = token_file
+    pool.loads = loads
+    return pool
+
+
+def test_clients_are_reused(pool):
+    first = pool.get(VAULTS_CLIENT, profile="DEFAULT")
+    assert pool.get(VAULTS_CLIENT, profile="DEFAULT") is first
+    assert pool.get(SECRETS_CLIENT, profile="DEFAULT") is not first
+    assert pool.loads == ["DEFAULT"]
+    assert pool.stats()["hits"] == 1
+    assert pool.stats()["misses"] == 2
+
+
+def test_region_override_builds_separate_client(pool):
+    home = pool.get(VAULTS_CLIENT, profile="DEFAULT")
+    other = pool.get(VAULTS_CLIENT, profile="DEFAULT", region="eu-frankfurt-1")
+    assert other is not home
+    assert other.config["region"] == "eu-frankfurt-1"
+    assert other.signer is home.signer
+
+
+def test_token_change_rebuilds(pool):
+    first = pool.get(VAULTS_CLIENT, profile="DEFAULT")
+    mtime = os.stat(pool.token_file).st_mtime
+    os.utime(pool.token_file, (mtime + 10, mtime + 10))
+
+    assert pool.get(VAULTS_CLIENT, profile="DEFAULT") is not first
+    assert pool.stats()["rebuilds"] == 1
+    assert pool.loads == ["DEFAULT", "DEFAULT"]
+
+
+def test_service_endpoint_override(pool):
+    pool.service_endpoints = {SECRETS_CLIENT: "http://127.0.0.1:8080"}
+    assert pool.get(SECRETS_CLIENT).service_endpoint == "http://127.0.0.1:8080"
+    assert pool.get(VAULTS_CLIENT).service_endpoint is None
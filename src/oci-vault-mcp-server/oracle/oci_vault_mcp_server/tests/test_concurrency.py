@@ -0,0 +1,178 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from oracle.oci_vault_mcp_server import server
+from oracle.oci_vault_mcp_server.concurrency import BlockingExecutor, SingleFlight
+from oracle.oci_vault_mcp_server.models import SecretMetadata
+from oracle.oci_vault_mcp_server.sessions import VaultContext
+
+
+@pytest.mark.asyncio
+async def test_run_executes_off_the_event_loop():
+    executor = BlockingExecutor(max_workers=2, per_vault_limit=2)
+    caller = threading.get_ident()
+
+    worker = await executor.run(threading.get_ident)
+
+    assert worker != caller
+    assert executor.stats()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_per_vault_limit_bounds_concurrency():
+    executor = BlockingExecutor(max_workers=8, per_vault_limit=2)
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def call():
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+
+    await asyncio.gather(*(executor.run(call, vault_key="vault1") for _ in range(6)))
+
+    assert active["peak"] == 2
+
+
+def test_single_flight_shares_one_call_between_concurrent_callers():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def fetch(secret_id):
+        calls.append(secret_id)
+        release.wait(5)
+        return {"id": secret_id}
+
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(flight.do(("get", "s1"), fetch, "s1"))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    while flight.stats()["coalesced"] < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["s1"]
+    assert len(results) == 5 and all(r is results[0] for r in results)
+    assert flight.stats() == {
+        "enabled": True,
+        "in_flight": 0,
+        "leaders": 1,
+        "coalesced": 4,
+    }
+
+
+def test_single_flight_shares_errors_and_keeps_nothing():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do(("get", "s1"), fail)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    waiter = threading.Thread(target=call)
+    waiter.start()
+    while flight.stats()["coalesced"] < 1:
+        time.sleep(0.001)
+    release.set()
+    leader.join()
+    waiter.join()
+
+    assert len(errors) == 2
+    # A finished call is not reused
+    assert flight.do(("get", "s1"), lambda: "fresh") == "fresh"
+
+
+def test_forget_starts_a_new_call_for_later_callers():
+    flight = SingleFlight()
+    release = threading.Event()
+    started = threading.Event()
+
+    def stale():
+        started.set()
+        release.wait(5)
+        return "stale"
+
+    leader = threading.Thread(target=flight.do, args=(("get", "s1"), stale))
+    leader.start()
+    started.wait(5)
+    flight.forget()
+
+    assert flight.do(("get", "s1"), lambda: "fresh") == "fresh"
+    release.set()
+    leader.join()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_metadata_reads_issue_one_oci_call(monkeypatch):
+    calls = []
+
+    def get_secret(secret_id):
+        calls.append(secret_id)
+        time.sleep(0.05)
+        return SimpleNamespace(
+            data=SimpleNamespace(id=secret_id, vault_id="v1", secret_name="db")
+        )
+
+    monkeypatch.setattr(
+        server, "get_vault_client", lambda: SimpleNamespace(get_secret=get_secret)
+    )
+    monkeypatch.setattr(server, "single_flight", SingleFlight())
+
+    results = await asyncio.gather(
+        *(
+            server.get_secret_metadata.fn(secret_id="herd-s1", bypass_cache=True)
+            for _ in range(6)
+        )
+    )
+
+    assert calls == ["herd-s1"]
+    assert {r.name for r in results} == {"db"}
+    assert server.single_flight.stats()["coalesced"] == 5
+
+
+def test_vault_lookup_never_reads_the_metadata_cache(monkeypatch):
+    class SharedCache:
+        def peek(self, key, default=None):
+            raise AssertionError("blocking backend read on the event loop")
+
+    monkeypatch.setattr(server, "metadata_cache", SharedCache())
+    server._remember_vaults([SecretMetadata(id="s-known", vault_id="v1")])
+
+    assert server._vault_of_secret("s-known") == "v1"
+
+
+def test_unseen_secrets_count_against_the_default_vault():
+    with server.sessions.bind("session:1", VaultContext(vault_id="v-default")):
+        assert server._vault_of_secret("s-never-listed") == "v-default"
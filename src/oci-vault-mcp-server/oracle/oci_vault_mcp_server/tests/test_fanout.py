@@ -0,0 +1,69 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import pytest
+from oracle.oci_vault_mcp_server import server
+from oracle.oci_vault_mcp_server.models import RegionalSecretMetadata
+
+
+@pytest.fixture
+def tenancy(monkeypatch):
+    tree = {"c1": ["c1", "c2", "c3"]}
+    monkeypatch.setattr(server, "_subcompartments", lambda c: tree.get(c, [c]))
+    monkeypatch.setattr(
+        server.client_pool, "default_region", lambda profile=None: "us-phoenix-1"
+    )
+
+
+def test_region_is_decoded_from_ocid():
+    assert server._region_of("ocid1.vault.oc1.phx.abc") == "us-phoenix-1"
+    assert server._region_of("ocid1.vault.oc1.eu-frankfurt-1.abc") == "eu-frankfurt-1"
+    assert server._region_of("ocid1.vault.oc1..abc") is None
+
+
+def test_sources_expand_compartments_and_regions(tenancy):
+    sources = server._secret_sources(
+        ["ocid1.vault.oc1.iad.v1", "v2"],
+        ["c1", "c1"],
+        True,
+        ["us-phoenix-1", "uk-london-1"],
+    )
+
+    keys = [(s.region, s.compartment_id, s.vault_id) for s in sources]
+    assert len(keys) == len(set(keys)) == 9
+    # Vaults with a region in their OCID are only listed there
+    assert {r for r, _, v in keys if v == "ocid1.vault.oc1.iad.v1"} == {"us-ashburn-1"}
+    assert {r for r, _, v in keys if v == "v2"} == {"us-phoenix-1", "uk-london-1"}
+
+
+@pytest.mark.asyncio
+async def test_failed_sources_are_reported(tenancy, monkeypatch):
+    def list_source(source, name):
+        if source.compartment_id == "c2":
+            raise RuntimeError("NotAuthorizedOrNotFound")
+        # c1 and c3 both see s1, e.g. through an overlapping vault listing
+        return [
+            RegionalSecretMetadata(id="s1", name="db", region=source.region),
+            RegionalSecretMetadata(id=f"{source.compartment_id}-s", name="api"),
+        ]
+
+    monkeypatch.setattr(server, "_list_source_secrets", list_source)
+
+    listing = await server.list_secrets_across_vaults.fn(
+        vault_ids=None,
+        compartment_ids=["c1"],
+        include_subcompartments=True,
+        regions=None,
+        name=None,
+        max_concurrency=None,
+    )
+
+    assert listing.failed == 1
+    assert [s.id for s in listing.secrets] == ["s1", "c1-s", "c3-s"]
+    [failed] = [s for s in listing.sources if s.error]
+    assert failed.compartment_id == "c2"
+    assert failed.error == "NotAuthorizedOrNotFound"
+    assert all(s.duration_ms is not None for s in listing.sources)
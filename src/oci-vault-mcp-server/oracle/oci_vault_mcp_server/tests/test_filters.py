@@ -0,0 +1,69 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from datetime import datetime, timezone
+
+from oracle.oci_vault_mcp_server.filters import (
+    oci_filter_params,
+    secret_predicate,
+    sort_secrets,
+)
+from oracle.oci_vault_mcp_server.models import SecretFilter, SecretMetadata
+
+SECRETS = [
+    SecretMetadata(
+        id="s1",
+        name="Platform-DB",
+        lifecycle_state="ACTIVE",
+        time_created=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        last_rotation_time=datetime(2025, 3, 1, tzinfo=timezone.utc),
+        freeform_tags={"team": "platform"},
+    ),
+    SecretMetadata(
+        id="s2",
+        name="platform-api",
+        lifecycle_state="PENDING_DELETION",
+        time_created=datetime(2025, 2, 1, tzinfo=timezone.utc),
+        defined_tags={"ops": {"owner": "alice"}},
+    ),
+    SecretMetadata(id="s3", name="billing", lifecycle_state="ACTIVE"),
+]
+
+
+def matching(secret_filter, pushed_down=True):
+    where = secret_predicate(secret_filter, pushed_down)
+    return [s.id for s in SECRETS if where(s)]
+
+
+def test_only_unsupported_conditions_are_checked_locally():
+    secret_filter = SecretFilter(lifecycle_state="ACTIVE", sort_by="NAME")
+
+    assert oci_filter_params(secret_filter) == {
+        "lifecycle_state": "ACTIVE",
+        "sort_by": "NAME",
+    }
+    assert secret_predicate(secret_filter) is None
+    assert matching(secret_filter, pushed_down=False) == ["s1", "s3"]
+
+
+def test_predicates_combine():
+    assert matching(SecretFilter(name_prefix="platform")) == ["s1", "s2"]
+    assert matching(SecretFilter(tags={"team": "platform"})) == ["s1"]
+    assert matching(SecretFilter(tags={"ops.owner": None})) == ["s2"]
+    # Naive times are taken as UTC; secrets without the timestamp never match
+    assert matching(SecretFilter(created_after=datetime(2025, 1, 15))) == ["s2"]
+    assert matching(
+        SecretFilter(name_prefix="platform", rotated_after=datetime(2025, 2, 1))
+    ) == ["s1"]
+
+
+def test_sort_secrets():
+    ordered = sort_secrets(
+        SECRETS, SecretFilter(sort_by="TIMECREATED", sort_order="DESC")
+    )
+
+    assert [s.id for s in ordered] == ["s2", "s1", "s3"]
+    assert sort_secrets(SECRETS, None) is SECRETS
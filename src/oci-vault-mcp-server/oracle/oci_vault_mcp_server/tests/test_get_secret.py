@@ -0,0 +1,95 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import threading
+import uuid
+from types import SimpleNamespace
+
+import oci
+import pytest
+from oracle.oci_vault_mcp_server import server
+
+
+class FakeVaultClient:
+    """Serves one secret with ``versions`` versions, two per page."""
+
+    def __init__(self, versions=5, fail_metadata=False):
+        self.versions = versions
+        self.fail_metadata = fail_metadata
+        self.version_calls = []
+        # Both requests must be in flight at once to get past this
+        self.both_started = threading.Barrier(2, timeout=5)
+
+    def get_secret(self, secret_id):
+        self.both_started.wait()
+        if self.fail_metadata:
+            raise RuntimeError("NotAuthorizedOrNotFound")
+        return SimpleNamespace(
+            data=oci.vault.models.Secret(
+                id=secret_id, secret_name="db", vault_id="v1", lifecycle_state="ACTIVE"
+            )
+        )
+
+    def list_secret_versions(self, secret_id, page=None, limit=None):
+        if page is None:
+            self.both_started.wait()
+        self.version_calls.append((page, limit))
+        start = int(page or 0)
+        end = min(start + 2, self.versions)
+        if limit is not None:
+            end = min(end, start + limit)
+        return SimpleNamespace(
+            data=[
+                oci.vault.models.SecretVersionSummary(
+                    secret_id=secret_id, version_number=n + 1, stages=["PREVIOUS"]
+                )
+                for n in range(start, end)
+            ],
+            has_next_page=end < self.versions,
+            next_page=str(end) if end < self.versions else None,
+        )
+
+
+@pytest.fixture
+def vault(monkeypatch):
+    client = FakeVaultClient()
+    monkeypatch.setattr(server, "get_vault_client", lambda region=None: client)
+    return client
+
+
+async def get_secret(max_versions=None):
+    # A new secret per call, so nothing is served from the metadata cache
+    return await server.get_secret.fn(
+        secret_id=f"ocid1.vaultsecret.oc1..{uuid.uuid4().hex}",
+        max_versions=max_versions,
+    )
+
+
+@pytest.mark.asyncio
+async def test_metadata_and_all_version_pages_are_fetched_concurrently(vault):
+    secret = await get_secret()
+
+    assert secret.metadata.name == "db"
+    assert [v.version_number for v in secret.versions] == [1, 2, 3, 4, 5]
+    assert [page for page, _ in vault.version_calls] == [None, "2", "4"]
+    assert set(secret.timings_ms) == {"metadata", "versions", "total"}
+
+
+@pytest.mark.asyncio
+async def test_max_versions_truncates_the_versions(vault):
+    secret = await get_secret(max_versions=3)
+
+    assert [v.version_number for v in secret.versions] == [1, 2, 3]
+    # OCI is never asked for more versions than still needed
+    assert vault.version_calls == [(None, 3), ("2", 1)]
+
+
+@pytest.mark.asyncio
+async def test_failed_metadata_fetch_fails_the_call(vault):
+    vault.fail_metadata = True
+
+    with pytest.raises(RuntimeError, match="NotAuthorizedOrNotFound"):
+        await get_secret()
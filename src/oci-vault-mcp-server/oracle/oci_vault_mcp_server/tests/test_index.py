@@ -0,0 +1,116 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from datetime import datetime, timedelta
+
+from oracle.oci_vault_mcp_server.index import SecretIndex
+from oracle.oci_vault_mcp_server.models import SecretMetadata
+
+T0 = datetime(2025, 1, 1)
+
+
+def secret(n, name, **kwargs):
+    return SecretMetadata(
+        id=f"ocid1.secret.{n}",
+        name=name,
+        vault_id="vault1",
+        compartment_id="comp1",
+        time_created=T0 + timedelta(minutes=n),
+        **kwargs,
+    )
+
+
+SECRETS = [
+    secret(1, "prod-db-password", freeform_tags={"team": "platform"}),
+    secret(2, "prod-api-key", description="Payments database access"),
+    secret(3, "staging-db-password", freeform_tags={"team": "data"}),
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def build(clock=None, since=()):
+    calls = {"all": 0, "since": []}
+
+    def load_all():
+        calls["all"] += 1
+        return list(SECRETS)
+
+    def load_since(watermark):
+        calls["since"].append(watermark)
+        return list(since)
+
+    index = SecretIndex(
+        refresh_interval=10, max_staleness=100, clock=clock or FakeClock()
+    )
+    return index, calls, lambda: index.get("vault1", "comp1", load_all, load_since)
+
+
+def test_match_modes():
+    _, _, get = build()
+    vault = get()
+
+    assert [s.name for s in vault.search("db")] == [
+        "prod-db-password",
+        "staging-db-password",
+    ]
+    assert [s.name for s in vault.search("database")] == ["prod-api-key"]
+    assert [s.name for s in vault.search("staging", mode="prefix")] == [
+        "staging-db-password"
+    ]
+    assert vault.search("prod-db-pasword", mode="fuzzy")[0].name == "prod-db-password"
+    assert [s.name for s in vault.search("db", tags={"team": "platform"})] == [
+        "prod-db-password"
+    ]
+
+
+def test_refresh_is_incremental_until_staleness_bound():
+    clock = FakeClock()
+    new = secret(4, "prod-cache-password")
+    _, calls, get = build(clock, since=[new])
+
+    get()
+    clock.now = 5
+    get()
+    assert calls == {"all": 1, "since": []}
+
+    clock.now = 20
+    vault = get()
+    assert calls["since"] == [SECRETS[-1].time_created]
+    assert len(vault) == 4
+
+    clock.now = 150
+    get()
+    assert calls["all"] == 2
+
+
+def test_upsert_only_updates_the_writers_profile():
+    index = SecretIndex(refresh_interval=10, max_staleness=100, clock=FakeClock())
+    loads = []
+
+    def get(profile):
+        def load_all():
+            loads.append(profile)
+            return list(SECRETS)
+
+        return index.get(
+            "vault1", "comp1", load_all, lambda watermark: [], namespace=profile
+        )
+
+    get("team-a")
+    get("team-b")
+    index.upsert(secret(4, "team-a-token"), namespace="team-a")
+
+    assert len(get("team-a")) == 4
+    # The other profile reloads with its own credentials instead
+    assert len(get("team-b")) == 3
+    assert loads == ["team-a", "team-b", "team-b"]
@@ -0,0 +1,27 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from oracle.oci_vault_mcp_server.metrics import MetricsRegistry
+
+
+def test_render_counters_histograms_and_stats():
+    registry = MetricsRegistry()
+    registry.counter("calls_total", "Calls.")
+    registry.histogram("duration_seconds", "Duration.", buckets=(0.1, 1.0))
+    registry.register_stats("cache", lambda: {"hits": 3, "enabled": True})
+
+    registry.inc("calls_total", tool="list_secrets")
+    registry.inc("calls_total", tool="list_secrets")
+    registry.observe("duration_seconds", 0.05, tool="list_secrets")
+    registry.observe("duration_seconds", 0.5, tool="list_secrets")
+
+    text = registry.render()
+    assert 'calls_total{tool="list_secrets"} 2' in text
+    assert 'duration_seconds_bucket{tool="list_secrets",le="0.1"} 1' in text
+    assert 'duration_seconds_bucket{tool="list_secrets",le="+Inf"} 2' in text
+    assert 'duration_seconds_count{tool="list_secrets"} 2' in text
+    assert "oci_vault_cache_hits 3" in text
+    assert "oci_vault_cache_enabled" not in text
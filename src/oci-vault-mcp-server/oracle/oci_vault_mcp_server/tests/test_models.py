@@ -0,0 +1,103 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import oci
+import pytest
+from oracle.oci_vault_mcp_server.models import (
+    SecretMetadata,
+    map_secret_metadata,
+    map_secret_metadata_page,
+    map_secret_version,
+    map_secret_version_page,
+    project,
+    select_fields,
+)
+
+CREATED = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_summary(i):
+    return oci.vault.models.SecretSummary(
+        id=f"s{i}",
+        secret_name=f"secret-{i}",
+        vault_id="v1",
+        compartment_id="c1",
+        lifecycle_state="ACTIVE",
+        time_created=CREATED,
+        freeform_tags={"team": "a"},
+        rotation_config=oci.vault.models.RotationConfig(
+            rotation_interval="P30D", is_scheduled_rotation_enabled=True
+        ),
+    )
+
+
+def test_page_mapping_matches_item_mapping():
+    summaries = [make_summary(i) for i in range(3)]
+
+    page = map_secret_metadata_page(summaries)
+
+    assert [s.model_dump() for s in page] == [
+        map_secret_metadata(s).model_dump() for s in summaries
+    ]
+    assert page[0].name == "secret-0"
+    assert page[0].rotation_config["rotation_interval"] == "P30D"
+
+
+def test_page_mapping_accepts_plain_objects():
+    item = SimpleNamespace(id="s1", name="legacy", time_created=CREATED)
+
+    [mapped] = map_secret_metadata_page([item])
+
+    assert mapped.name == "legacy"
+    assert mapped.vault_id is None
+
+
+def test_falsy_values_are_kept():
+    item = SimpleNamespace(
+        id="s1", secret_name="", name="legacy", secret_version_count=0
+    )
+
+    [mapped] = map_secret_metadata_page([item])
+
+    assert mapped.name == ""
+    assert mapped.secret_version_count == 0
+    assert mapped == map_secret_metadata(item)
+
+
+def test_version_stages_are_mapped():
+    version = oci.vault.models.SecretVersionSummary(
+        version_number=2, stages=["CURRENT", "LATEST"], time_created=CREATED
+    )
+
+    assert map_secret_version(version).version_stage == ["CURRENT", "LATEST"]
+    assert map_secret_version_page([version])[0].model_dump() == (
+        map_secret_version(version).model_dump()
+    )
+
+
+def test_projection_selects_fields():
+    secrets = map_secret_metadata_page([make_summary(i) for i in range(2)])
+    fields = select_fields(SecretMetadata, ["name,id", "time_created"])
+
+    rows = project(secrets, SecretMetadata, fields)
+    table = project(secrets, SecretMetadata, fields, columnar=True)
+
+    assert rows[0] == {
+        "id": "s0",
+        "name": "secret-0",
+        "time_created": "2025-01-01T00:00:00Z",
+    }
+    assert table.columns == ["name", "id", "time_created"]
+    assert table.rows[1] == ["secret-1", "s1", "2025-01-01T00:00:00Z"]
+
+
+def test_projection_rejects_unknown_fields():
+    assert select_fields(SecretMetadata, None) is None
+    with pytest.raises(ValueError, match="secret_name"):
+        select_fields(SecretMetadata, ["id", "secret_name"])
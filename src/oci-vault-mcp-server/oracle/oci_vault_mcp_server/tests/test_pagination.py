@@ -0,0 +1,121 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from oracle.oci_vault_mcp_server.pagination import (
+    collect_pages,
+    decode_page_token,
+    encode_page_token,
+)
+
+
+def make_list_call(pages):
+    """Return a fake OCI list operation serving ``pages`` and recording calls."""
+    calls = []
+
+    def list_call(page=None, limit=None, **kwargs):
+        calls.append(page)
+        index = int(page or 0)
+        has_next = index + 1 < len(pages)
+        return SimpleNamespace(
+            data=pages[index],
+            has_next_page=has_next,
+            next_page=str(index + 1) if has_next else None,
+        )
+
+    list_call.calls = calls
+    return list_call
+
+
+def test_page_token_round_trip():
+    token = encode_page_token("abc", ("list_secrets", "vault1"))
+    assert decode_page_token(token, ("list_secrets", "vault1")) == "abc"
+    assert encode_page_token(None, ("list_secrets", "vault1")) is None
+
+
+def test_page_token_is_bound_to_query():
+    token = encode_page_token("abc", ("list_secrets", "vault1"))
+    with pytest.raises(ValueError):
+        decode_page_token(token, ("list_secrets", "vault2"))
+    with pytest.raises(ValueError):
+        decode_page_token("not-a-token", ("list_secrets", "vault1"))
+
+
+def test_collect_pages_walks_every_page():
+    list_call = make_list_call([[1, 2], [3, 4], [5]])
+    seen = []
+
+    items, next_page = collect_pages(
+        list_call, lambda x: x * 10, on_page=lambda page, total: seen.append(total)
+    )
+
+    assert items == [10, 20, 30, 40, 50]
+    assert next_page is None
+    assert seen == [2, 4, 5]
+
+
+def test_collect_pages_single_page_returns_continuation():
+    list_call = make_list_call([[1, 2], [3, 4], [5]])
+
+    items, next_page = collect_pages(list_call, lambda x: x, page="1", single_page=True)
+
+    assert items == [3, 4]
+    assert next_page == "2"
+    assert list_call.calls == ["1"]
+
+
+def test_collect_pages_truncates_to_limit():
+    list_call = make_list_call([[1, 2, 3], [4, 5, 6], [7]])
+
+    items, _ = collect_pages(list_call, lambda x: x, limit=4, page_size=3)
+
+    assert items == [1, 2, 3, 4]
+    assert list_call.calls == [None, "1"]
+
+
+def test_collect_pages_without_prefetch_matches_prefetch():
+    pages = [[1, 2], [3, 4], [5]]
+
+    prefetched, _ = collect_pages(make_list_call(pages), lambda x: x)
+    sequential, _ = collect_pages(make_list_call(pages), lambda x: x, prefetch=False)
+
+    assert prefetched == sequential == [1, 2, 3, 4, 5]
+
+
+def test_collect_pages_limit_counts_kept_items():
+    list_call = make_list_call([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+
+    items, _ = collect_pages(
+        list_call, map_item=lambda x: x, limit=2, where=lambda x: x % 2 == 0
+    )
+
+    assert items == [2, 4]
+    assert list_call.calls == [None, "1"]
+
+
+def test_collect_pages_single_page_keeps_every_match():
+    list_call = make_list_call([[1, 2, 3, 4, 5, 6], [7, 8]])
+
+    items, next_page = collect_pages(
+        list_call,
+        map_item=lambda x: x,
+        limit=2,
+        single_page=True,
+        where=lambda x: x % 2 == 0,
+    )
+    rest, _ = collect_pages(
+        list_call,
+        map_item=lambda x: x,
+        limit=2,
+        page=next_page,
+        single_page=True,
+        where=lambda x: x % 2 == 0,
+    )
+
+    # Matches past the limit on the first page are not skipped
+    assert items + rest == [2, 4, 6, 8]
@@ -0,0 +1,145 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from oracle.oci_vault_mcp_server import server
+from oracle.oci_vault_mcp_server.models import SecretMetadata
+from oracle.oci_vault_mcp_server.rotation import RotationScan, rotation_interval_days
+
+NOW = datetime(2025, 7, 1, tzinfo=timezone.utc)
+
+
+def secret(secret_id, age_days, state="ACTIVE", rotation_config=None, now=NOW):
+    return SecretMetadata(
+        id=secret_id,
+        name=secret_id,
+        lifecycle_state=state,
+        time_created=now - timedelta(days=age_days),
+        rotation_config=rotation_config,
+    )
+
+
+SCHEDULED = {"rotation_interval": "P30D", "is_scheduled_rotation_enabled": True}
+PAUSED = {"rotation_interval": "P30D", "is_scheduled_rotation_enabled": False}
+
+
+def test_rotation_interval_days():
+    assert rotation_interval_days(SCHEDULED) == 30
+    assert rotation_interval_days({**SCHEDULED, "rotation_interval": "P2W"}) == 14
+    assert rotation_interval_days(PAUSED) is None
+    assert rotation_interval_days(None) is None
+
+
+def test_scan_counts_and_ranks_overdue_secrets():
+    scan = RotationScan(NOW, max_age_days=90, top=2)
+    scan.add_page(
+        [
+            secret("fresh", 10),
+            secret("old", 200),
+            secret("ancient", 400),
+            secret("scheduled", 45, rotation_config=SCHEDULED),
+            secret("paused", 45, rotation_config=PAUSED),
+            secret("leaving", 500, state="PENDING_DELETION"),
+            SecretMetadata(id="unknown", lifecycle_state="ACTIVE"),
+        ]
+    )
+
+    report = scan.report()
+    assert report.scanned == 7
+    assert report.lifecycle_states == {"ACTIVE": 6, "PENDING_DELETION": 1}
+    assert report.pending_deletion == 1
+    assert report.unknown_age == 1
+    assert [b.secrets for b in report.age_buckets] == [1, 2, 0, 1, 1]
+    assert report.age_buckets[-1].label == "365d+"
+    assert report.rotation_configured == 2
+    assert report.scheduled_rotation_enabled == 1
+    # Scheduled rotation is judged by its own interval, the rest by max_age_days
+    assert report.overdue == 3
+    assert [f.secret_id for f in report.oldest_overdue] == ["ancient", "old"]
+
+
+def test_merged_scans_match_a_single_scan():
+    secrets = [secret(f"s{i}", i * 7) for i in range(100)]
+    single = RotationScan(NOW, top=5)
+    single.add_page(secrets)
+    left, right = RotationScan(NOW, top=5), RotationScan(NOW, top=5)
+    left.add_page(secrets[::2])
+    right.add_page(secrets[1::2])
+    left.merge(right)
+
+    assert left.report() == single.report()
+
+
+@pytest.mark.asyncio
+async def test_scan_tool_reports_partial_failures(monkeypatch):
+    sources = [
+        server.SecretSource(compartment_id="c1", vault_id="v1"),
+        server.SecretSource(compartment_id="c1", vault_id="v2"),
+    ]
+
+    def scan_source(source, scan):
+        scan.add_page([secret(f"{source.vault_id}-a", 120, now=scan.now)])
+        if source.vault_id == "v2":
+            raise RuntimeError("TooManyRequests")
+        scan.add_page([secret(f"{source.vault_id}-b", 5, now=scan.now)])
+        source.secrets = scan.scanned
+
+    def current_version_time(secret_id, region):
+        if secret_id == "v2-a":
+            raise RuntimeError("NotAuthorizedOrNotFound")
+        return NOW - timedelta(days=200)
+
+    monkeypatch.setattr(server, "_secret_sources", lambda *args: sources)
+    monkeypatch.setattr(server, "_scan_source_rotation", scan_source)
+    monkeypatch.setattr(server, "_current_version_time", current_version_time)
+
+    report = await server.scan_rotation_readiness.fn(
+        vault_ids=["v1", "v2"],
+        compartment_ids=None,
+        include_subcompartments=False,
+        regions=None,
+        max_age_days=90,
+        age_buckets=[100],
+        top=20,
+        max_concurrency=None,
+    )
+
+    assert report.scanned == 3
+    assert report.overdue == 2
+    # Only the age that could be checked is confirmed
+    assert report.possibly_overdue == 1
+    assert [b.secrets for b in report.age_buckets] == [1, 2]
+    assert report.failed == 1
+    assert [s.secrets for s in report.sources] == [2, 1]
+    assert sources[1].error == "TooManyRequests"
+
+
+def test_confirmed_ages_replace_listing_ages():
+    scan = RotationScan(NOW, max_age_days=90, buckets=[100], top=5)
+    scan.add_page([secret("rotated", 400), secret("stale", 300), secret("other", 200)])
+    scan.confirm("rotated", NOW - timedelta(days=10))
+    scan.confirm("stale", NOW - timedelta(days=250))
+
+    report = scan.report()
+    assert report.overdue == 2
+    assert report.possibly_overdue == 1
+    assert [
+        (f.secret_id, f.age_days, f.age_confirmed) for f in report.oldest_overdue
+    ] == [
+        ("stale", 250, True),
+        ("other", 200, False),
+    ]
+    assert [b.secrets for b in report.age_buckets] == [1, 2]
+
+
+def test_rotated_findings_make_room_for_the_next():
+    scan = RotationScan(NOW, max_age_days=90, top=1)
+    scan.add_page([secret("rotated", 400), secret("next", 300)])
+    scan.confirm("rotated", NOW - timedelta(days=10))
+
+    assert [f.secret_id for f in scan.report().oldest_overdue] == ["next"]
@@ -12,3 +12,26 @@ def test_import():
     from oracle.oci_vault_mcp_server import server  # noqa: F401
 
     assert True
+
+
+@pytest.mark.asyncio
+async def test_unknown_fields_fail_before_listing(monkeypatch):
+    from oracle.oci_vault_mcp_server import server
+
+    listed = []
+    monkeypatch.setattr(
+        server, "_list_secret_versions", lambda *args, **kwargs: listed.append(args)
+    )
+
+    with pytest.raises(ValueError, match="secret_name"):
+        await server.list_secret_versions.fn(
+            secret_id="ocid1.vaultsecret.oc1..s1",
+            limit=None,
+            page_token=None,
+            cursor=False,
+            stream=True,
+            fields=["version_number", "secret_name"],
+            columnar=False,
+            ctx=object(),
+        )
+    assert listed == []
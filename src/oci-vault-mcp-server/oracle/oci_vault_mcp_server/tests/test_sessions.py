@@ -0,0 +1,73 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import asyncio
+
+import pytest
+from oracle.oci_vault_mcp_server import server
+from oracle.oci_vault_mcp_server.sessions import SessionRegistry, VaultContext
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_sessions_are_isolated_and_expire():
+    clock = FakeClock()
+    registry = SessionRegistry(
+        VaultContext(vault_id="v0", compartment_id="c0"),
+        max_sessions=2,
+        idle_timeout=60,
+        clock=clock,
+    )
+    registry.configure("a", vault_id="v1")
+    registry.configure("b", vault_id="v2")
+
+    assert registry.get("b").vault_id == "v2"
+    assert registry.get("a") == VaultContext(vault_id="v1", compartment_id="c0")
+    assert registry.get("unknown").vault_id == "v0"
+
+    # "b" is the least recently used session when "c" is added
+    registry.configure("c", vault_id="v3")
+    assert registry.get("b").vault_id == "v0"
+    clock.now = 60
+    assert registry.get("a").vault_id == "v0"
+    assert registry.stats()["evictions"] == 2
+
+
+def test_only_allowed_profiles_can_be_selected():
+    registry = SessionRegistry(VaultContext(), allowed_profiles=["TEAM1"])
+
+    assert registry.configure("a", profile="TEAM1").namespace == "TEAM1"
+    with pytest.raises(PermissionError):
+        registry.configure("a", profile="ADMIN")
+
+
+@pytest.mark.asyncio
+async def test_configure_vault_only_changes_the_calling_session(monkeypatch):
+    registry = SessionRegistry(VaultContext(), allowed_profiles=["TEAM2"])
+    monkeypatch.setattr(server, "sessions", registry)
+
+    async def session(key, vault_id, profile):
+        with registry.bind(key):
+            server.configure_vault.fn(
+                vault_id=vault_id, compartment_id="c1", profile=profile, region=None
+            )
+            # Let the other session configure itself in between
+            await asyncio.sleep(0)
+            return server._resolve_vault(None, None), server._namespace()
+
+    one, two = await asyncio.gather(
+        session("session:1", "v1", None), session("session:2", "v2", "TEAM2")
+    )
+
+    assert one == (("v1", "c1"), "")
+    assert two == (("v2", "c1"), "TEAM2")
+    assert server.get_vault_config_tool.fn()["configured"] is False
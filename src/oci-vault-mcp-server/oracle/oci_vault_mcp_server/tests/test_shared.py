@@ -0,0 +1,189 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import threading
+
+import pytest
+from oracle.oci_vault_mcp_server.cache import SharedTTLCache, secret_tag, vault_tag
+from oracle.oci_vault_mcp_server.concurrency import SingleFlight
+from oracle.oci_vault_mcp_server.models import SecretMetadata, SecretVersionPage
+from oracle.oci_vault_mcp_server.shared import (
+    FileBackend,
+    RedisBackend,
+    SharedBackend,
+    metadata_codec,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class WatchedBackend(RedisBackend):
+    """Notes when this replica starts polling for another replica's result."""
+
+    def __init__(self, client):
+        super().__init__(client)
+        self.polling = threading.Event()
+
+    def get_many(self, keys):
+        if any(key.startswith("result:") for key in keys):
+            self.polling.set()
+        return super().get_many(keys)
+
+
+@pytest.fixture
+def replicas():
+    """Two backends talking to the same Redis-protocol stand-in."""
+    server = fakeredis.FakeServer()
+    return [WatchedBackend(fakeredis.FakeRedis(server=server)) for _ in range(2)]
+
+
+def test_codec_round_trips_results():
+    secrets = [SecretMetadata(id="s1", name="db"), SecretMetadata(id="s2")]
+    page = SecretVersionPage(items=[], next_page_token="t")
+
+    for value in (secrets, secrets[0], page, []):
+        assert metadata_codec.decode(metadata_codec.encode(value)) == value
+    with pytest.raises(TypeError):
+        metadata_codec.encode({"not": "a model"})
+
+
+def test_replicas_share_entries_and_invalidations(replicas):
+    one, two = (SharedTTLCache(backend, metadata_codec) for backend in replicas)
+    secrets = [SecretMetadata(id="s1", vault_id="v1")]
+    one.set(("list_secrets", "v1"), secrets, tags=[vault_tag("v1"), secret_tag("s1")])
+    one.set(
+        ("get_secret_metadata", "s2"), SecretMetadata(id="s2"), tags=[vault_tag("v2")]
+    )
+
+    assert two.get(("list_secrets", "v1")) == secrets
+
+    two.invalidate_tag(secret_tag("s1"))
+    assert one.get(("list_secrets", "v1")) is None
+    assert one.get(("get_secret_metadata", "s2")) is not None
+    one.clear()
+    assert two.get(("get_secret_metadata", "s2")) is None
+
+
+def test_file_backend_is_shared_between_instances(tmp_path):
+    clock = [1000.0]
+    path = str(tmp_path / "shared.sqlite3")
+    one = FileBackend(path, clock=lambda: clock[0])
+    two = FileBackend(path, clock=lambda: clock[0])
+
+    assert one.add("lease", b"a", ttl=10)
+    assert not two.add("lease", b"b", ttl=10)
+    assert [one.incr("n"), two.incr("n")] == [1, 2]
+    clock[0] += 10
+    assert two.get("lease") is None
+    assert two.add("lease", b"b", ttl=10)
+
+
+def test_replicas_share_one_call(replicas):
+    one, two = (
+        SingleFlight(backend=backend, codec=metadata_codec, poll_interval=0.01)
+        for backend in replicas
+    )
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def list_secrets(replica):
+        calls.append(replica)
+        started.set()
+        release.wait(5)
+        return [SecretMetadata(id="s1")]
+
+    results = {}
+    leader = threading.Thread(
+        target=lambda: results.setdefault(
+            "one", one.do(("list_secrets", "v1"), list_secrets, "one")
+        )
+    )
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(
+        target=lambda: results.setdefault(
+            "two", two.do(("list_secrets", "v1"), list_secrets, "two")
+        )
+    )
+    follower.start()
+    assert replicas[1].polling.wait(5)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert calls == ["one"]
+    assert results["one"] == results["two"] == [SecretMetadata(id="s1")]
+    assert two.stats()["remote_coalesced"] == 1
+
+
+def test_failed_leader_lets_other_replicas_run(replicas):
+    one, two = (
+        SingleFlight(backend=backend, codec=metadata_codec, poll_interval=0.01)
+        for backend in replicas
+    )
+    started, release = threading.Event(), threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("TooManyRequests")
+
+    leader = threading.Thread(
+        target=lambda: pytest.raises(RuntimeError, one.do, ("list_secrets",), failing)
+    )
+    leader.start()
+    started.wait(5)
+    release.set()
+    result = two.do(("list_secrets",), lambda: [SecretMetadata(id="s1")])
+    leader.join(5)
+
+    assert result == [SecretMetadata(id="s1")]
+
+
+def test_unreachable_backend_runs_calls_locally():
+    class DownBackend(RedisBackend):
+        def get_many(self, keys):
+            raise ConnectionError("Connection refused")
+
+    flights = SingleFlight(backend=DownBackend(None), codec=metadata_codec)
+
+    assert flights.do(("list_secrets",), lambda: []) == []
+    flights.forget()
+
+
+def test_missed_invalidation_is_retried_and_never_raises(replicas):
+    class FlakyBackend(RedisBackend):
+        down = False
+
+        def incr(self, key):
+            if self.down:
+                raise ConnectionError("Connection refused")
+            return super().incr(key)
+
+    flaky = FlakyBackend(replicas[0].client)
+    one = SharedTTLCache(flaky, metadata_codec)
+    two = SharedTTLCache(replicas[1], metadata_codec)
+    one.set(("get_secret_metadata", "s1"), SecretMetadata(id="s1"), [secret_tag("s1")])
+
+    flaky.down = True
+    one.invalidate_tag(secret_tag("s1"))
+    # This replica stops serving the entry; the others only once it is written
+    assert one.get(("get_secret_metadata", "s1")) is None
+    assert one.stats()["pending_invalidations"] == 1
+
+    flaky.down = False
+    assert one.get(("get_secret_metadata", "s1")) is None
+    assert two.get(("get_secret_metadata", "s1")) is None
+    assert one.stats()["pending_invalidations"] == 0
+
+
+def test_incomplete_backend_fails_when_built():
+    class NoCounters(SharedBackend):
+        def get_many(self, keys):
+            return [None] * len(keys)
+
+    with pytest.raises(TypeError):
+        NoCounters()
@@ -0,0 +1,71 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+from datetime import datetime, timezone
+
+from oracle.oci_vault_mcp_server.models import SecretMetadata, SecretVersion
+from oracle.oci_vault_mcp_server.snapshot import SnapshotStore
+
+CREATED = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_store(tmp_path, clock):
+    return SnapshotStore(str(tmp_path / "snapshot" / "snapshot.sqlite3"), 60, clock)
+
+
+def test_listing_survives_a_restart_once(tmp_path):
+    clock = FakeClock()
+    secrets = [
+        SecretMetadata(
+            id=f"s{i}", name=f"secret-{i}", vault_id="v1", time_created=CREATED
+        )
+        for i in range(3)
+    ]
+    make_store(tmp_path, clock).save_secrets("v1", "c1", secrets)
+
+    restarted = make_store(tmp_path, clock)
+
+    assert restarted.take_secrets("v1", "c1") == secrets
+    # Later reads go to OCI and the caches, never back to the snapshot
+    assert restarted.take_secrets("v1", "c1") is None
+    assert restarted.take_secrets("v2", "c1") is None
+    assert os.stat(restarted.path).st_mode & 0o777 == 0o600
+
+
+def test_stale_and_invalidated_entries_are_not_served(tmp_path):
+    clock = FakeClock()
+    store = make_store(tmp_path, clock)
+    store.save_secrets("v1", "c1", [SecretMetadata(id="s1", vault_id="v1")])
+    store.save_versions("s1", [SecretVersion(version_number=1)])
+    store.save_versions("s2", [SecretVersion(version_number=4)])
+
+    clock.now += 61
+    assert make_store(tmp_path, clock).take_secrets("v1", "c1") is None
+
+    clock.now -= 61
+    store.forget("s1")
+    restarted = make_store(tmp_path, clock)
+    assert restarted.take_secrets("v1", "c1") is None
+    assert restarted.take_versions("s1") is None
+    assert restarted.take_versions("s2") == [SecretVersion(version_number=4)]
+
+
+def test_disabled_store_is_a_no_op():
+    store = SnapshotStore(None)
+
+    store.save_secrets("v1", "c1", [SecretMetadata(id="s1")])
+
+    assert store.take_secrets("v1", "c1") is None
+    assert store.stats()["enabled"] is False
@@ -0,0 +1,25 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import subprocess
+import sys
+
+
+def test_server_import_defers_oci_sdk():
+    """The stdio server must be able to list tools without importing the OCI SDK."""
+    code = (
+        "import sys\n"
+        "import oracle.oci_vault_mcp_server.server\n"
+        "print(sorted(m for m in sys.modules if m == 'oci' or m.startswith('oci.')))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,119 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import oci
+import pytest
+from oracle.oci_vault_mcp_server.throttling import (
+    CallGuard,
+    CircuitBreaker,
+    CircuitOpenError,
+    GuardedClient,
+    RetryPolicy,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def service_error(status):
+    return oci.exceptions.ServiceError(status, "Error", {}, "error")
+
+
+def make_guard(clock, failure_threshold=3):
+    return CallGuard(
+        TokenBucket(0),
+        CircuitBreaker("vaults", failure_threshold, 30, clock=clock),
+        RetryPolicy(max_attempts=3, base_delay=0.1, max_delay=1),
+        sleep=clock.sleep,
+    )
+
+
+def flaky(errors, result="ok"):
+    errors = list(errors)
+
+    def call():
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    return call
+
+
+def test_bucket_limits_rate_and_adapts():
+    clock = FakeClock()
+    bucket = TokenBucket(10, burst=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.1)
+
+    bucket.on_throttled()
+    assert bucket.rate == 5
+    bucket.on_success()
+    assert bucket.rate == pytest.approx(5.1)
+
+
+def test_throttled_calls_are_retried():
+    clock = FakeClock()
+    guard = make_guard(clock)
+
+    result = guard.call("create_secret", flaky([service_error(429)]))
+
+    assert result == "ok"
+    assert guard.retries == 1
+    assert guard.throttled == 1
+    assert guard.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_server_errors_are_retried_for_reads_only():
+    clock = FakeClock()
+    guard = make_guard(clock)
+
+    assert guard.call("get_secret", flaky([service_error(503)])) == "ok"
+    with pytest.raises(oci.exceptions.ServiceError):
+        guard.call("create_secret", flaky([service_error(503)]))
+    with pytest.raises(oci.exceptions.ServiceError):
+        guard.call("get_secret", flaky([service_error(404)]))
+    assert guard.retries == 1
+
+
+def test_breaker_opens_and_recovers():
+    clock = FakeClock()
+    guard = make_guard(clock, failure_threshold=3)
+
+    with pytest.raises(oci.exceptions.ServiceError):
+        guard.call("get_secret", flaky([service_error(500)] * 3))
+    assert guard.breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        guard.call("get_secret", flaky([]))
+
+    clock.now += 30
+    assert guard.call("get_secret", flaky([])) == "ok"
+    assert guard.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_guarded_client_wraps_operations():
+    class Client:
+        endpoint = "https://vaults"
+
+        def get_secret(self, secret_id):
+            return secret_id
+
+    clock = FakeClock()
+    client = GuardedClient(Client(), make_guard(clock))
+
+    assert client.endpoint == "https://vaults"
+    assert client.get_secret("s1") == "s1"
+    assert client.get_secret.__name__ == "get_secret"
@@ -0,0 +1,380 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import functools
+import inspect
+import os
+import random
+import threading
+import time
+from logging import Logger
+from typing import Any, Callable, Optional
+
+from oracle.oci_vault_mcp_server.metrics import (
+    CIRCUIT_REJECTIONS,
+    OCI_RETRIES,
+    OCI_THROTTLES,
+    RATE_LIMIT_WAIT,
+    metrics,
+)
+
+logger = Logger(__name__, level="INFO")
+
+# Statuses worth retrying for read operations; writes only retry on 429
+_TRANSIENT_STATUSES = frozenset({500, 502, 503, 504})
+_READ_PREFIXES = ("get_", "list_")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling OCI while a circuit breaker is open."""
+
+
+def classify_error(error: Exception) -> Optional[str]:
+    """Return ``throttled``, ``server_error`` or ``connection`` for retryable errors."""
+    import oci
+
+    if isinstance(error, oci.exceptions.ServiceError):
+        if error.status == 429:
+            return "throttled"
+        if error.status in _TRANSIENT_STATUSES:
+            return "server_error"
+        return None
+    if isinstance(
+        error, (oci.exceptions.RequestException, oci.exceptions.ConnectTimeout)
+    ):
+        return "connection"
+    return None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    headers = getattr(error, "headers", None) or {}
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Adaptive token bucket.
+
+    Requests take one token; tokens refill at ``rate`` per second up to
+    ``burst``. Every 429 from OCI halves the rate (never below ``min_rate``)
+    and every successful call raises it again by 1% of ``max_rate``, so the
+    sustained request rate settles just under the service limit. A
+    ``max_rate`` of 0 disables limiting.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        burst: Optional[float] = None,
+        min_rate: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_rate = max_rate
+        self.rate = max_rate
+        self.min_rate = min(min_rate, max_rate) if max_rate > 0 else 0.0
+        self.burst = burst or max(max_rate, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_rate > 0
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until one is available; return the time waited."""
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Reserve the token now so concurrent callers queue behind us
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def on_throttled(self):
+        if self.enabled:
+            with self._lock:
+                self.rate = max(self.min_rate, self.rate / 2)
+
+    def on_success(self):
+        if self.enabled and self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 100)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive server or connection errors the
+    circuit opens and calls fail fast with :class:`CircuitOpenError`. Once
+    ``reset_timeout`` has passed a single trial call is let through; its
+    outcome closes the circuit or opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def before_call(self):
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            remaining = self.opened_at + self.reset_timeout - self._clock()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+        raise CircuitOpenError(
+            f"OCI {self.name} is failing; not retrying for another "
+            f"{max(remaining, 0):.0f}s"
+        )
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Opening circuit for OCI {self.name}")
+                self.state = self.OPEN
+                self.opened_at = self._clock()
+            self._trial_in_flight = False
+
+    def release(self):
+        """End a trial call whose outcome says nothing about service health."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, honouring ``Retry-After``."""
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 0.2,
+        max_delay: float = 10.0,
+        rng: Optional[random.Random] = None,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._random = rng or random.Random()
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        """Seconds to wait before retry number ``attempt`` (starting at 1)."""
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return self._random.uniform(0, ceiling)
+
+
+class CallGuard:
+    """Rate limits, retries and circuit-breaks calls to one OCI service."""
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        breaker: CircuitBreaker,
+        policy: RetryPolicy,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.bucket = bucket
+        self.breaker = breaker
+        self.policy = policy
+        self._sleep = sleep
+        self.retries = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def call(self, operation: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        is_write = not operation.startswith(_READ_PREFIXES)
+        attempt = 1
+        while True:
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                metrics.inc(CIRCUIT_REJECTIONS, operation=operation)
+                raise
+            waited = self.bucket.acquire()
+            if waited:
+                self.wait_seconds += waited
+                metrics.inc(RATE_LIMIT_WAIT, waited, operation=operation)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                reason = classify_error(e)
+                if reason == "throttled":
+                    self.throttled += 1
+                    metrics.inc(OCI_THROTTLES, operation=operation)
+                    self.bucket.on_throttled()
+                    self.breaker.release()
+                elif reason is not None:
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.release()
+                retryable = reason == "throttled" or (
+                    reason is not None and not is_write
+                )
+                if not retryable or attempt >= self.policy.max_attempts:
+                    raise
+                delay = self.policy.delay(attempt, e)
+                self.retries += 1
+                metrics.inc(OCI_RETRIES, operation=operation, reason=reason)
+                logger.info(
+                    f"Retrying {operation} in {delay:.2f}s after {reason} "
+                    f"(attempt {attempt}/{self.policy.max_attempts})"
+                )
+                self._sleep(delay)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            self.bucket.on_success()
+            return result
+
+
+class GuardedClient:
+    """
+    Proxy for an OCI SDK client that routes every operation through a guard.
+
+    Attributes that are not client operations are passed through unchanged.
+    """
+
+    def __init__(self, client: Any, guard: CallGuard):
+        self._client = client
+        self._guard = guard
+        self._operations: dict[str, Callable[..., Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+        if name.startswith("_") or not inspect.ismethod(attribute):
+            return attribute
+        wrapped = self._operations.get(name)
+        if wrapped is None:
+
+            @functools.wraps(attribute)
+            def wrapped(*args, **kwargs):
+                return self._guard.call(name, attribute, *args, **kwargs)
+
+            self._operations[name] = wrapped
+        return wrapped
+
+
+class GuardRegistry:
+    """
+    Shares one token bucket per (tenancy, region) between the Vaults and
+    Secrets clients, and keeps one circuit breaker per service and region.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.0,
+        burst: Optional[float] = None,
+        max_attempts: int = 5,
+        base_delay: float = 0.2,
+        max_delay: float = 10.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._guards: dict[tuple[str, str, str], CallGuard] = {}
+
+    def get(self, tenancy: str, region: str, service: str) -> CallGuard:
+        with self._lock:
+            guard = self._guards.get((tenancy, region, service))
+            if guard is None:
+                bucket = self._buckets.get((tenancy, region))
+                if bucket is None:
+                    bucket = TokenBucket(self.rate, self.burst)
+                    self._buckets[(tenancy, region)] = bucket
+                guard = CallGuard(
+                    bucket,
+                    CircuitBreaker(
+                        f"{service} in {region}",
+                        self.failure_threshold,
+                        self.reset_timeout,
+                    ),
+                    RetryPolicy(self.max_attempts, self.base_delay, self.max_delay),
+                )
+                self._guards[(tenancy, region, service)] = guard
+            return guard
+
+    def stats(self) -> dict:
+        with self._lock:
+            guards = list(self._guards.values())
+            buckets = list(self._buckets.values())
+        return {
+            "rate_limit": self.rate,
+            "current_rate_min": min((b.rate for b in buckets), default=self.rate),
+            "retries": sum(g.retries for g in guards),
+            "throttled": sum(g.throttled for g in guards),
+            "wait_seconds": sum(g.wait_seconds for g in guards),
+            "open_circuits": sum(
+                g.breaker.state != CircuitBreaker.CLOSED for g in guards
+            ),
+        }
+
+
+guards = GuardRegistry(
+    rate=float(os.getenv("OCI_VAULT_RATE_LIMIT", "0")),
+    burst=float(os.getenv("OCI_VAULT_RATE_BURST", "0")) or None,
+    max_attempts=int(os.getenv("OCI_VAULT_RETRY_MAX_ATTEMPTS", "5")),
+    base_delay=float(os.getenv("OCI_VAULT_RETRY_BASE_DELAY_SECONDS", "0.2")),
+    max_delay=float(os.getenv("OCI_VAULT_RETRY_MAX_DELAY_SECONDS", "10")),
+    failure_threshold=int(os.getenv("OCI_VAULT_BREAKER_FAILURE_THRESHOLD", "5")),
+    reset_timeout=float(os.getenv("OCI_VAULT_BREAKER_RESET_SECONDS", "30")),
+)